@@ -4,23 +4,52 @@ from __future__ import annotations
 
 import os
 import re
+import json
 import sys
 import time
+import uuid
+import signal
 import logging
+import subprocess
+import tempfile
 import threading
 from typing import Callable
 
 from deadline.client.api import get_deadline_cloud_library_telemetry_client, TelemetryClient
 from openjd.adaptor_runtime._version import version as openjd_adaptor_version
 from openjd.adaptor_runtime_client import Action
-from openjd.adaptor_runtime.process import LoggingSubprocess
+from openjd.adaptor_runtime.process import StreamLogger
 from openjd.adaptor_runtime.adaptors import Adaptor, SemanticVersion
 from openjd.adaptor_runtime.app_handlers import RegexCallback, RegexHandler
-from openjd.adaptor_runtime.application_ipc import ActionsQueue, AdaptorServer
+from openjd.adaptor_runtime.application_ipc import ActionsQueue
 from openjd.adaptor_runtime.adaptors.configuration import AdaptorConfiguration
 
 from .._version import version as adaptor_version
+from .adaptor_server import UnrealAdaptorServer
+from .asset_registry_cache import get_cache_directory, restore_cache, save_cache
+from .client_bundle import get_client_bundle
 from .common import DataValidation, add_module_to_pythonpath
+from .derived_data_cache import (
+    LOCAL_DDC_PATH_ENV_VAR,
+    DerivedDataCacheLock,
+    evict_least_recently_written,
+    get_fill_fingerprint,
+    get_fill_marker_path,
+    write_fill_marker,
+)
+from .instance_pool import UnrealInstancePool
+from .launch_profile import apply_environment, get_exec_cmds, get_launch_args
+from .log_matcher import UnrealLogDispatcher
+from .phase_profiler import PhaseProfiler
+from .progress_estimator import ProgressEstimator
+from .process_tree import (
+    ProcessGroup,
+    get_process_tree_rss,
+    set_process_affinity,
+    set_process_priority,
+)
+from .watchdog import ProgressWatchdog
+from ..UnrealClient import step_events
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +60,197 @@ class UnrealNotRunningError(Exception):
     pass
 
 
-class UnrealSubprocessWithLogs(LoggingSubprocess): ...
+class UnrealStalledError(TimeoutError):
+    """Error that is raised when Unreal makes no progress for longer than the stall timeout"""
+
+    pass
+
+
+class UnrealRunCanceledError(Exception):
+    """Error that is raised when the run is canceled, Unreal is not relaunched for it"""
+
+    pass
+
+
+class UnrealSubprocessWithLogs:
+    """
+    Unreal process whose stdout and stderr lines are sent to the logger and the given log handlers,
+    like the LoggingSubprocess of the adaptor runtime. Calls the given callback as soon as
+    the process exits, so the adaptor does not need to poll the process state.
+
+    Unreal is launched in its own process group, see :class:`ProcessGroup`: the processes it starts
+    (ShaderCompileWorker, CrashReportClient) are killed when it exits, terminated or crashed,
+    so they don't keep the node busy while the next task starts.
+    """
+
+    _OUTPUT_READ_TIMEOUT_SECONDS = 5
+    # Registered by the adaptor runtime, the runtime logs the process output at these levels
+    _STDOUT_LEVEL = logging.getLevelName("STDOUT")
+    _STDERR_LEVEL = logging.getLevelName("STDERR")
+
+    def __init__(
+        self,
+        *,
+        args: list[str],
+        startup_directory: str | None = None,
+        stdout_handler: RegexHandler | None = None,
+        stderr_handler: RegexHandler | None = None,
+        on_exit: Callable[[], None] | None = None,
+        encoding: str = "utf-8",
+    ) -> None:
+        """
+        :param args: Command line of the process
+        :param startup_directory: Working directory of the process, the current one if None
+        :param stdout_handler: Handler of the stdout lines
+        :param stderr_handler: Handler of the stderr lines
+        :param on_exit: Called once the process exited and its last output lines are handled
+        :param encoding: Encoding of the process output
+        """
+        logger.info("Running command: %s", subprocess.list2cmdline(args))
+        self.process_group = ProcessGroup()
+        self._process = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding=encoding,
+            cwd=startup_directory,
+            **self.process_group.get_popen_kwargs(),
+        )
+        self.process_group.attach(self._process.pid)
+        if self._process.stdout is None or self._process.stderr is None:  # pragma: no cover
+            raise RuntimeError("Unreal output not piped")
+
+        self._on_exit = on_exit
+        self._log_handlers = {
+            handler for handler in (stdout_handler, stderr_handler) if handler is not None
+        }
+        # Unique to the process, so the handlers of the previous Unreal processes don't get its lines
+        logger_prefix = uuid.uuid4().hex
+        self._output_readers = [
+            StreamLogger(
+                name="UnrealStdoutLogger",
+                stream=self._process.stdout,
+                loggers=self._get_loggers(f"stdout-{logger_prefix}", stdout_handler),
+                level=self._STDOUT_LEVEL,
+            ),
+            StreamLogger(
+                name="UnrealStderrLogger",
+                stream=self._process.stderr,
+                loggers=self._get_loggers(f"stderr-{logger_prefix}", stderr_handler),
+                level=self._STDERR_LEVEL,
+            ),
+        ]
+        for output_reader in self._output_readers:
+            output_reader.start()
+
+        self._exit_watcher = threading.Thread(
+            target=self._watch_exit, name="UnrealExitWatcherThread", daemon=True
+        )
+        self._exit_watcher.start()
+
+    @staticmethod
+    def _get_loggers(name: str, handler: RegexHandler | None) -> list[logging.Logger]:
+        """
+        Returns the loggers of an output stream: the adaptor logger and the one of the handler
+        """
+        if handler is None:
+            return [logger]
+        handler_logger = logging.getLogger(name)
+        handler_logger.setLevel(1)
+        handler_logger.addHandler(handler)
+        return [logger, handler_logger]
+
+    @property
+    def pid(self) -> int:
+        """ID of the Unreal process"""
+        return self._process.pid
+
+    @property
+    def returncode(self) -> int | None:
+        """Exit code of the Unreal process, None if it's running"""
+        return self._process.poll()
+
+    @property
+    def is_running(self) -> bool:
+        """True if the Unreal process is running"""
+        return self._process.poll() is None
+
+    def _watch_exit(self) -> None:
+        """
+        Blocks until the Unreal process exits and calls the on_exit callback
+        once the last output lines are handled
+        """
+        self._process.wait()
+
+        # The helper processes inherited the Unreal output pipes, the output threads
+        # would wait for them to exit
+        if self.process_group.kill():
+            logger.info(f"Killed the processes left by Unreal (pid={self.pid})")
+
+        # Lines printed right before the exit (errors, completion) must be handled
+        # before the adaptor learns that Unreal exited
+        for output_reader in self._output_readers:
+            output_reader.join(timeout=self._OUTPUT_READ_TIMEOUT_SECONDS)
+        for handler in self._log_handlers:
+            handler.close()
+
+        if self._on_exit is not None:
+            self._on_exit()
+
+    def terminate(self, grace_time_s: float = 60) -> None:
+        """
+        Terminates Unreal, the processes it started are killed once it exited
+
+        :param grace_time_s: Time Unreal has to exit after the termination signal before it's killed
+        """
+        if not self.is_running:
+            return
+
+        if grace_time_s > 0:
+            # The process group created on Windows receives CTRL_BREAK_EVENT
+            termination_signal = getattr(signal, "CTRL_BREAK_EVENT", signal.SIGTERM)
+            logger.info(f"Terminating Unreal (pid={self.pid}), waiting {grace_time_s} seconds")
+            self._process.send_signal(termination_signal)
+            try:
+                self._process.wait(timeout=grace_time_s)
+            except subprocess.TimeoutExpired:
+                logger.info(f"Unreal (pid={self.pid}) did not exit in time, killing it")
+        if self.is_running:
+            self._process.kill()
+        self.wait_for_exit()
+
+    def wait(self) -> None:
+        """
+        Closes the input of Unreal and blocks until it exits and its last output lines are handled
+        """
+        if self._process.stdin is not None and not self._process.stdin.closed:
+            self._process.stdin.close()
+        self.wait_for_exit()
+
+    def wait_for_exit(self, timeout: float | None = None) -> None:
+        """
+        Blocks until the Unreal process exits and its last output lines are handled
+
+        :param timeout: Maximum time to wait in seconds, no limit if None
+        """
+        self._exit_watcher.join(timeout=timeout)
+
+
+class UnrealActionsQueue(ActionsQueue):
+    """
+    ActionsQueue that calls the given callback every time the UnrealClient takes an action
+    """
+
+    def __init__(self, on_dequeue: Callable[[], None]) -> None:
+        super().__init__()
+        self._on_dequeue = on_dequeue
+
+    def dequeue_action(self) -> Action | None:
+        action = super().dequeue_action()
+        if action is not None:
+            self._on_dequeue()
+        return action
 
 
 class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
@@ -39,18 +258,53 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
     Adaptor that creates a session in Unreal to Render interactively.
     """
 
-    _SERVER_START_TIMEOUT_SECONDS = 30
     _SERVER_END_TIMEOUT_SECONDS = 30
     _UNREAL_START_TIMEOUT_SECONDS = 86400
     _UNREAL_END_TIMEOUT_SECONDS = 30
-
-    _server: AdaptorServer | None = None
+    _FAST_EXIT_TIMEOUT_SECONDS = 10
+    _WAIT_RESULT_INTERVAL_SECONDS = 1
+    _DEFAULT_CRASH_RETRIES = 1
+    # Maximum time without any Unreal output or progress during the startup and during a run,
+    # overridden by the init_data. 0 never stalls: the run stall detection is opt-in,
+    # a custom script may work longer than any default without reporting progress.
+    _DEFAULT_STARTUP_STALL_TIMEOUT_SECONDS = 1800
+    _DEFAULT_RUN_STALL_TIMEOUT_SECONDS = 0
+    _WATCHDOG_INTERVAL_SECONDS = 1
+    # The worker status is updated when the progress changed by this many percent,
+    # or changed at all after this many seconds
+    _PROGRESS_MIN_STEP = 1.0
+    _PROGRESS_MIN_INTERVAL_SECONDS = 10
+
+    _UNREAL_LOG_ARGS = [
+        "-log",
+        "-unattended",
+        "-stdout",
+        "-NoLoadingScreen",
+        "-NoScreenMessages",
+        "-RenderOffscreen",
+        "-allowstdoutlogverbosity",
+    ]
+    # MRQ command line executor rendering the run data in game mode,
+    # see deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_game_render_executor
+    _GAME_RENDER_ARGS = [
+        "-game",
+        "-windowed",
+        "-MoviePipelineLocalExecutorClass="
+        "/Script/MovieRenderPipelineCore.MoviePipelinePythonHostExecutor",
+        "-ExecutorPythonClass=/Engine/PythonTypes.RemoteRenderMoviePipelineGameExecutor",
+    ]
+
+    # The socket path and the PYTHONPATH are passed to Unreal with the adaptor environment,
+    # so the instances of the pool launch their Unreal one at a time
+    _LAUNCH_LOCK = threading.Lock()
+
+    _server: UnrealAdaptorServer | None = None
 
     _server_thread: threading.Thread | None = None
 
     _unreal_client: UnrealSubprocessWithLogs | None = None
 
-    _action_queue = ActionsQueue()
+    _unreal_log_handler: UnrealLogDispatcher | None = None
 
     _is_rendering: bool = False
 
@@ -60,11 +314,62 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
 
     _telemetry_client: TelemetryClient | None = None
 
+    _instance_pool: UnrealInstancePool | None = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.data_validation = DataValidation()
 
+        # Notified by the server thread, the stdout handlers and the Unreal exit watcher
+        # every time the state the adaptor may wait for changes.
+        self._unreal_state_changed = threading.Condition()
+
+        # Every adaptor instance owns its own queue: in daemon mode the same instance serves
+        # all the runs of the session, so nothing must leak from another adaptor instance.
+        self._action_queue = UnrealActionsQueue(on_dequeue=self._handle_action_dequeued)
+
+        # Phases of the session and its tasks, reported at the end of on_start, on_run and on_cleanup
+        self._profiler = PhaseProfiler()
+
+        # Set by the first step event the UnrealClient sends, from then on the progress is
+        # reported with the events and the log lines are only a fallback
+        self._unreal_events_received = False
+
+        # Progress of the current run, reported by the log and the event threads. The worker status
+        # is updated when the progress changed enough, with the throughput and the ETA of the run.
+        self._progress_lock = threading.Lock()
+        self._progress_coalescer = step_events.ProgressCoalescer(
+            min_step=self._PROGRESS_MIN_STEP, min_interval=self._PROGRESS_MIN_INTERVAL_SECONDS
+        )
+        self._progress_estimator = ProgressEstimator()
+
+        # Resident set size of the Unreal process tree sampled before the first run of the
+        # current Unreal, and the number of runs it has served, see _get_recycle_reason()
+        self._memory_baseline: int | None = None
+        self._unreal_runs_count = 0
+
+        # Node cache directory of the asset registry of the project, see _restore_asset_registry_cache()
+        self._asset_registry_cache_directory: str | None = None
+        self._asset_registry_cache_restored = False
+
+        # Set by the DDC fill environment, the adaptor fills the DDC and doesn't launch Unreal
+        self._ddc_fill_mode = False
+
+        # Set by the UnrealClient once it flushed its outputs for the fast teardown, see _close_unreal()
+        self._unreal_exit_ready = False
+
+        # Unreal renders with -game and the MRQ command line executor instead of the editor,
+        # launched by every run, see _run_game()
+        self._game_render_mode = False
+
+        # Set by on_cancel(), the terminated Unreal must not be taken for a crash and relaunched
+        self._canceled = False
+
+        self._watchdog = ProgressWatchdog(
+            get_pid=lambda: self._unreal_client.pid if self._unreal_is_running else None  # type: ignore
+        )
+
     @property
     def integration_data_interface_version(self) -> SemanticVersion:
         return SemanticVersion(major=0, minor=1)
@@ -75,6 +380,49 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         timeout_time = time.time() + timeout
         return lambda: time.time() < timeout_time
 
+    def _handle_action_dequeued(self) -> None:
+        """
+        Callback of the action queue for every action the UnrealClient takes
+        """
+        # The UnrealClient takes its first action once the editor has booted
+        self._profiler.end("editor_boot")
+        self._notify_unreal_state_changed()
+
+    def _report_phases(self, scope: str) -> None:
+        """
+        Logs the timing report of the phases since the previous report and sends it as a
+        telemetry event
+
+        :param scope: Scope of the report: "start", "task" or "cleanup"
+        """
+        report = self._profiler.report(scope)
+        logger.info(f"Unreal adaptor {scope} timings: {json.dumps(report)}")
+        self._get_deadline_telemetry_client().record_event(
+            event_type=f"com.amazon.rum.deadline.adaptor.runtime.{scope}", event_details=report
+        )
+
+    def _notify_unreal_state_changed(self) -> None:
+        """
+        Wakes up every thread waiting in
+        :meth:`deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._wait_for_unreal_state`
+        """
+        with self._unreal_state_changed:
+            self._unreal_state_changed.notify_all()
+
+    def _wait_for_unreal_state(self, predicate: Callable[[], bool], timeout: float) -> bool:
+        """
+        Blocks until the given predicate is True or the timeout is reached. The predicate is
+        checked again every time the Unreal state changes, so the waiter is woken up immediately.
+
+        :param predicate: Callable that returns True when the expected state is reached
+        :param timeout: Maximum time to wait in seconds
+
+        :return: The last value of the predicate
+        :rtype: bool
+        """
+        with self._unreal_state_changed:
+            return self._unreal_state_changed.wait_for(predicate, timeout=timeout)
+
     @property
     def _has_exception(self) -> bool:
         """Property which checks the private _exc_info property for an exception
@@ -133,51 +481,37 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
             f"following directories: {sys.path[1:]}"
         )
 
-    def _wait_for_adaptor_server_socket(self) -> str:
-        """
-        Performs a busy wait for the socket path that the adaptor server is running on, then
-        returns it.
-
-        :raises RuntimeError: If the server does not finish initializing
-
-        :return: The socket path the adaptor server is running on.
-        :rtype: str
-        """
-        is_not_timed_out = self.get_timer(self._SERVER_START_TIMEOUT_SECONDS)
-
-        while (self._server is None or self._server.server_path is None) and is_not_timed_out():
-            time.sleep(0.01)
-
-        if self._server is not None and self._server.server_path is not None:
-            return self._server.server_path
-
-        raise RuntimeError(
-            "Could not find a socket path because the server did not finish initializing"
-        )
-
     def _wait_for_unreal_started(self):
         """
-        Performs a busy wait for the starting of the Unreal Engine with the UnrealClient script
+        Waits for the starting of the Unreal Engine with the UnrealClient script
 
         :raises RuntimeError: Raised when the UnrealClient encountered an error during initialization
         :raises TimeoutError: Raised when the UnrealClient doesn't complete the initial actions before timeout reached
         """
         is_not_timed_out = self.get_timer(self._UNREAL_START_TIMEOUT_SECONDS)
-        while (
-            self._unreal_is_running
-            and not self._has_exception
-            and len(self._action_queue)
-            > 0  # for now the initializing actions in the action queue, defined by
-            # _populate_action_queue() method.
-            # So we wait for them to be done or for time is out.
-            and is_not_timed_out()
-        ):
-            time.sleep(0.1)
-
-        self._get_deadline_telemetry_client().record_event(
-            event_type="com.amazon.rum.deadline.adaptor.runtime.start", event_details={}
+        self._watchdog.start(
+            "startup",
+            self.init_data.get(
+                "startup_stall_timeout_seconds", self._DEFAULT_STARTUP_STALL_TIMEOUT_SECONDS
+            ),
         )
 
+        # for now the initializing actions in the action queue, defined by
+        # _populate_action_queue() method.
+        # So we wait for them to be done, for an error, for Unreal exit, for time is out
+        # or for the Unreal output to stall.
+        while not self._wait_for_unreal_state(
+            lambda: not self._unreal_is_running
+            or self._exc_info is not None
+            or len(self._action_queue) == 0,
+            timeout=self._WATCHDOG_INTERVAL_SECONDS,
+        ):
+            if not is_not_timed_out():
+                break
+            self._check_watchdog()
+        # Raises the error caught by the stdout handlers, if any
+        self._has_exception
+
         if len(self._action_queue) > 0:  # if for some reason, all the actions are not complete
             if is_not_timed_out():  # and timeout is not reached
                 raise RuntimeError(  # <- we catch some exception - self._has_exception is True
@@ -189,26 +523,59 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
                     f"{self._UNREAL_START_TIMEOUT_SECONDS} seconds and failed to start."
                 )
 
-    def _start_unreal_server(self) -> None:
+    def _check_watchdog(self) -> None:
         """
-        Starts a server with the given ActionsQueue, attaches the server to the adaptor and serves
-        forever in a blocking call.
+        Fails fast if Unreal made no progress for longer than the stall timeout of the current phase:
+        logs the diagnostics and terminates Unreal, so the worker is free for the next task.
+        Any Unreal output line is a progress, e.g. the shader compilation and map load logs
+        before the first frame.
+
+        :raises UnrealStalledError: If the current phase is stalled
         """
-        self._server = AdaptorServer(self._action_queue, self)
-        self._server.serve_forever()
+        if self._unreal_log_handler is not None and self._unreal_log_handler.last_line_time:
+            self._watchdog.progress(at=self._unreal_log_handler.last_line_time)
+        if not self._watchdog.check():
+            return
+
+        diagnostics = self._watchdog.diagnostics(
+            self._unreal_log_handler.recent_lines if self._unreal_log_handler else []
+        )
+        logger.error(diagnostics)
+        self._get_deadline_telemetry_client().record_error(
+            {
+                "exception_scope": f"{self._watchdog.phase}_stall",
+                "stalled_seconds": int(self._watchdog.stalled_seconds),
+            },
+            str(UnrealStalledError),
+        )
+
+        if self._unreal_is_running and self._unreal_client:
+            self._unreal_client.terminate(grace_time_s=0)
+
+        raise UnrealStalledError(
+            f"Unreal made no {self._watchdog.phase} progress for "
+            f"{self._watchdog.stalled_seconds:.0f} seconds and was terminated. "
+            "See the diagnostics in the log."
+        )
 
     def _start_unreal_server_thread(self) -> None:
         """
-        Starts the unreal adaptor server in a thread.
-        Sets the environment variable "UNREAL_ADAPTOR_SOCKET_PATH" to the socket the server is running
-        on after the server has finished starting.
+        Creates the unreal adaptor server with the ActionsQueue and serves it in a thread.
+        Sets the environment variable "UNREAL_ADAPTOR_SOCKET_PATH" to the socket the server is running on.
+
+        The socket path is allocated when the server is created: the POSIX server binds and listens
+        on its socket and the Windows server generates its pipe name. So Unreal can be launched
+        right away, the UnrealClient requests wait for the server thread to serve them.
         """
+        self._server = UnrealAdaptorServer(
+            self._action_queue, self, on_event=self._handle_unreal_event
+        )
+        os.environ["UNREAL_ADAPTOR_SOCKET_PATH"] = self._server.server_path
 
         self._server_thread = threading.Thread(
-            target=self._start_unreal_server, name="UnrealAdaptorServerThread"
+            target=self._server.serve_forever, name="UnrealAdaptorServerThread"
         )
         self._server_thread.start()
-        os.environ["UNREAL_ADAPTOR_SOCKET_PATH"] = self._wait_for_adaptor_server_socket()
 
     def _get_regex_callbacks(self) -> list[RegexCallback]:
         """
@@ -245,7 +612,13 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         :param match: re.Match object from the regex pattern that was matched the message
         :type match: re.Match
         """
+        # Completed by the complete event. The log dispatcher may deliver the line of the previous
+        # run after the next run started rendering, so the line must not complete that run
+        if self._unreal_events_received:
+            return
+
         self._unreal_is_rendering = False
+        self._notify_unreal_state_changed()
         self.update_status(progress=100)
 
     def _handle_progress(self, match: re.Match) -> None:
@@ -255,8 +628,73 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         :param match: re.Match object from the regex pattern that was matched the message
         :type match: re.Match
         """
-        progress = int(float(match.groups()[0]))
-        self.update_status(progress=progress)
+        self._watchdog.progress()
+
+        # Reported by the progress events
+        if self._unreal_events_received:
+            return
+
+        self._report_progress(float(match.groups()[0]))
+
+    def _report_progress(self, progress: float, frames_done: int | None = None) -> None:
+        """
+        Reports the progress of the run to the worker with its throughput and ETA,
+        if it changed enough since the last report
+
+        :param progress: Progress of the run in percent
+        :param frames_done: Number of output frames rendered, None if it's unknown
+        """
+        with self._progress_lock:
+            self._progress_estimator.update(progress, frames_done)
+            if not self._progress_coalescer.should_report(progress):
+                return
+            status_message = self._progress_estimator.get_status_message()
+        self.update_status(progress=int(progress), status_message=status_message)
+
+    def _reset_progress(self, handler: str | None = "render") -> None:
+        """
+        Starts reporting the progress of a new run
+
+        :param handler: Step handler of the run, the status of the other handlers than "render"
+            doesn't tell it renders
+        """
+        with self._progress_lock:
+            self._progress_coalescer.reset()
+            self._progress_estimator.reset("Rendering" if handler == "render" else "Running")
+
+    def _handle_unreal_event(self, name: str, args: dict) -> None:
+        """
+        Callback for the step events the UnrealClient sends to the adaptor server.
+        See :mod:`deadline.unreal_adaptor.UnrealClient.step_handlers.step_events`
+
+        :param name: Event name
+        :param args: Event arguments
+        """
+        self._unreal_events_received = True
+        self._watchdog.progress()
+
+        if name == step_events.PROGRESS:
+            self._report_progress(float(args["progress"]))
+        elif name == step_events.FRAME_DONE:
+            # Output frames, the throughput is counted in the frames the render writes
+            progress = min(int(args["frame"]) * 100 / max(int(args["total"]), 1), 100)
+            self._report_progress(progress, frames_done=int(args["frame"]))
+        elif name == step_events.COMPLETE:
+            if not self._is_rendering:
+                return
+            self._unreal_is_rendering = False
+            self._notify_unreal_state_changed()
+            self.update_status(progress=100)
+        elif name == step_events.ERROR:
+            self._exc_info = RuntimeError(f"Unreal Encountered an Error: {args.get('message')}")
+            self._notify_unreal_state_changed()
+        elif name == step_events.PHASE:
+            self._profiler.record(args["phase"], float(args["duration"]))
+        elif name == step_events.EXIT_READY:
+            self._unreal_exit_ready = True
+            self._notify_unreal_state_changed()
+        elif name != step_events.STARTED:
+            logger.warning(f"Unknown Unreal event: {name} {args}")
 
     def _handle_error(self, match: re.Match) -> None:
         """
@@ -267,7 +705,9 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
 
         :raises RuntimeError: Always raises a runtime error to halt the adaptor.
         """
-        self._exc_info = RuntimeError(f"Unreal Encountered an Error: {match.group(0)}")
+        # Patterns are matched from the error marker, report the whole line
+        self._exc_info = RuntimeError(f"Unreal Encountered an Error: {match.string}")
+        self._notify_unreal_state_changed()
 
     def _start_unreal_client(self) -> None:
         """
@@ -281,33 +721,179 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         unreal_exe = "UnrealEditor-Cmd"
         unreal_project_path = self.init_data.get("project_path", "")
         client_path = self.unreal_client_path.replace("\\", "/")
-        log_args = [
-            "-log",
-            "-unattended",
-            "-stdout",
-            "-NoLoadingScreen",
-            "-NoScreenMessages",
-            "-RenderOffscreen",
-            "-allowstdoutlogverbosity",
-        ]
+
+        launch_profile = self.init_data.get("launch_profile", {})
 
         args = [unreal_exe, unreal_project_path]
-        args.extend(log_args)
-        args.append(f"-execcmds=r.HLOD 0,py {client_path}")
+        args.extend(self._UNREAL_LOG_ARGS)
+        args.extend(get_launch_args(launch_profile))
+        exec_cmds = ["r.HLOD 0", *get_exec_cmds(launch_profile), f"py {client_path}"]
+        args.append(f"-execcmds={','.join(exec_cmds)}")
+
+        # Ended by the first action the UnrealClient takes
+        self._profiler.start("editor_boot")
+        self._launch_unreal_process(args)
 
-        regexhandler = RegexHandler(self._get_regex_callbacks())
+    def _launch_unreal_process(self, args: list[str]) -> None:
+        """
+        Launches the Unreal process with the log handler of the adaptor
+
+        :param args: Unreal command line
+        """
+        apply_environment(self.init_data.get("launch_profile", {}))
+
+        # Shaders and cooked data built by the previous sessions on this node are reused
+        ddc_path = self._get_ddc_path()
+        if ddc_path is not None:
+            os.environ[LOCAL_DDC_PATH_ENV_VAR] = ddc_path
+
+        # Callbacks run on the dispatcher thread, so Unreal never waits for them to write its logs
+        regexhandler = UnrealLogDispatcher(
+            self._get_regex_callbacks(), coalescible_callbacks=[self._handle_progress]
+        )
+        self._unreal_log_handler = regexhandler
         self._unreal_client = UnrealSubprocessWithLogs(
             args=args,
             stdout_handler=regexhandler,
             stderr_handler=regexhandler,
+            on_exit=self._notify_unreal_state_changed,
         )
+        self._apply_launch_profile_scheduling()
+
+    def _apply_launch_profile_scheduling(self) -> None:
+        """
+        Pins the launched Unreal process to the CPUs and sets its priority
+        from the "launch_profile" of the init_data.
+        Set right after the launch, so the threads and the shader compile workers inherit them.
+        """
+        if self._unreal_client is None:
+            return
+        launch_profile = self.init_data.get("launch_profile", {})
+
+        cpu_affinity = launch_profile.get("cpu_affinity")
+        if cpu_affinity and not set_process_affinity(self._unreal_client.pid, cpu_affinity):
+            logger.warning(f"Failed to pin Unreal to the CPUs {cpu_affinity}")
+
+        priority = launch_profile.get("priority")
+        if priority and not set_process_priority(self._unreal_client.pid, priority):
+            logger.warning(f"Failed to set the {priority} priority of Unreal")
+
+    def _get_ddc_path(self) -> str | None:
+        """
+        Returns the node-local Derived Data Cache directory set by the "ddc_path" of the init_data
+
+        :return: Absolute path to the DDC directory or None if Unreal uses its default DDC
+        :rtype: str | None
+        """
+        ddc_path = self.init_data.get("ddc_path")
+        if not ddc_path:
+            return None
+        return os.path.abspath(os.path.expandvars(os.path.expanduser(ddc_path)))
+
+    def _fill_ddc(self) -> None:
+        """
+        Fills the node-local DDC for the project with the DerivedDataCache commandlet,
+        once per node: the workers of the node wait for the fill in progress and skip the fill
+        once the DDC is filled for the project content and the engine version.
+
+        :raises RuntimeError: If the DerivedDataCache commandlet failed
+        """
+        ddc_path = self._get_ddc_path()
+        if ddc_path is None:
+            logger.info("No DDC path in the init data, skipping the DDC fill")
+            return
+
+        unreal_project_path = self.init_data.get("project_path", "")
+        launch_profile = self.init_data.get("launch_profile", {})
+        with self._LAUNCH_LOCK:
+            # The launch profile environment may put another engine on the PATH
+            apply_environment(launch_profile)
+            fingerprint = get_fill_fingerprint(unreal_project_path, "UnrealEditor-Cmd")
+        marker_path = get_fill_marker_path(ddc_path, unreal_project_path, fingerprint)
+
+        with DerivedDataCacheLock(ddc_path):
+            if os.path.exists(marker_path):
+                logger.info(f"DDC {ddc_path} is already filled for {unreal_project_path}")
+                return
+
+            self.update_status(progress=0, status_message="Filling Unreal Derived Data Cache")
+            # The other launches wait for the fill only while it is launched, not while it runs
+            with self._LAUNCH_LOCK:
+                apply_environment(launch_profile)
+                os.environ[LOCAL_DDC_PATH_ENV_VAR] = ddc_path
+                self._unreal_client = UnrealSubprocessWithLogs(
+                    args=[
+                        "UnrealEditor-Cmd",
+                        unreal_project_path,
+                        "-run=DerivedDataCache",
+                        "-fill",
+                        "-unattended",
+                        "-stdout",
+                        "-allowstdoutlogverbosity",
+                        *get_launch_args(launch_profile),
+                    ],
+                    on_exit=self._notify_unreal_state_changed,
+                )
+            self._apply_launch_profile_scheduling()
+            self._unreal_client.wait()
+
+            exit_code = self._unreal_client.returncode
+            if exit_code != 0:
+                raise RuntimeError(
+                    f"Unreal failed to fill the DDC {ddc_path}. Exit code {exit_code}"
+                )
+            write_fill_marker(ddc_path, unreal_project_path, fingerprint)
+            logger.info(f"Filled the DDC {ddc_path} for {unreal_project_path}")
+
+    def _evict_ddc(self) -> None:
+        """
+        Deletes the least recently written files of the node-local DDC while it is larger than
+        the "ddc_max_size_mb" of the init_data. Skipped while another worker of the node holds
+        the DDC lock, the eviction runs again at the end of its session.
+        """
+        ddc_path = self._get_ddc_path()
+        max_size_mb = self.init_data.get("ddc_max_size_mb")
+        if ddc_path is None or not max_size_mb:
+            return
+
+        lock = DerivedDataCacheLock(ddc_path)
+        if not lock.acquire(blocking=False):
+            logger.info(f"DDC {ddc_path} is locked by another worker, skipping the eviction")
+            return
+        try:
+            evicted_count, evicted_size = evict_least_recently_written(
+                ddc_path, int(max_size_mb * 1024 * 1024)
+            )
+        finally:
+            lock.release()
+        if evicted_count:
+            logger.info(
+                f"Evicted {evicted_count} least recently written file(s), "
+                f"{evicted_size / 1024 / 1024:.0f} MB, from the DDC {ddc_path}"
+            )
 
     def _populate_action_queue(self) -> None:
         """
         Populates the adaptor server's action queue with actions from the init_data that the Unreal
         Client will request and perform.
         """
-        pass
+        # The asset registry is warmed once with the paths the job references, so the runs don't
+        # wait for the full scan of the project. Without them, the first run waits for the scan.
+        if "asset_registry_paths" in self.init_data:
+            self._action_queue.enqueue_action(
+                Action("warm_asset_registry", {"paths": self.init_data["asset_registry_paths"]})
+            )
+
+        # Unreal loads the map and the level sequence while the worker waits for the first task,
+        # the runs rendering the same map reuse the loaded editor world
+        preload_args = {
+            key: self.init_data[key]
+            for key in ("level_path", "level_sequence_path")
+            if self.init_data.get(key)
+        }
+        if preload_args:
+            self._action_queue.enqueue_action(Action("preload", preload_args))
+
         # Set up all pathmapping rules
         # self._action_queue.enqueue_action(
         #     Action(
@@ -346,19 +932,93 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
             TimeoutError: If Unreal did not complete initialization actions due to timing out.
             FileNotFoundError: If the unreal_client.py file could not be found.
         """
+        try:
+            self._start()
+        finally:
+            self._report_phases("start")
 
+    def _start(self) -> None:
+        """
+        Validates the init_data and starts Unreal, see :meth:`on_start`
+        """
         self.data_validation.validate_init_data(self.init_data)
 
+        # The DDC fill environment always passes "ddc_fill", so the fill can be turned off
+        # with the job parameter, and never launches the editor
+        self._ddc_fill_mode = "ddc_fill" in self.init_data
+        if self._ddc_fill_mode:
+            if self.init_data["ddc_fill"]:
+                with self._profiler.phase("ddc_fill"):
+                    self._fill_ddc()
+            return
+
         # Notify worker agent about starting Unreal
         self.update_status(progress=0, status_message="Initializing Unreal Engine")
 
-        # Starts the unreal adaptor server
-        self._start_unreal_server_thread()
+        instance_count = self.init_data.get("instance_count", 1)
+        if instance_count > 1:
+            self._instance_pool = UnrealInstancePool(
+                self._create_instance, instance_count, self.update_status
+            )
+            self._instance_pool.start()
+            return
+
+        # Unreal is launched by every run in game mode
+        self._game_render_mode = self.init_data.get("render_mode", "editor") == "game"
+        if self._game_render_mode:
+            with self._profiler.phase("python_path"):
+                self._add_client_to_pythonpath()
+            with self._profiler.phase("asset_registry_cache_restore"):
+                self._restore_asset_registry_cache()
+            return
+
+        with self._LAUNCH_LOCK:
+            self._launch_unreal()
 
+        # The UnrealClient takes the initialization actions once the editor has booted,
+        # so they are queued while it boots
         self._populate_action_queue()
 
-        # Add the openjd and adaptor namespace directory to PYTHONPATH, so that adaptor_runtime_client
-        # will be available directly to the adaptor client.
+        self._wait_for_unreal_started()
+
+    def _create_instance(self, on_progress: Callable[[float], None]) -> UnrealInstanceAdaptor:
+        """
+        Creates the adaptor of one Unreal instance of the pool
+
+        :param on_progress: Callback the instance reports its progress with
+
+        :return: Instance adaptor
+        :rtype: UnrealInstanceAdaptor
+        """
+        return UnrealInstanceAdaptor(
+            {**self.init_data, "instance_count": 1},
+            on_progress=on_progress,
+            path_mapping_data=self._path_mapping_data,
+        )
+
+    def _launch_unreal(self) -> None:
+        """
+        Starts the adaptor server and launches Unreal with the UnrealClient connecting to it.
+        Only the setup Unreal reads at launch is done before it: its environment and the asset
+        registry cache it loads at boot. Unreal is launched as soon as the socket path is known.
+        """
+        with self._profiler.phase("python_path"):
+            self._add_client_to_pythonpath()
+
+        with self._profiler.phase("asset_registry_cache_restore"):
+            self._restore_asset_registry_cache()
+
+        # Starts the unreal adaptor server
+        with self._profiler.phase("server_start"):
+            self._start_unreal_server_thread()
+
+        self._start_unreal_client()
+
+    def _add_client_to_pythonpath(self) -> None:
+        """
+        Add the openjd and adaptor namespace directory to PYTHONPATH, so that adaptor_runtime_client
+        will be available directly to the adaptor client.
+        """
 
         import openjd.adaptor_runtime_client
 
@@ -375,53 +1035,351 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
 
         add_module_to_pythonpath(os.path.dirname(os.path.dirname(deadline.unreal_adaptor.__file__)))
 
-        self._start_unreal_client()
+        # The UnrealClient imports its modules from the precompiled archive instead of the source
+        # trees. The last PYTHONPATH entry comes first in its sys.path.
+        # The launch profile environment may put another engine, with another Python, on the PATH
+        apply_environment(self.init_data.get("launch_profile", {}))
+        try:
+            bundle_path = get_client_bundle("UnrealEditor-Cmd")
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning(f"Failed to build the UnrealClient bundle, using the sources: {e}")
+            return
+        add_module_to_pythonpath(bundle_path)
 
-        self._wait_for_unreal_started()
+    def _restore_asset_registry_cache(self) -> None:
+        """
+        Restores the asset registry cache of the project from the "asset_registry_cache_path"
+        node directory of the init_data, keyed by the project and its .uproject file
+        """
+        cache_root = self.init_data.get("asset_registry_cache_path")
+        if not cache_root:
+            return
+
+        unreal_project_path = self.init_data.get("project_path", "")
+        self._asset_registry_cache_directory = get_cache_directory(
+            os.path.abspath(os.path.expanduser(cache_root)), unreal_project_path
+        )
+        restored_paths = restore_cache(self._asset_registry_cache_directory, unreal_project_path)
+        self._asset_registry_cache_restored = bool(restored_paths)
+        if restored_paths:
+            logger.info(f"Restored the asset registry cache {self._asset_registry_cache_directory}")
+        else:
+            logger.info(f"No asset registry cache in {self._asset_registry_cache_directory}")
+
+    def _save_asset_registry_cache(self) -> None:
+        """
+        Saves the asset registry cache the closed Unreal wrote for the next sessions of the node
+        """
+        if self._asset_registry_cache_directory is None:
+            return
+
+        cached_paths = save_cache(
+            self._asset_registry_cache_directory, self.init_data.get("project_path", "")
+        )
+        if cached_paths:
+            logger.info(f"Saved the asset registry cache to {self._asset_registry_cache_directory}")
 
     def on_run(self, run_data: dict) -> None:
         """
-        This starts a render in Unreal for the given frame and performs a busy wait until the render completes.
+        This starts a render in Unreal for the given frame and waits until the render completes.
 
         :param run_data: Dictionary containing Run Data
         :type run_data: dict
         """
+        try:
+            self._run(run_data)
+        finally:
+            self._report_phases("task")
+
+    def _run(self, run_data: dict) -> None:
+        """
+        Validates the run_data and renders it, see :meth:`on_run`
+
+        :param run_data: Dictionary containing Run Data
+        :type run_data: dict
+        """
+        self._raise_if_canceled()
+
+        if self._instance_pool is not None:
+            self.data_validation.validate_run_data(run_data)
+            self._instance_pool.run(run_data)
+            return
+
+        # The DDC is filled in on_start
+        if self._ddc_fill_mode:
+            return
+
+        if self._game_render_mode:
+            self.data_validation.validate_run_data(run_data)
+            with self._profiler.phase("game_render"):
+                self._run_game(run_data)
+            return
+
         if not self._unreal_is_running:
             raise UnrealNotRunningError("Cannot render because Unreal is not running.")
 
         self.data_validation.validate_run_data(run_data)
 
+        recycle_reason = self._get_recycle_reason()
+        if recycle_reason is not None:
+            with self._profiler.phase("recycle"):
+                self._recycle_unreal_client(recycle_reason)
+        self._unreal_runs_count += 1
+
+        crash_retries = self.init_data.get("crash_retries", self._DEFAULT_CRASH_RETRIES)
+        run_start_time = time.time()
+        for attempt in range(crash_retries + 1):
+            with self._profiler.phase("run"):
+                self._run_on_unreal(run_data)
+
+            # Unreal terminated by on_cancel() exits like a crashed one
+            self._raise_if_canceled()
+            if self._unreal_is_running or not self._unreal_client:
+                return
+
+            #  This is always an error case because the Unreal Client should still be running and
+            #  waiting for the next command. If the thread finished, then we cannot continue
+            exit_code = self._unreal_client.returncode
+            self._get_deadline_telemetry_client().record_error(
+                {"exit_code": exit_code, "exception_scope": "on_run"}, str(RuntimeError)
+            )
+            if attempt == crash_retries:
+                raise RuntimeError(
+                    "Unreal exited early and did not render successfully, please check render "
+                    f"logs. Exit code {exit_code}"
+                )
+
+            logger.warning(
+                f"Unreal exited early with exit code {exit_code}, relaunching it and resuming "
+                f"the run (retry {attempt + 1} of {crash_retries})"
+            )
+            with self._profiler.phase("crash_restart"):
+                self._restart_unreal_client()
+            # The frames the crashed Unreal has written are not rendered again. Unless the submitter
+            # resumes the render, the older frames in the output directory are rendered again
+            if run_data.get("handler") == "render" and not run_data.get("resume", False):
+                run_data = {**run_data, "resume": True, "resume_since": run_start_time}
+
+    def _run_game(self, run_data: dict) -> None:
+        """
+        Renders the run with Unreal launched in game mode and waits until Unreal exits.
+        See :mod:`deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_game_render_executor`
+
+        :param run_data: Dictionary containing Run Data
+        :type run_data: dict
+
+        :raises RuntimeError: If the run is not a render, if Unreal reported an error
+            or exited before the render completed
+        """
+        handler = run_data.get("handler")
+        if handler != "render":
+            raise RuntimeError(f"Game render mode runs the render handler only, got {handler}")
+
+        level_path = run_data.get("level_path") or self.init_data.get("level_path", "")
+        args = ["UnrealEditor-Cmd", self.init_data.get("project_path", "")]
+        if level_path:
+            # Map the game starts with, the package name of the level
+            args.append(level_path.split(".")[0])
+        args.extend(self._GAME_RENDER_ARGS)
+        args.extend(self._UNREAL_LOG_ARGS)
+
+        launch_profile = self.init_data.get("launch_profile", {})
+        args.extend(get_launch_args(launch_profile))
+        exec_cmds = get_exec_cmds(launch_profile)
+        if exec_cmds:
+            args.append(f"-execcmds={','.join(exec_cmds)}")
+
+        run_data_file, run_data_path = tempfile.mkstemp(prefix="unreal_run_data_", suffix=".json")
+        with os.fdopen(run_data_file, "w", encoding="utf-8") as f:
+            json.dump(run_data, f)
+        args.append(f"-DeadlineRunData={run_data_path}")
+
+        import deadline.unreal_adaptor.UnrealClient
+
+        startup_path = os.path.join(
+            os.path.dirname(deadline.unreal_adaptor.UnrealClient.__file__), "startup"
+        )
+
+        self._exc_info = None
+        self._reset_progress()
+        self._unreal_is_rendering = True
+        self._watchdog.start(
+            "render",
+            self.init_data.get(
+                "run_stall_timeout_seconds", self._DEFAULT_RUN_STALL_TIMEOUT_SECONDS
+            ),
+        )
+        try:
+            with self._LAUNCH_LOCK:
+                # The startup script registers the game render executor,
+                # the startup scripts of the studio environment run too
+                ue_python_paths = [
+                    path
+                    for path in os.environ.get("UE_PYTHONPATH", "").split(os.pathsep)
+                    if path and path != startup_path
+                ]
+                os.environ["UE_PYTHONPATH"] = os.pathsep.join([startup_path, *ue_python_paths])
+                self._launch_unreal_process(args)
+
+            while self._unreal_is_rendering and not self._has_exception:
+                if self._wait_for_unreal_state(
+                    lambda: not self._unreal_is_rendering or self._exc_info is not None,
+                    timeout=self._WAIT_RESULT_INTERVAL_SECONDS,
+                ):
+                    continue
+                self._check_watchdog()
+            # Unreal quits once the render completed, its last output lines are handled
+            if self._unreal_client is not None:
+                self._wait_for_unreal_state(
+                    lambda: not self._unreal_is_running, timeout=self._UNREAL_END_TIMEOUT_SECONDS
+                )
+                self._unreal_client.wait_for_exit(timeout=self._UNREAL_END_TIMEOUT_SECONDS)
+        finally:
+            # The next run launches its own Unreal, this one must not outlive the run
+            if self._unreal_is_running and self._unreal_client is not None:
+                logger.warning(
+                    f"Game Unreal (pid={self._unreal_client.pid}) did not exit, terminating it"
+                )
+                self._unreal_client.terminate(grace_time_s=0)
+            os.remove(run_data_path)
+
+        self._raise_if_canceled()
+        if self._is_rendering:
+            self._is_rendering = False
+            exit_code = self._unreal_client.returncode if self._unreal_client else None
+            raise RuntimeError(
+                "Unreal exited before the game render completed, please check render logs. "
+                f"Exit code {exit_code}"
+            )
+
+    def _run_on_unreal(self, run_data: dict) -> None:
+        """
+        Sends the run to the UnrealClient and waits until the run completes, fails or Unreal exits
+
+        :param run_data: Dictionary containing Run Data
+        :type run_data: dict
+        """
+        # In daemon mode the same Unreal session serves several runs,
+        # so an error caught during the previous run must not fail this one.
+        self._exc_info = None
+
         # Set up the step handler
         self._action_queue.enqueue_action(
             Action("set_handler", {"handler": run_data.get("handler", "base")})
         )
 
+        self._watchdog.start(
+            run_data.get("handler", "run"),
+            self.init_data.get(
+                "run_stall_timeout_seconds", self._DEFAULT_RUN_STALL_TIMEOUT_SECONDS
+            ),
+        )
+        self._reset_progress(run_data.get("handler"))
         self._unreal_is_rendering = True
         self._action_queue.enqueue_action(Action("run_script", run_data))
 
         while self._unreal_is_rendering and not self._has_exception:
-            time.sleep(1)
-            # Wait for:
+            # Wake up as soon as the render completes, fails or Unreal exits
+            if self._wait_for_unreal_state(
+                lambda: not self._unreal_is_rendering or self._exc_info is not None,
+                timeout=self._WAIT_RESULT_INTERVAL_SECONDS,
+            ):
+                continue
+            self._check_watchdog()
+            # UnrealClient sending the step events doesn't request actions until the step is done.
+            # Otherwise, wait for:
             #   1. set_handler to be executed
             #   2. run_script to be executed (launch render process in separate thread by UE API)
             # by UnrealClient and don't spam before
-            if len(self._action_queue) == 0:
+            if not self._unreal_events_received and len(self._action_queue) == 0:
                 logger.info("Enqueue wait result")
                 self._action_queue.enqueue_action(Action("wait_result", {}))
 
-        if (
-            not self._unreal_is_running and self._unreal_client
-        ):  # Unreal Client will always exist here.
-            #  This is always an error case because the Unreal Client should still be running and
-            #  waiting for the next command. If the thread finished, then we cannot continue
-            exit_code = self._unreal_client.returncode
-            self._get_deadline_telemetry_client().record_error(
-                {"exit_code": exit_code, "exception_scope": "on_run"}, str(RuntimeError)
-            )
-            raise RuntimeError(
-                "Unreal exited early and did not render successfully, please check render logs. "
-                f"Exit code {exit_code}"
+    def _get_recycle_reason(self) -> str | None:
+        """
+        Samples the resident set size of the Unreal process tree between the runs and tells
+        if Unreal must be restarted before the next run because it uses too much memory:
+
+        - "memory_ceiling_mb": maximum size of the tree
+        - "memory_growth_mb_per_run": maximum average growth per run since the first sample
+
+        :return: Reason of the recycle or None if Unreal may serve the next run
+        :rtype: str | None
+        """
+        ceiling_mb = self.init_data.get("memory_ceiling_mb")
+        growth_mb_per_run = self.init_data.get("memory_growth_mb_per_run")
+        if not (ceiling_mb or growth_mb_per_run) or not self._unreal_client:
+            return None
+
+        rss = get_process_tree_rss(self._unreal_client.pid)
+        if rss is None:
+            return None
+        rss_mb = rss / 1024 / 1024
+        logger.info(
+            f"Unreal process tree memory: {rss_mb:.0f} MB after {self._unreal_runs_count} run(s)"
+        )
+
+        if self._memory_baseline is None:
+            self._memory_baseline = rss
+            return None
+
+        if ceiling_mb and rss_mb > ceiling_mb:
+            return f"memory {rss_mb:.0f} MB is over the ceiling of {ceiling_mb} MB"
+
+        growth_mb = (rss - self._memory_baseline) / 1024 / 1024 / max(self._unreal_runs_count, 1)
+        if growth_mb_per_run and growth_mb > growth_mb_per_run:
+            return (
+                f"memory grew by {growth_mb:.0f} MB per run over {self._unreal_runs_count} runs, "
+                f"more than {growth_mb_per_run} MB per run"
             )
+        return None
+
+    def _recycle_unreal_client(self, reason: str) -> None:
+        """
+        Closes Unreal with the "close" action and launches a new one before the next run
+
+        :param reason: Reason of the recycle reported in the task log
+        """
+        logger.info(f"Recycling Unreal: {reason}")
+        self._get_deadline_telemetry_client().record_event(
+            event_type="com.amazon.rum.deadline.adaptor.runtime.recycle",
+            event_details={"reason": reason, "runs_count": self._unreal_runs_count},
+        )
+
+        self._close_unreal()
+        if self._unreal_is_running and self._unreal_client:
+            logger.error("Unreal did not close for the recycle. Terminating.")
+            self._unreal_client.terminate(0)
+
+        self._restart_unreal_client()
+
+    def _restart_unreal_client(self) -> None:
+        """
+        Relaunches the Unreal client after it exited (crash or recycle). The adaptor server keeps
+        running, so the new UnrealClient connects to the same socket.
+
+        :raises RuntimeError: If Unreal did not complete initialization actions due to an exception
+        :raises TimeoutError: If Unreal did not complete initialization actions due to timing out.
+        :raises UnrealRunCanceledError: If the run was canceled
+        """
+        self._raise_if_canceled()
+        self.update_status(status_message="Restarting Unreal Engine")
+
+        # Actions of the crashed run must not be taken by the new UnrealClient
+        while self._action_queue.dequeue_action() is not None:
+            pass
+        self._populate_action_queue()
+        self._unreal_is_rendering = False
+        self._unreal_events_received = False
+        self._memory_baseline = None
+        self._unreal_runs_count = 0
+
+        with self._LAUNCH_LOCK:
+            if self._server is not None and self._server.server_path is not None:
+                os.environ["UNREAL_ADAPTOR_SOCKET_PATH"] = self._server.server_path
+            self._start_unreal_client()
+
+        self._wait_for_unreal_started()
 
     def on_stop(self) -> None:
         """
@@ -433,16 +1391,18 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         """
         Cleans up the adaptor by closing the unreal client and adaptor server.
         """
+        if self._instance_pool is not None:
+            self._instance_pool.cleanup()
+            return
 
-        self._performing_cleanup = True
+        if self._ddc_fill_mode:
+            self._evict_ddc()
+            return
 
-        # Send "close" action to the UnrealClient
-        self._action_queue.enqueue_action(Action("close"), front=True)
+        self._performing_cleanup = True
 
-        # Wait for UnrealClient to be terminated
-        is_not_timed_out = self.get_timer(self._UNREAL_END_TIMEOUT_SECONDS)
-        while self._unreal_is_running and is_not_timed_out():
-            time.sleep(0.1)
+        with self._profiler.phase("shutdown"):
+            self._close_unreal()
 
         if self._unreal_is_running and self._unreal_client:
             logger.error(
@@ -461,16 +1421,92 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
             if self._server_thread.is_alive():
                 logger.error("Failed to shutdown the Unreal Adaptor server.")
 
+        # Unreal is closed, so it doesn't write the caches while they are copied and evicted
+        with self._profiler.phase("asset_registry_cache_save"):
+            self._save_asset_registry_cache()
+        with self._profiler.phase("ddc_evict"):
+            self._evict_ddc()
+
         self._performing_cleanup = False
+        self._report_phases("cleanup")
+
+    def _close_unreal(self) -> None:
+        """
+        Closes Unreal and waits until it exits, or the end timeout is reached.
+
+        With the "fast_teardown" of the init_data, the UnrealClient flushes its outputs and logs,
+        confirms it with the exit_ready event, and Unreal is killed with the processes it started
+        instead of the engine shutdown. Unreal is closed normally if it doesn't confirm, or if it
+        has to write the asset registry cache of the node at shutdown.
+        """
+        if self.init_data.get("fast_teardown", False) and self._unreal_is_running:
+            if self._asset_registry_cache_directory is not None and (
+                not self._asset_registry_cache_restored
+            ):
+                logger.info("Closing Unreal normally to write the asset registry cache")
+            else:
+                self._unreal_exit_ready = False
+                self._action_queue.enqueue_action(Action("fast_exit"), front=True)
+                self._wait_for_unreal_state(
+                    lambda: self._unreal_exit_ready or not self._unreal_is_running,
+                    timeout=self._FAST_EXIT_TIMEOUT_SECONDS,
+                )
+                if self._unreal_exit_ready and self._unreal_is_running and self._unreal_client:
+                    logger.info("Unreal flushed its outputs, terminating it")
+                    self._unreal_client.terminate(grace_time_s=0)
+                    return
+                if self._unreal_is_running:
+                    logger.warning("Unreal did not confirm the fast exit, closing it normally")
+
+        # Send "close" action to the UnrealClient
+        self._action_queue.enqueue_action(Action("close"), front=True)
+
+        # Wait for UnrealClient to be terminated
+        self._wait_for_unreal_state(
+            lambda: not self._unreal_is_running, timeout=self._UNREAL_END_TIMEOUT_SECONDS
+        )
+
+    def _raise_if_canceled(self) -> None:
+        """
+        :raises UnrealRunCanceledError: If the run was canceled, see :meth:`on_cancel`
+        """
+        if self._canceled:
+            self._unreal_is_rendering = False
+            raise UnrealRunCanceledError("The run was canceled")
 
     def on_cancel(self):
         """
         Cancels the current render if Unreal is rendering.
+        The adaptor doesn't launch Unreal again once canceled, the run fails as canceled.
         """
         logger.info("CANCEL REQUESTED")
+        self._canceled = True
+        if self._instance_pool is not None:
+            self._instance_pool.cancel()
+            return
+
         if not self._unreal_client or not self._unreal_is_running:
             logger.info("Nothing to cancel because Unreal is not running")
             return
 
         # Terminate immediately since the Unreal client does not have a graceful shutdown
         self._unreal_client.terminate(grace_time_s=0)
+
+
+class UnrealInstanceAdaptor(UnrealAdaptor):
+    """
+    UnrealAdaptor driving one Unreal instance of the
+    :class:`deadline.unreal_adaptor.UnrealAdaptor.instance_pool.UnrealInstancePool`.
+    Reports its progress to the pool, which aggregates the progress of all the instances.
+    The status messages of the instance are not reported, the pool reports the aggregated one.
+    """
+
+    def __init__(self, init_data: dict, *, on_progress: Callable[[float], None], **kwargs):
+        super().__init__(init_data, **kwargs)
+        self._on_progress = on_progress
+
+    def update_status(  # type: ignore[override]
+        self, *, progress: float | None = None, status_message: str | None = None
+    ) -> None:
+        if progress is not None:
+            self._on_progress(progress)
@@ -0,0 +1,128 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import json
+from http import HTTPStatus
+from socketserver import ThreadingMixIn
+from typing import Any, Callable, cast
+
+from openjd.adaptor_runtime._http import HTTPResponse
+from openjd.adaptor_runtime.adaptors import BaseAdaptor
+from openjd.adaptor_runtime.application_ipc import ActionsQueue, AdaptorServer
+
+# The runtime has no public extension point for the server endpoints:
+# the POSIX server routes the requests to every AdaptorResourceRequestHandler subclass,
+# the Windows server has a fixed routing table in its request handler.
+# The runtime version is pinned to the minor version these private modules are tested with.
+from openjd.adaptor_runtime.application_ipc._http_request_handler import (
+    AdaptorResourceRequestHandler,
+)
+
+from ..UnrealClient.step_events import EVENT_REQUEST_PATH
+
+
+def parse_event_params(query_string_params: dict[str, Any]) -> tuple[str, dict]:
+    """
+    Parses the event sent by the UnrealClient in the request params
+
+    :param query_string_params: Request params, {"event": ['{"name": ..., "args": {...}}']}
+
+    :raises ValueError: If the params don't hold a valid event
+
+    :return: Event name and arguments
+    :rtype: tuple[str, dict]
+    """
+    event = query_string_params.get("event")
+    if isinstance(event, list):
+        event = event[0] if event else None
+    if not event:
+        raise ValueError("Missing event in the request params")
+
+    event_dict = json.loads(event)
+    if not isinstance(event_dict, dict) or not isinstance(event_dict.get("name"), str):
+        raise ValueError(f"Invalid event: {event}")
+    return event_dict["name"], event_dict.get("args") or {}
+
+
+class UnrealAdaptorServer(ThreadingMixIn, AdaptorServer):
+    """
+    AdaptorServer that also receives the step events (progress, completion, errors)
+    the UnrealClient sends on the EVENT_REQUEST_PATH.
+
+    The UnrealClient keeps an action request waiting on the server from its polling thread while
+    the game thread sends the events, so the POSIX server handles each request on its own thread
+    (the Windows named pipe server already does).
+    """
+
+    # The waiting action request must not hold the adaptor exit
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(
+        self,
+        actions_queue: ActionsQueue,
+        adaptor: BaseAdaptor,
+        on_event: Callable[[str, dict], None],
+    ) -> None:
+        super().__init__(actions_queue, adaptor)
+        self.on_event = on_event
+
+    def request_handler(self, server, pipe_handle):  # pragma: is-posix
+        """
+        Returns the handler of the Windows named pipe requests, which routes the event requests
+        """
+        return UnrealWinAdaptorServerResourceRequestHandler(server, pipe_handle)
+
+
+class UnrealEventEndpoint(AdaptorResourceRequestHandler):
+    """
+    Handles the event requests of the UnrealClient on the POSIX server
+    """
+
+    path = EVENT_REQUEST_PATH
+
+    def get(self) -> HTTPResponse:
+        on_event = getattr(self.server, "on_event", None)
+        if on_event is None:
+            return HTTPResponse(HTTPStatus.NOT_FOUND, body="Server does not handle events")
+
+        try:
+            name, args = parse_event_params(self.query_string_params)
+        except ValueError as e:
+            return HTTPResponse(HTTPStatus.BAD_REQUEST, body=str(e))
+
+        on_event(name, args)
+        return HTTPResponse(HTTPStatus.OK)
+
+
+if os.name == "nt":  # pragma: is-posix
+    from openjd.adaptor_runtime.application_ipc._named_pipe_request_handler import (
+        WinAdaptorServerResourceRequestHandler,
+    )
+
+    class UnrealWinAdaptorServerResourceRequestHandler(WinAdaptorServerResourceRequestHandler):
+        """
+        Handles the event requests of the UnrealClient on the Windows server
+        """
+
+        @property
+        def request_path_and_method_dict(self) -> dict[str, list[str]]:
+            return {**super().request_path_and_method_dict, EVENT_REQUEST_PATH: ["GET"]}
+
+        def handle_request(self, data: str):
+            request_dict = json.loads(data)
+            if request_dict.get("path") != EVENT_REQUEST_PATH:
+                return super().handle_request(data)
+
+            try:
+                name, args = parse_event_params(
+                    json.loads(request_dict.get("params") or "null") or {}
+                )
+            except ValueError as e:
+                self.send_response(HTTPStatus.BAD_REQUEST, str(e))
+                return
+
+            cast(UnrealAdaptorServer, self.server).on_event(name, args)
+            self.send_response(HTTPStatus.OK)
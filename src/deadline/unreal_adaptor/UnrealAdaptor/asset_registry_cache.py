@@ -0,0 +1,138 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import glob
+import time
+import shutil
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+#: Asset registry cache files the editor writes to the Intermediate directory of the project
+CACHE_FILE_PATTERN = "CachedAssetRegistry*.bin"
+
+#: Cache entries not used for longer than this are deleted
+MAX_CACHE_ENTRY_AGE_SECONDS = 30 * 24 * 3600
+
+
+def get_content_hash(project_path: str) -> str:
+    """
+    Returns the hash of the Content directory of the project: the relative paths and the sizes of
+    its files. The file contents are not read, but every file of the project is listed.
+
+    :param project_path: Path to the .uproject file
+
+    :return: Hex digest of the content
+    :rtype: str
+    """
+    content_directory = os.path.join(os.path.dirname(project_path), "Content")
+    content_hash = hashlib.sha256()
+    for root, directory_names, file_names in os.walk(content_directory):
+        directory_names.sort()
+        for file_name in sorted(file_names):
+            path = os.path.join(root, file_name)
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                continue
+            relative_path = os.path.relpath(path, content_directory).replace("\\", "/")
+            content_hash.update(f"{relative_path}:{size}\n".encode("utf-8"))
+    return content_hash.hexdigest()
+
+
+def get_cache_directory(cache_root: str, project_path: str) -> str:
+    """
+    Returns the node cache directory of the asset registry of the project. It is keyed by the
+    project name and its .uproject file, not by the content: the key is computed before Unreal
+    launches, and the Content directory is not walked for it. The editor checks the cached
+    entries against the timestamps of the package files and scans again the changed ones,
+    so the cache saved with another version of the content is still valid.
+
+    :param cache_root: Node directory of the asset registry caches
+    :param project_path: Path to the .uproject file
+
+    :return: Cache directory keyed by the project name and the .uproject file hash
+    :rtype: str
+    """
+    project_name = os.path.splitext(os.path.basename(project_path))[0]
+    project_hash = hashlib.sha256()
+    try:
+        with open(project_path, "rb") as f:
+            project_hash.update(f.read())
+    except OSError:
+        pass
+    return os.path.join(cache_root, f"{project_name}-{project_hash.hexdigest()[:16]}")
+
+
+def _copy_files(source_paths: list[str], destination_directory: str) -> list[str]:
+    """
+    Copies the files through a temporary file, so the concurrent readers never see a partial file
+
+    :return: Paths to the copied files
+    """
+    os.makedirs(destination_directory, exist_ok=True)
+    copied_paths = []
+    for source_path in source_paths:
+        destination_path = os.path.join(destination_directory, os.path.basename(source_path))
+        temporary_path = f"{destination_path}.{os.getpid()}.tmp"
+        try:
+            shutil.copyfile(source_path, temporary_path)
+            os.replace(temporary_path, destination_path)
+        except OSError as e:
+            logger.warning(f"Failed to copy the asset registry cache {source_path}: {e}")
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            continue
+        copied_paths.append(destination_path)
+    return copied_paths
+
+
+def restore_cache(cache_directory: str, project_path: str) -> list[str]:
+    """
+    Copies the cached asset registry files to the Intermediate directory of the project,
+    so the editor skips the full scan of the content
+
+    :param cache_directory: Cache directory, see :func:`get_cache_directory`
+    :param project_path: Path to the .uproject file
+
+    :return: Paths to the restored files
+    :rtype: list[str]
+    """
+    cache_paths = glob.glob(os.path.join(cache_directory, CACHE_FILE_PATTERN))
+    if not cache_paths:
+        return []
+    # Marks the entry as used for the pruning
+    os.utime(cache_directory)
+    return _copy_files(cache_paths, os.path.join(os.path.dirname(project_path), "Intermediate"))
+
+
+def save_cache(cache_directory: str, project_path: str) -> list[str]:
+    """
+    Copies the asset registry files the editor wrote to the Intermediate directory of the project
+    to the cache directory, and deletes the cache entries not used for a long time
+
+    :param cache_directory: Cache directory, see :func:`get_cache_directory`
+    :param project_path: Path to the .uproject file
+
+    :return: Paths to the cached files
+    :rtype: list[str]
+    """
+    intermediate_paths = glob.glob(
+        os.path.join(os.path.dirname(project_path), "Intermediate", CACHE_FILE_PATTERN)
+    )
+    if not intermediate_paths:
+        return []
+    cached_paths = _copy_files(intermediate_paths, cache_directory)
+
+    cache_root = os.path.dirname(cache_directory)
+    for entry_name in os.listdir(cache_root):
+        entry_path = os.path.join(cache_root, entry_name)
+        try:
+            if time.time() - os.path.getmtime(entry_path) > MAX_CACHE_ENTRY_AGE_SECONDS:
+                shutil.rmtree(entry_path)
+        except OSError:
+            continue
+    return cached_paths
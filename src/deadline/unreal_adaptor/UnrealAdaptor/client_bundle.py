@@ -0,0 +1,278 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import zipfile
+import subprocess
+from typing import Iterator
+
+# Run by the Python of Unreal, compiles the bytecode its zipimport loads
+_COMPILE_SCRIPT = """
+import sys, json, py_compile
+for path, cfile, dfile in json.load(sys.stdin):
+    py_compile.compile(
+        path,
+        cfile=cfile,
+        dfile=dfile,
+        doraise=True,
+        invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+    )
+"""
+_COMPILE_TIMEOUT_SECONDS = 120
+
+
+def get_default_cache_directory() -> str:
+    """
+    Returns the directory of the client bundles of the current user. The temporary directory
+    is per user on Windows, not on POSIX.
+
+    :return: Path to the directory
+    :rtype: str
+    """
+    name = "deadline_unreal_client"
+    if hasattr(os, "getuid"):
+        name = f"{name}-{os.getuid()}"
+    return os.path.join(tempfile.gettempdir(), name)
+
+
+def _make_private_directory(directory: str) -> None:
+    """
+    Creates the directory only the current user can access. Unreal imports the bundles of the
+    directory, so an existing directory of another user or writable by the others is rejected.
+
+    :raises PermissionError: If the directory is owned by another user or writable by the others
+    """
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    if not hasattr(os, "getuid"):
+        return
+    stat = os.stat(directory)
+    if stat.st_uid != os.getuid() or stat.st_mode & 0o022:
+        raise PermissionError(f"The client bundle directory {directory} is not private")
+
+
+def find_unreal_python(unreal_executable: str) -> str | None:
+    """
+    Returns the Python interpreter the engine of the Unreal executable ships,
+    Engine/Binaries/ThirdParty/Python3/<Platform> next to Engine/Binaries/<Platform>
+
+    :param unreal_executable: Name of the Unreal executable on the PATH
+
+    :return: Path to the interpreter or None if it is not found
+    :rtype: str | None
+    """
+    executable_path = shutil.which(unreal_executable)
+    if executable_path is None:
+        return None
+    platform_directory = os.path.dirname(os.path.realpath(executable_path))
+    binaries_directory, platform = os.path.split(platform_directory)
+    python_directory = os.path.join(binaries_directory, "ThirdParty", "Python3", platform)
+    for python_path in [
+        os.path.join(python_directory, "python.exe"),
+        os.path.join(python_directory, "bin", "python3"),
+    ]:
+        if os.path.isfile(python_path):
+            return python_path
+    return None
+
+
+def get_client_packages() -> list[tuple[str, str]]:
+    """
+    Returns the packages the UnrealClient imports in Unreal: the adaptor runtime client
+    and the UnrealClient package with its step handlers
+
+    :return: Directory and archive name of each package
+    :rtype: list[tuple[str, str]]
+    """
+    import openjd.adaptor_runtime_client
+
+    from .. import UnrealClient
+
+    return [
+        (os.path.dirname(openjd.adaptor_runtime_client.__file__), "openjd/adaptor_runtime_client"),
+        (os.path.dirname(UnrealClient.__file__), "deadline/unreal_adaptor/UnrealClient"),
+    ]
+
+
+def _iter_sources(directory: str, archive_name: str) -> Iterator[tuple[str, str]]:
+    """
+    Yields the path and the archive name of the Python files of the package directory
+    """
+    for root, directory_names, file_names in os.walk(directory):
+        directory_names[:] = sorted(name for name in directory_names if name != "__pycache__")
+        for file_name in sorted(file_names):
+            if file_name.endswith(".py"):
+                path = os.path.join(root, file_name)
+                relative_path = os.path.relpath(path, directory).replace("\\", "/")
+                yield path, f"{archive_name}/{relative_path}"
+
+
+def get_client_sources() -> list[tuple[str, str]]:
+    """
+    Returns the Python files of the client packages
+
+    :return: Path and archive name of each file
+    :rtype: list[tuple[str, str]]
+    """
+    return [
+        source
+        for directory, package_archive_name in get_client_packages()
+        for source in _iter_sources(directory, package_archive_name)
+    ]
+
+
+def get_bundle_key(sources: list[tuple[str, str]], python_path: str | None) -> str:
+    """
+    Returns the key of the bundle of the sources compiled by the interpreter: the content hash
+    of the sources and the identity of the interpreter, so a changed source or engine is never
+    served a stale bundle
+
+    :param sources: Path and archive name of each file, see :func:`get_client_sources`
+    :param python_path: Interpreter compiling the bytecode, None for a bundle of the sources only
+
+    :return: Hexadecimal key
+    :rtype: str
+    """
+    key = hashlib.sha256()
+    for path, archive_name in sources:
+        key.update(archive_name.encode("utf-8") + b"\0")
+        with open(path, "rb") as f:
+            key.update(hashlib.sha256(f.read()).digest())
+    if python_path is None:
+        key.update(b"source")
+    else:
+        python_stat = os.stat(python_path)
+        key.update(
+            f"{os.path.realpath(python_path)}:{python_stat.st_size}:{python_stat.st_mtime_ns}".encode(
+                "utf-8"
+            )
+        )
+    return key.hexdigest()
+
+
+def get_bundle_path(cache_directory: str, key: str) -> str:
+    """
+    Returns the path to the client bundle of the key
+
+    :param cache_directory: Directory of the client bundles
+    :param key: Bundle key, see :func:`get_bundle_key`
+
+    :return: Path to the zip archive
+    :rtype: str
+    """
+    return os.path.join(cache_directory, f"unreal_client-{key[:32]}.zip")
+
+
+def _write_directories(archive: zipfile.ZipFile, archive_name: str, written: set[str]) -> None:
+    """
+    Writes the directory entries of the archive name, zipimport finds the namespace packages
+    ("openjd" and "deadline") with them
+    """
+    parts = archive_name.split("/")[:-1]
+    for index in range(1, len(parts) + 1):
+        directory_name = "/".join(parts[:index]) + "/"
+        if directory_name not in written:
+            archive.writestr(zipfile.ZipInfo(directory_name), b"")
+            written.add(directory_name)
+
+
+def _compile_sources(
+    sources: list[tuple[str, str]], python_path: str, bundle_path: str, bytecode_directory: str
+) -> list[str]:
+    """
+    Compiles the sources with the interpreter, returns the path to the bytecode of each source
+
+    :raises subprocess.SubprocessError: If a source could not be compiled
+    """
+    bytecode_paths = [
+        os.path.join(bytecode_directory, f"{index}.pyc") for index in range(len(sources))
+    ]
+    # Tracebacks of Unreal show the files in the archive
+    compile_args = [
+        (path, bytecode_path, os.path.join(bundle_path, archive_name))
+        for (path, archive_name), bytecode_path in zip(sources, bytecode_paths)
+    ]
+    subprocess.run(
+        [python_path, "-I", "-c", _COMPILE_SCRIPT],
+        input=json.dumps(compile_args),
+        text=True,
+        capture_output=True,
+        check=True,
+        timeout=_COMPILE_TIMEOUT_SECONDS,
+    )
+    return bytecode_paths
+
+
+def build_bundle(bundle_path: str, sources: list[tuple[str, str]], python_path: str | None) -> None:
+    """
+    Builds the zipimport archive of the client sources with their bytecode compiled by the Python
+    of Unreal, or with the sources only if the Python of Unreal is unknown.
+
+    The bytecode is not checked against the sources, the bundle is keyed by their content.
+    The archive is stored uncompressed and written through a temporary file, so the concurrent
+    readers never see a partial archive.
+
+    :param bundle_path: Path to the zip archive, see :func:`get_bundle_path`
+    :param sources: Path and archive name of each file, see :func:`get_client_sources`
+    :param python_path: Interpreter compiling the bytecode, None for a bundle of the sources only
+
+    :raises OSError: If the bundle could not be written
+    :raises subprocess.SubprocessError: If a source could not be compiled
+    """
+    temporary_path = f"{bundle_path}.{os.getpid()}.tmp"
+    try:
+        with tempfile.TemporaryDirectory() as bytecode_directory:
+            bytecode_paths: list[str | None] = [None] * len(sources)
+            if python_path is not None:
+                bytecode_paths = list(
+                    _compile_sources(sources, python_path, bundle_path, bytecode_directory)
+                )
+
+            with zipfile.ZipFile(temporary_path, "w", zipfile.ZIP_STORED) as archive:
+                written: set[str] = set()
+                # The parent package of the UnrealClient, not a namespace package
+                _write_directories(archive, "deadline/unreal_adaptor/__init__.py", written)
+                archive.writestr("deadline/unreal_adaptor/__init__.py", b"")
+
+                for (path, archive_name), bytecode_path in zip(sources, bytecode_paths):
+                    _write_directories(archive, archive_name, written)
+                    archive.write(path, archive_name)
+                    if bytecode_path is not None:
+                        archive.write(bytecode_path, f"{archive_name}c")
+        os.replace(temporary_path, bundle_path)
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+
+def get_client_bundle(
+    unreal_executable: str = "UnrealEditor-Cmd", cache_directory: str | None = None
+) -> str:
+    """
+    Returns the client bundle for the Unreal executable on the PATH, builds it if the current
+    sources and the Python of Unreal have no bundle yet
+
+    :param unreal_executable: Name of the Unreal executable on the PATH
+    :param cache_directory: Directory of the client bundles,
+        see :func:`get_default_cache_directory` if None
+
+    :raises OSError: If the bundle could not be written or the directory is not private
+    :raises subprocess.SubprocessError: If a client module could not be compiled
+
+    :return: Path to the zip archive
+    :rtype: str
+    """
+    if cache_directory is None:
+        cache_directory = get_default_cache_directory()
+    _make_private_directory(cache_directory)
+
+    sources = get_client_sources()
+    python_path = find_unreal_python(unreal_executable)
+    bundle_path = get_bundle_path(cache_directory, get_bundle_key(sources, python_path))
+    if not os.path.isfile(bundle_path):
+        build_bundle(bundle_path, sources, python_path)
+    return bundle_path
@@ -10,10 +10,16 @@ def add_module_to_pythonpath(module_path: str):
     Extend or create env variable PYTHONPATH and add there the given path
     """
 
-    # can be passed the __init__.py file or the parent directory
-    module_directory = os.path.dirname(module_path) if os.path.isfile(module_path) else module_path
+    # can be passed the __init__.py file, the parent directory or a zip archive
+    module_directory = (
+        os.path.dirname(module_path)
+        if os.path.isfile(module_path) and not module_path.endswith(".zip")
+        else module_path
+    )
 
     if "PYTHONPATH" in os.environ:
+        if module_directory in os.environ["PYTHONPATH"].split(os.pathsep):
+            return
         os.environ["PYTHONPATH"] = f'{os.environ["PYTHONPATH"]}{os.pathsep}{module_directory}'
     else:
         os.environ["PYTHONPATH"] = module_directory
@@ -0,0 +1,206 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import logging
+from typing import IO
+
+from .asset_registry_cache import get_content_hash
+
+logger = logging.getLogger(__name__)
+
+#: Environment variable overriding the path of the local DDC of the Unreal Editor
+LOCAL_DDC_PATH_ENV_VAR = "UE-LocalDataCachePath"
+
+#: Lock file serializing the DDC fill and the eviction of all the workers of the node
+LOCK_FILE_NAME = ".deadline_ddc.lock"
+
+#: Directory of the markers of the project and engine versions the DDC was filled for
+FILL_MARKERS_DIRECTORY_NAME = ".deadline_ddc_fill"
+
+
+class DerivedDataCacheLock:
+    """
+    Exclusive lock of the node-local DDC directory shared by all the workers of the node.
+    The lock is held with an OS file lock, so it is released when the process holding it dies.
+    """
+
+    def __init__(self, ddc_path: str) -> None:
+        """
+        :param ddc_path: Path to the DDC directory
+        """
+        self._lock_path = os.path.join(ddc_path, LOCK_FILE_NAME)
+        self._lock_file: IO | None = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """
+        Acquires the lock
+
+        :param blocking: Wait until the lock is released by the other process if True
+
+        :return: True if the lock is acquired, False if it is held by another process
+        :rtype: bool
+        """
+        os.makedirs(os.path.dirname(self._lock_path), exist_ok=True)
+        lock_file = open(self._lock_path, "a+")
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+
+                while True:
+                    try:
+                        lock_file.seek(0)
+                        msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                        break
+                    except OSError:
+                        if not blocking:
+                            raise
+                        time.sleep(1)
+            else:
+                import fcntl
+
+                fcntl.flock(lock_file, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except OSError:
+            lock_file.close()
+            return False
+
+        self._lock_file = lock_file
+        return True
+
+    def release(self) -> None:
+        """Releases the lock if it is held"""
+        if self._lock_file is None:
+            return
+        if sys.platform == "win32":
+            import msvcrt
+
+            self._lock_file.seek(0)
+            msvcrt.locking(self._lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+        self._lock_file.close()
+        self._lock_file = None
+
+    def __enter__(self) -> DerivedDataCacheLock:
+        self.acquire()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
+
+
+def evict_least_recently_written(ddc_path: str, max_size_bytes: int) -> tuple[int, int]:
+    """
+    Deletes the least recently written files of the DDC until its size is under the given size.
+    The access times are not used: Unreal doesn't touch the DDC files it reads unless its
+    FileSystem backend sets Touch=true, and the filesystems often don't record them.
+
+    The caller must hold the :class:`DerivedDataCacheLock`. The files the running editors
+    fail to read are rebuilt, and the files they hold open are skipped.
+
+    :param ddc_path: Path to the DDC directory
+    :param max_size_bytes: Maximum size of the DDC in bytes
+
+    :return: Number and total size in bytes of the deleted files
+    :rtype: tuple[int, int]
+    """
+    files = []
+    total_size = 0
+    for root, directory_names, file_names in os.walk(ddc_path):
+        if root == ddc_path and FILL_MARKERS_DIRECTORY_NAME in directory_names:
+            directory_names.remove(FILL_MARKERS_DIRECTORY_NAME)
+        for file_name in file_names:
+            if root == ddc_path and file_name == LOCK_FILE_NAME:
+                continue
+            path = os.path.join(root, file_name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+
+    evicted_count = 0
+    evicted_size = 0
+    for _, size, path in sorted(files):
+        if total_size - evicted_size <= max_size_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        evicted_count += 1
+        evicted_size += size
+
+    return evicted_count, evicted_size
+
+
+def get_fill_fingerprint(project_path: str, unreal_executable: str) -> str:
+    """
+    Returns the fingerprint of the project content and of the engine the DDC is filled with:
+    the DDC is filled again when the content of the project changes or the engine is updated
+
+    :param project_path: Path to the .uproject file
+    :param unreal_executable: Unreal executable, its path is resolved with the PATH
+
+    :return: Hex digest of the content and engine
+    :rtype: str
+    """
+    fingerprint = hashlib.sha256(get_content_hash(project_path).encode("utf-8"))
+    engine_path = shutil.which(unreal_executable)
+    if engine_path is not None:
+        engine_path = os.path.realpath(engine_path)
+        try:
+            engine_stat = os.stat(engine_path)
+            fingerprint.update(
+                f"{os.path.normcase(engine_path)}:{engine_stat.st_size}:{engine_stat.st_mtime_ns}".encode(
+                    "utf-8"
+                )
+            )
+        except OSError:
+            pass
+    return fingerprint.hexdigest()
+
+
+def get_fill_marker_path(ddc_path: str, project_path: str, fingerprint: str) -> str:
+    """
+    Returns the path to the marker file written once the DDC is filled for the project
+
+    :param ddc_path: Path to the DDC directory
+    :param project_path: Path to the .uproject file
+    :param fingerprint: Fingerprint of the project content and engine, see
+        :func:`get_fill_fingerprint`
+
+    :return: Path to the marker file
+    :rtype: str
+    """
+    project_key = hashlib.sha256(os.path.normcase(project_path).encode("utf-8")).hexdigest()
+    return os.path.join(
+        ddc_path, FILL_MARKERS_DIRECTORY_NAME, f"{project_key[:16]}-{fingerprint[:16]}.json"
+    )
+
+
+def write_fill_marker(ddc_path: str, project_path: str, fingerprint: str) -> None:
+    """
+    Writes the marker telling the DDC is filled for the project
+
+    :param ddc_path: Path to the DDC directory
+    :param project_path: Path to the .uproject file
+    :param fingerprint: Fingerprint of the project content and engine, see
+        :func:`get_fill_fingerprint`
+    """
+    marker_path = get_fill_marker_path(ddc_path, project_path, fingerprint)
+    os.makedirs(os.path.dirname(marker_path), exist_ok=True)
+    with open(marker_path, "w") as f:
+        json.dump(
+            {"project_path": project_path, "fingerprint": fingerprint, "filled_at": time.time()},
+            f,
+        )
@@ -0,0 +1,226 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import queue
+import logging
+import threading
+from typing import Callable, Sequence
+
+from openjd.adaptor_runtime.adaptors import Adaptor
+
+logger = logging.getLogger(__name__)
+
+
+def _get_frame_range(run_data: dict) -> tuple[int, int] | None:
+    """
+    Returns the start and end (exclusive) frames of the render run data,
+    None if the run is not a render or renders the whole frame range of the job
+    """
+    if run_data.get("handler") != "render":
+        return None
+
+    from deadline.unreal_adaptor.UnrealClient.step_handlers import UnrealRenderStepHandler
+
+    return UnrealRenderStepHandler.parse_frames(str(run_data.get("frames", "")))
+
+
+def split_run_data(run_data: dict, count: int) -> list[dict]:
+    """
+    Splits the render run data into at most the given count of run data
+    with contiguous sub-ranges of its frames.
+    Runs that are not renders or don't have a frame range are not split.
+
+    :param run_data: Run data of the task
+    :param count: Maximum number of the sub-runs
+
+    :return: List of the run data to render concurrently
+    :rtype: list[dict]
+    """
+    frame_range = _get_frame_range(run_data) if count > 1 else None
+    if frame_range is None:
+        return [run_data]
+
+    start_frame, end_frame = frame_range
+    frames_count = end_frame - start_frame
+    count = min(count, frames_count)
+
+    sub_runs = []
+    sub_range_start = start_frame
+    for i in range(count):
+        # Spread the remainder over the first sub-ranges
+        sub_range_end = (
+            sub_range_start + frames_count // count + (1 if i < frames_count % count else 0)
+        )
+        sub_runs.append({**run_data, "frames": f"{sub_range_start}-{sub_range_end - 1}"})
+        sub_range_start = sub_range_end
+    return sub_runs
+
+
+def run_weight(run_data: dict) -> int:
+    """
+    Returns the weight of the run in the aggregated progress: its frames count if it has one
+
+    :param run_data: Run data of the task
+
+    :return: Weight of the run
+    :rtype: int
+    """
+    frame_range = _get_frame_range(run_data)
+    return 1 if frame_range is None else frame_range[1] - frame_range[0]
+
+
+class UnrealInstancePool:
+    """
+    Set of Unreal instances serving the runs of one UnrealAdaptor concurrently.
+
+    Each instance is an adaptor driving its own Unreal Editor with its own adaptor server,
+    actions queue and socket path. A run is split into sub-ranges of its frames, each sub-range
+    is rendered by the first free instance, and the progress of the sub-ranges is aggregated
+    into the progress of the run.
+    """
+
+    def __init__(
+        self,
+        create_instance: Callable[[Callable[[float], None]], Adaptor],
+        count: int,
+        update_status: Callable[..., None],
+    ) -> None:
+        """
+        :param create_instance: Function creating an instance adaptor, given the callback
+            the instance reports its progress with
+        :param count: Number of the instances
+        :param update_status: Function reporting the aggregated progress and status message
+        """
+        self._update_status = update_status
+        self._progress_lock = threading.Lock()
+        # Weight and progress of every sub-run of the current run
+        self._run_weights: list[int] = []
+        self._run_progress: list[float] = []
+        # Index of the sub-run every instance is rendering
+        self._instance_runs: dict[int, int] = {}
+
+        self.instances: list[Adaptor] = [
+            create_instance(self._get_progress_callback(index)) for index in range(count)
+        ]
+        self._free_instances: "queue.Queue[int]" = queue.Queue()
+        for index in range(count):
+            self._free_instances.put(index)
+
+    def _get_progress_callback(self, instance_index: int) -> Callable[[float], None]:
+        return lambda progress: self._handle_instance_progress(instance_index, progress)
+
+    def _handle_instance_progress(self, instance_index: int, progress: float) -> None:
+        """
+        Updates the progress of the sub-run the instance is rendering
+        and reports the aggregated progress of the run
+
+        :param instance_index: Index of the instance reporting the progress
+        :param progress: Progress of the instance sub-run
+        """
+        with self._progress_lock:
+            run_index = self._instance_runs.get(instance_index)
+            if run_index is None:
+                return
+            self._run_progress[run_index] = progress
+            aggregated_progress = sum(
+                weight * run_progress
+                for weight, run_progress in zip(self._run_weights, self._run_progress)
+            ) / max(sum(self._run_weights), 1)
+        self._update_status(
+            progress=aggregated_progress,
+            status_message=f"{int(aggregated_progress)}% on {len(self.instances)} Unreal instances",
+        )
+
+    @staticmethod
+    def _call_concurrently(
+        calls: Sequence[Callable[[], None]], thread_name: str
+    ) -> list[Exception]:
+        """
+        Calls the given functions each on its own thread and waits for all of them
+
+        :param calls: Functions to call
+        :param thread_name: Name prefix of the threads
+
+        :return: Exceptions raised by the functions
+        :rtype: list[Exception]
+        """
+        errors: list[Exception] = []
+
+        def call(function: Callable[[], None]) -> None:
+            try:
+                function()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [
+            threading.Thread(target=call, args=(function,), name=f"{thread_name}-{index}")
+            for index, function in enumerate(calls)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return errors
+
+    def start(self) -> None:
+        """
+        Starts all the instances concurrently
+
+        :raises Exception: The first error raised by the instances
+        """
+        errors = self._call_concurrently(
+            [instance.on_start for instance in self.instances], "UnrealInstanceStartThread"
+        )
+        if errors:
+            raise errors[0]
+
+    def run(self, run_data: dict) -> None:
+        """
+        Splits the run into sub-runs and renders each of them on the first free instance.
+        Returns when all the sub-runs are done.
+
+        :param run_data: Run data of the task
+
+        :raises Exception: The first error raised by the sub-runs
+        """
+        sub_runs = split_run_data(run_data, len(self.instances))
+        logger.info(f"Dispatching {len(sub_runs)} run(s) to {len(self.instances)} Unreal instances")
+
+        with self._progress_lock:
+            self._run_weights = [run_weight(sub_run) for sub_run in sub_runs]
+            self._run_progress = [0.0] * len(sub_runs)
+            self._instance_runs = {}
+
+        def get_sub_run(run_index: int) -> Callable[[], None]:
+            def sub_run() -> None:
+                instance_index = self._free_instances.get()
+                try:
+                    with self._progress_lock:
+                        self._instance_runs[instance_index] = run_index
+                    self.instances[instance_index].on_run(sub_runs[run_index])
+                    self._handle_instance_progress(instance_index, 100)
+                finally:
+                    with self._progress_lock:
+                        self._instance_runs.pop(instance_index, None)
+                    self._free_instances.put(instance_index)
+
+            return sub_run
+
+        errors = self._call_concurrently(
+            [get_sub_run(index) for index in range(len(sub_runs))], "UnrealInstanceRunThread"
+        )
+        if errors:
+            raise errors[0]
+
+    def cleanup(self) -> None:
+        """Closes all the instances concurrently"""
+        for error in self._call_concurrently(
+            [instance.on_cleanup for instance in self.instances], "UnrealInstanceCleanupThread"
+        ):
+            logger.error(f"Failed to cleanup the Unreal instance: {error}")
+
+    def cancel(self) -> None:
+        """Cancels the renders of all the instances"""
+        for instance in self.instances:
+            instance.on_cancel()
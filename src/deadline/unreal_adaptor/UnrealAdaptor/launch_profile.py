@@ -0,0 +1,62 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+
+
+def get_ini_override_arg(ini_override: dict) -> str:
+    """
+    Returns the Unreal command line argument overriding the ini setting, e.g.
+    -ini:Engine:[/Script/Engine.RendererSettings]:r.Streaming.PoolSize=4000
+
+    :param ini_override: "file", "section", "key" and "value" of the setting
+
+    :return: Command line argument
+    :rtype: str
+    """
+    value = ini_override["value"]
+    if isinstance(value, bool):
+        value = str(value)
+    return f"-ini:{ini_override['file']}:[{ini_override['section']}]:{ini_override['key']}={value}"
+
+
+def get_launch_args(launch_profile: dict) -> list[str]:
+    """
+    Returns the Unreal command line arguments of the launch profile:
+    its extra arguments followed by its ini overrides
+
+    :param launch_profile: "launch_profile" of the init_data
+
+    :return: Command line arguments
+    :rtype: list[str]
+    """
+    args = list(launch_profile.get("args", []))
+    args.extend(
+        get_ini_override_arg(ini_override)
+        for ini_override in launch_profile.get("ini_overrides", [])
+    )
+    return args
+
+
+def get_exec_cmds(launch_profile: dict) -> list[str]:
+    """
+    Returns the console commands of the launch profile Unreal runs at startup, e.g. r.HLOD 0
+
+    :param launch_profile: "launch_profile" of the init_data
+
+    :return: Console commands
+    :rtype: list[str]
+    """
+    return list(launch_profile.get("exec_cmds", []))
+
+
+def apply_environment(launch_profile: dict) -> None:
+    """
+    Sets the environment variables of the launch profile for the Unreal process to launch.
+    The caller must hold the launch lock of the adaptor, see UnrealAdaptor._LAUNCH_LOCK
+
+    :param launch_profile: "launch_profile" of the init_data
+    """
+    for name, value in launch_profile.get("environment", {}).items():
+        os.environ[name] = os.path.expandvars(value)
@@ -0,0 +1,382 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import re
+import time
+import logging
+import threading
+from collections import deque
+from typing import Callable, Collection, Sequence
+
+from openjd.adaptor_runtime.app_handlers import RegexCallback, RegexHandler
+
+
+logger = logging.getLogger(__name__)
+
+
+_REGEX_SPECIAL_CHARACTERS = frozenset(".^$*+?{}[]|()")
+_REGEX_QUANTIFIERS = frozenset("*+?{")
+
+
+def split_alternation(pattern: str) -> list[str]:
+    """
+    Splits the given regex pattern by its top level alternation ("|" outside any group or set)
+
+    :param pattern: Regex pattern to split, e.g. "Exception:.*|Render Executor: Error:.*"
+
+    :return: List of the alternation branches, e.g. ["Exception:.*", "Render Executor: Error:.*"]
+    :rtype: list[str]
+    """
+    branches = []
+    depth = 0
+    in_set = False
+    branch_start = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 1
+        elif in_set:
+            in_set = char != "]"
+        elif char == "[":
+            in_set = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            branches.append(pattern[branch_start:i])
+            branch_start = i + 1
+        i += 1
+    branches.append(pattern[branch_start:])
+    return branches
+
+
+def literal_prefix(pattern: str) -> str:
+    """
+    Returns the literal text every match of the given regex pattern (without alternation)
+    starts with.
+
+    :param pattern: Regex pattern, e.g. "Render Executor: Progress: ([0-9.]+)"
+
+    :return: Literal prefix, e.g. "Render Executor: Progress: ". Empty string if the pattern
+        starts with a regex construction
+    :rtype: str
+    """
+    literal = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+                # Character classes (\d, \s, ...) and back references are not literals
+                break
+            char = pattern[i + 1]
+            next_index = i + 2
+        elif char in _REGEX_SPECIAL_CHARACTERS:
+            break
+        else:
+            next_index = i + 1
+
+        if next_index < len(pattern) and pattern[next_index] in _REGEX_QUANTIFIERS:
+            # Quantified character is optional or repeated, so it ends the literal prefix
+            break
+
+        literal.append(char)
+        i = next_index
+    return "".join(literal)
+
+
+class UnrealLogMatcher(RegexHandler):
+    """
+    RegexHandler for the high volume of Unreal stdout and stderr lines.
+
+    Every regex of the given callbacks is split by its top level alternation and stripped of
+    the leading ".*". The literal text each branch starts with is used for two things:
+
+    1. A single compiled alternation of all the literals rejects the lines
+       that can't match any callback, which are nearly all the Unreal log lines.
+    2. The anchored branch patterns are only matched at the positions their literal is found at,
+       so no pattern backtracks over the whole line.
+
+    Branches without a literal prefix are searched in every line, like RegexHandler does.
+    Callbacks get the same match groups as with RegexHandler for patterns with a single branch.
+
+    The last emitted lines and the time of the last one are kept for the stall diagnostics.
+    """
+
+    #: Number of the last emitted lines kept in recent_lines
+    RECENT_LINES_COUNT = 100
+
+    def __init__(
+        self, regex_callbacks: Sequence[RegexCallback], level: int = logging.NOTSET
+    ) -> None:
+        super().__init__(regex_callbacks, level)
+
+        self.recent_lines: deque[str] = deque(maxlen=self.RECENT_LINES_COUNT)
+        #: time.monotonic() of the last emitted line, None before the first one
+        self.last_line_time: float | None = None
+
+        # Per callback, ordered as its regex_list: (literal, anchored pattern)
+        self._callback_rules: list[list[tuple[str, re.Pattern]]] = []
+        literals: set[str] = set()
+
+        for regex_callback in self.regex_callbacks:
+            rules = []
+            for regex in regex_callback.regex_list:
+                for branch in split_alternation(regex.pattern):
+                    while branch.startswith(".*"):
+                        branch = branch[2:]
+                    literal = literal_prefix(branch)
+                    rules.append((literal, re.compile(branch, regex.flags)))
+                    if literal:
+                        literals.add(literal)
+            self._callback_rules.append(rules)
+
+        self._has_unfiltered_rules = any(
+            not literal for rules in self._callback_rules for literal, _ in rules
+        )
+        # Longest literals first, so the alternation doesn't stop at a shorter common prefix
+        self._prefilter = re.compile(
+            "|".join(re.escape(literal) for literal in sorted(literals, key=len, reverse=True))
+            or "(?!)"
+        )
+
+    def match(self, line: str) -> list[re.Match | None]:
+        """
+        Matches the given line against the regex callbacks
+
+        :param line: Log line to match
+
+        :return: Match for each of the regex callbacks, None for the callbacks that don't match
+        :rtype: list[re.Match | None]
+        """
+        if not self._has_unfiltered_rules and self._prefilter.search(line) is None:
+            return [None] * len(self._callback_rules)
+
+        return [self._match_rules(rules, line) for rules in self._callback_rules]
+
+    @staticmethod
+    def _match_rules(rules: list[tuple[str, re.Pattern]], line: str) -> re.Match | None:
+        """
+        Returns the first match of the given rules in the line
+
+        :param rules: List of (literal, anchored pattern) to match
+        :param line: Log line to match
+
+        :return: The match of the first rule that matches, None if no rule matches
+        :rtype: re.Match | None
+        """
+        for literal, pattern in rules:
+            if not literal:
+                if match := pattern.search(line):
+                    return match
+                continue
+
+            position = line.find(literal)
+            while position != -1:
+                if match := pattern.match(line, position):
+                    return match
+                position = line.find(literal, position + 1)
+        return None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Calls the callbacks matching the logged line, with the same ordering and flags semantics
+        as RegexHandler
+
+        :param record: The log record of the logged line
+        """
+        self._record_line(record.msg)
+        self._dispatch(self.match(record.msg))
+
+    def _record_line(self, line: str) -> None:
+        """Keeps the line in the recent lines"""
+        self.recent_lines.append(line)
+        self.last_line_time = time.monotonic()
+
+    def _dispatch(self, matches: list[re.Match | None]) -> None:
+        """
+        Calls the callbacks of the given matches, in the regex callbacks order
+
+        :param matches: Match for each of the regex callbacks, as returned by match()
+        """
+        matched = False
+        for regex_callback, match in zip(self.regex_callbacks, matches):
+            if matched and regex_callback.only_run_if_first_matched:
+                continue
+            if match:
+                regex_callback.callback(match)
+            if match and regex_callback.exit_if_matched:
+                break
+            matched = matched or match is not None
+
+
+class UnrealLogDispatcher(UnrealLogMatcher):
+    """
+    UnrealLogMatcher that calls the callbacks on its own thread.
+
+    LoggingSubprocess emits every line on the threads reading the Unreal stdout and stderr pipes.
+    If the callbacks ran there, a slow one (status update, telemetry) would stop the pipe reading
+    and UnrealEditor-Cmd would block on its stdout writes in the middle of the render.
+    So the reader threads only match the line and put the matches in a bounded buffer,
+    the callbacks are called by the dispatcher thread.
+
+    Lines that only match the coalescible callbacks (progress) may be replaced by a newer one:
+
+    1. A coalescible line replaces the coalescible line at the end of the buffer,
+       only the latest progress matters.
+    2. When the buffer is full, the oldest coalescible line is dropped.
+
+    Other lines (completion, errors) are never dropped: when the buffer is full of them,
+    the reader waits for the dispatcher to free some room.
+    """
+
+    _FLUSH_TIMEOUT_SECONDS = 30
+
+    def __init__(
+        self,
+        regex_callbacks: Sequence[RegexCallback],
+        coalescible_callbacks: Collection[Callable[[re.Match], None]] = (),
+        capacity: int = 1024,
+        level: int = logging.NOTSET,
+    ) -> None:
+        """
+        :param regex_callbacks: Regex callbacks to call for the matching lines
+        :param coalescible_callbacks: Callbacks whose lines may be coalesced or dropped,
+            only the latest call of them matters
+        :param capacity: Maximum number of matched lines waiting for the dispatcher thread
+        :param level: Handler logging level
+        """
+        super().__init__(regex_callbacks, level)
+
+        self._coalescible = [
+            regex_callback.callback in coalescible_callbacks
+            for regex_callback in self.regex_callbacks
+        ]
+        self._capacity = max(capacity, 1)
+
+        # Matched lines waiting for dispatch: (matches, coalescible)
+        self._pending: deque[tuple[list[re.Match | None], bool]] = deque()
+        self._pending_changed = threading.Condition()
+        self._dispatching = False
+        self._closed = False
+        self._coalesced_count = 0
+
+        self._dispatcher_thread = threading.Thread(
+            target=self._dispatch_pending, name="UnrealLogDispatcherThread", daemon=True
+        )
+        self._dispatcher_thread.start()
+
+    @property
+    def coalesced_count(self) -> int:
+        """Number of coalescible lines that were replaced or dropped before their dispatch"""
+        return self._coalesced_count
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Matches the logged line and puts the matches in the buffer of the dispatcher thread
+
+        :param record: The log record of the logged line
+        """
+        self._record_line(record.msg)
+        matches = self.match(record.msg)
+        if not any(matches):
+            return
+
+        coalescible = all(
+            match is None or coalescible for match, coalescible in zip(matches, self._coalescible)
+        )
+
+        with self._pending_changed:
+            if self._enqueue(matches, coalescible):
+                return
+
+        # No dispatcher thread anymore, the reader calls the callbacks itself
+        self._dispatch(matches)
+
+    def _enqueue(self, matches: list[re.Match | None], coalescible: bool) -> bool:
+        """
+        Puts the matches in the buffer, coalescing or dropping the coalescible lines when needed.
+        Must be called with the buffer condition held.
+
+        :param matches: Match for each of the regex callbacks, as returned by match()
+        :param coalescible: True if the line only matches coalescible callbacks
+
+        :return: False if the handler is closed and the matches must be dispatched by the caller
+        :rtype: bool
+        """
+        if self._closed:
+            return False
+
+        if coalescible and self._pending and self._pending[-1][1]:
+            self._pending[-1] = (matches, coalescible)
+            self._coalesced_count += 1
+            return True
+
+        if len(self._pending) >= self._capacity:
+            oldest_coalescible = next((item for item in self._pending if item[1]), None)
+            if oldest_coalescible is not None:
+                self._pending.remove(oldest_coalescible)
+                self._coalesced_count += 1
+            elif coalescible:
+                self._coalesced_count += 1
+                return True
+            else:
+                self._pending_changed.wait_for(
+                    lambda: len(self._pending) < self._capacity or self._closed
+                )
+                if self._closed:
+                    return False
+
+        self._pending.append((matches, coalescible))
+        self._pending_changed.notify_all()
+        return True
+
+    def _dispatch_pending(self) -> None:
+        """
+        Dispatcher thread loop: calls the callbacks of the buffered lines until the handler is
+        closed and the buffer is empty
+        """
+        while True:
+            with self._pending_changed:
+                self._dispatching = False
+                self._pending_changed.notify_all()
+                self._pending_changed.wait_for(lambda: bool(self._pending) or self._closed)
+                if not self._pending:
+                    return
+                matches, _ = self._pending.popleft()
+                self._dispatching = True
+                self._pending_changed.notify_all()
+
+            try:
+                self._dispatch(matches)
+            except Exception:
+                logger.exception("Unreal log callback failed")
+
+    def flush(self) -> None:
+        """
+        Blocks until the buffered lines are dispatched, or the flush timeout is reached
+        """
+        with self._pending_changed:
+            if not self._pending_changed.wait_for(
+                lambda: not self._pending and not self._dispatching,
+                timeout=self._FLUSH_TIMEOUT_SECONDS,
+            ):
+                logger.warning(
+                    f"{len(self._pending)} Unreal log lines were not dispatched "
+                    f"in {self._FLUSH_TIMEOUT_SECONDS} seconds"
+                )
+
+    def close(self) -> None:
+        """
+        Dispatches the buffered lines and stops the dispatcher thread.
+        Lines emitted after the closing are dispatched by the emitting thread.
+        """
+        with self._pending_changed:
+            self._closed = True
+            self._pending_changed.notify_all()
+        if self._dispatcher_thread is not threading.current_thread():
+            self._dispatcher_thread.join(timeout=self._FLUSH_TIMEOUT_SECONDS)
+        super().close()
@@ -0,0 +1,109 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import time
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+
+class PhaseProfiler:
+    """
+    Records the phases of the adaptor session and its tasks (server start, editor boot,
+    map load, render, shutdown...) and reports them by scope: the start of the session,
+    every task and the cleanup.
+
+    The adaptor measures its own phases with :meth:`start` and :meth:`end`, the phases measured
+    in Unreal are reported with their duration and recorded with :meth:`record`. A phase is
+    reported in the report of the scope it ended in.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        :param clock: Monotonic clock in seconds
+        """
+        self._clock = clock
+        # Phases are recorded by the adaptor thread and the server thread receiving Unreal events
+        self._lock = threading.Lock()
+        self._started_phases: dict[str, float] = {}
+        self._phases: list[tuple[str, float, float]] = []
+        self._report_start_time = clock()
+
+    def start(self, name: str) -> None:
+        """
+        Starts the phase, restarts it if it is started already
+
+        :param name: Phase name
+        """
+        with self._lock:
+            self._started_phases[name] = self._clock()
+
+    def end(self, name: str) -> float | None:
+        """
+        Ends the phase
+
+        :param name: Phase name
+
+        :return: Duration of the phase in seconds, None if the phase is not started
+        :rtype: float | None
+        """
+        end_time = self._clock()
+        with self._lock:
+            start_time = self._started_phases.pop(name, None)
+            if start_time is None:
+                return None
+            self._phases.append((name, start_time, end_time))
+        return end_time - start_time
+
+    def record(self, name: str, duration: float) -> None:
+        """
+        Records the phase that just ended, measured by another clock, e.g. in Unreal
+
+        :param name: Phase name
+        :param duration: Duration of the phase in seconds
+        """
+        end_time = self._clock()
+        with self._lock:
+            self._phases.append((name, end_time - duration, end_time))
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Measures the phase of the code block, also when it raises
+
+        :param name: Phase name
+        """
+        self.start(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def report(self, scope: str) -> dict:
+        """
+        Returns the report of the phases ended since the previous report, and starts the next one
+
+        :param scope: Scope of the report, e.g. "start", "task" or "cleanup"
+
+        :return: Scope, total duration and phases of the report, ordered by their start.
+            The phase start is relative to the start of the report, the times are in seconds.
+        :rtype: dict
+        """
+        end_time = self._clock()
+        with self._lock:
+            phases, self._phases = self._phases, []
+            report_start_time, self._report_start_time = self._report_start_time, end_time
+
+        return {
+            "scope": scope,
+            "total": round(end_time - report_start_time, 3),
+            "phases": [
+                {
+                    "name": name,
+                    "start": round(start_time - report_start_time, 3),
+                    "duration": round(phase_end_time - start_time, 3),
+                }
+                for name, start_time, phase_end_time in sorted(phases, key=lambda phase: phase[1])
+            ],
+        }
@@ -0,0 +1,346 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import sys
+import ctypes
+import signal
+import logging
+import subprocess
+
+try:
+    import psutil  # type: ignore
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+
+def get_child_pids(pid: int) -> list[int]:
+    """
+    Returns the IDs of all the descendant processes of the given process.
+    Uses psutil if it is installed, /proc otherwise.
+
+    :param pid: Process ID
+
+    :return: Descendant process IDs, empty if they can't be listed on this platform
+    :rtype: list[int]
+    """
+    if psutil is not None:
+        try:
+            return [child.pid for child in psutil.Process(pid).children(recursive=True)]
+        except Exception:
+            return []
+
+    if not os.path.isdir("/proc"):
+        return []
+
+    children: dict[int, list[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The process name may hold spaces, the parent ID is the 2nd field after it
+        parent_pid = int(stat[stat.rindex(")") + 2 :].split()[1])
+        children.setdefault(parent_pid, []).append(int(entry))
+
+    descendants = []
+    parents = [pid]
+    while parents:
+        child_pids = children.get(parents.pop(), [])
+        descendants.extend(child_pids)
+        parents.extend(child_pids)
+    return descendants
+
+
+class _JobObjectBasicLimitInformation(ctypes.Structure):
+    _fields_ = [
+        ("PerProcessUserTimeLimit", ctypes.c_int64),
+        ("PerJobUserTimeLimit", ctypes.c_int64),
+        ("LimitFlags", ctypes.c_uint32),
+        ("MinimumWorkingSetSize", ctypes.c_size_t),
+        ("MaximumWorkingSetSize", ctypes.c_size_t),
+        ("ActiveProcessLimit", ctypes.c_uint32),
+        ("Affinity", ctypes.c_size_t),
+        ("PriorityClass", ctypes.c_uint32),
+        ("SchedulingClass", ctypes.c_uint32),
+    ]
+
+
+class _JobObjectExtendedLimitInformation(ctypes.Structure):
+    _fields_ = [
+        ("BasicLimitInformation", _JobObjectBasicLimitInformation),
+        ("IoInfo", ctypes.c_uint64 * 6),
+        ("ProcessMemoryLimit", ctypes.c_size_t),
+        ("JobMemoryLimit", ctypes.c_size_t),
+        ("PeakProcessMemoryUsed", ctypes.c_size_t),
+        ("PeakJobMemoryUsed", ctypes.c_size_t),
+    ]
+
+
+class _JobObjectBasicAccountingInformation(ctypes.Structure):
+    _fields_ = [
+        ("TotalUserTime", ctypes.c_int64),
+        ("TotalKernelTime", ctypes.c_int64),
+        ("ThisPeriodTotalUserTime", ctypes.c_int64),
+        ("ThisPeriodTotalKernelTime", ctypes.c_int64),
+        ("TotalPageFaultCount", ctypes.c_uint32),
+        ("TotalProcesses", ctypes.c_uint32),
+        ("ActiveProcesses", ctypes.c_uint32),
+        ("TotalTerminatedProcesses", ctypes.c_uint32),
+    ]
+
+
+_JOB_OBJECT_BASIC_ACCOUNTING_INFORMATION = 1
+_JOB_OBJECT_EXTENDED_LIMIT_INFORMATION = 9
+_JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE = 0x2000
+_PROCESS_TERMINATE = 0x0001
+_PROCESS_SET_QUOTA = 0x0100
+
+
+def _load_kernel32() -> ctypes.CDLL:
+    """
+    Loads the Windows kernel32 functions of the Job Objects, typed so the handles are not
+    truncated to 32 bits
+    """
+    from ctypes import wintypes
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)  # type: ignore[attr-defined]
+    kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+    kernel32.CreateJobObjectW.argtypes = [ctypes.c_void_p, wintypes.LPCWSTR]
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    kernel32.SetInformationJobObject.argtypes = [
+        wintypes.HANDLE,
+        ctypes.c_int,
+        ctypes.c_void_p,
+        wintypes.DWORD,
+    ]
+    kernel32.QueryInformationJobObject.argtypes = [
+        wintypes.HANDLE,
+        ctypes.c_int,
+        ctypes.c_void_p,
+        wintypes.DWORD,
+        ctypes.c_void_p,
+    ]
+    kernel32.AssignProcessToJobObject.argtypes = [wintypes.HANDLE, wintypes.HANDLE]
+    kernel32.TerminateJobObject.argtypes = [wintypes.HANDLE, wintypes.UINT]
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    return kernel32
+
+
+class ProcessGroup:
+    """
+    Groups a launched process with all the processes it starts (e.g. the ShaderCompileWorker
+    and CrashReportClient processes of Unreal), so they can be killed once it is terminated
+    or crashed, even after they were reparented.
+
+    On POSIX the process is launched in a new session, its descendants stay in its process group
+    unless they start their own session. On Windows the process is assigned to a Job Object
+    right after its launch, the processes it starts from then on are in the job, which is killed
+    when the adaptor exits too.
+    """
+
+    def __init__(self) -> None:
+        self.pid: int | None = None
+        self._job: int | None = None
+
+    def get_popen_kwargs(self) -> dict:
+        """
+        Returns the subprocess.Popen keyword arguments launching the process of the group
+
+        :rtype: dict
+        """
+        if sys.platform == "win32":
+            # Also required by the CTRL_BREAK_EVENT terminating the process
+            return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+        return {"start_new_session": True}
+
+    def attach(self, pid: int) -> None:
+        """
+        Sets the launched process of the group
+
+        :param pid: ID of the process launched with :meth:`get_popen_kwargs`
+        """
+        self.pid = pid
+        if sys.platform != "win32":
+            return
+
+        kernel32 = _load_kernel32()
+        job = kernel32.CreateJobObjectW(None, None)
+        if not job:
+            logger.warning(f"Failed to create the Job Object of the process {pid}")
+            return
+        limits = _JobObjectExtendedLimitInformation()
+        limits.BasicLimitInformation.LimitFlags = _JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+        kernel32.SetInformationJobObject(
+            job,
+            _JOB_OBJECT_EXTENDED_LIMIT_INFORMATION,
+            ctypes.byref(limits),
+            ctypes.sizeof(limits),
+        )
+        process = kernel32.OpenProcess(_PROCESS_SET_QUOTA | _PROCESS_TERMINATE, False, pid)
+        assigned = process and kernel32.AssignProcessToJobObject(job, process)
+        if process:
+            kernel32.CloseHandle(process)
+        if not assigned:
+            logger.warning(f"Failed to assign the process {pid} to its Job Object")
+            kernel32.CloseHandle(job)
+            return
+        self._job = job
+
+    def kill(self) -> bool:
+        """
+        Kills the processes of the group. Called once the launched process exited,
+        the processes it left are killed.
+
+        :return: True if processes of the group were still running, False otherwise
+        :rtype: bool
+        """
+        if self.pid is None:
+            return False
+
+        if sys.platform != "win32":
+            # The group ID is the ID of the session leader, it stays reserved while the group
+            # has processes. The group is killed once, its ID may be reused afterwards.
+            group_id, self.pid = self.pid, None
+            try:
+                os.killpg(group_id, signal.SIGKILL)  # type: ignore[attr-defined]
+            except OSError:
+                return False
+            return True
+
+        if self._job is None:
+            return False
+        kernel32 = _load_kernel32()
+        accounting = _JobObjectBasicAccountingInformation()
+        kernel32.QueryInformationJobObject(
+            self._job,
+            _JOB_OBJECT_BASIC_ACCOUNTING_INFORMATION,
+            ctypes.byref(accounting),
+            ctypes.sizeof(accounting),
+            None,
+        )
+        kernel32.TerminateJobObject(self._job, 1)
+        kernel32.CloseHandle(self._job)
+        self._job = None
+        return accounting.ActiveProcesses > 0
+
+
+def get_process_rss(pid: int) -> int | None:
+    """
+    Returns the resident set size of the process.
+    Uses psutil if it is installed, /proc otherwise.
+
+    :param pid: Process ID
+
+    :return: Resident set size in bytes or None if it can't be read on this platform
+    :rtype: int | None
+    """
+    try:
+        if psutil is not None:
+            return psutil.Process(pid).memory_info().rss
+
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return None
+
+
+def get_process_tree_rss(pid: int) -> int | None:
+    """
+    Returns the resident set size of the process and all its descendants
+    (e.g. the shader compile workers of Unreal)
+
+    :param pid: Process ID of the tree root
+
+    :return: Resident set size in bytes or None if it can't be read on this platform
+    :rtype: int | None
+    """
+    rss = get_process_rss(pid)
+    if rss is None:
+        return None
+    return rss + sum(get_process_rss(child_pid) or 0 for child_pid in get_child_pids(pid))
+
+
+#: Niceness of the launch profile priorities on POSIX
+POSIX_PRIORITY_NICENESS = {
+    "idle": 19,
+    "below_normal": 10,
+    "normal": 0,
+    "above_normal": -5,
+    "high": -10,
+}
+
+#: psutil priority classes of the launch profile priorities on Windows
+WINDOWS_PRIORITY_CLASSES = {
+    "idle": "IDLE_PRIORITY_CLASS",
+    "below_normal": "BELOW_NORMAL_PRIORITY_CLASS",
+    "normal": "NORMAL_PRIORITY_CLASS",
+    "above_normal": "ABOVE_NORMAL_PRIORITY_CLASS",
+    "high": "HIGH_PRIORITY_CLASS",
+}
+
+
+def _get_thread_ids(pid: int) -> list[int]:
+    """
+    Returns the IDs of the threads of the process on Linux, where the scheduling settings
+    are per thread, or the process ID on the other platforms
+    """
+    try:
+        return [int(tid) for tid in os.listdir(f"/proc/{pid}/task")]
+    except OSError:
+        return [pid]
+
+
+def set_process_affinity(pid: int, cpus: list[int]) -> bool:
+    """
+    Pins the process to the given CPUs. The threads and the child processes it starts later
+    inherit the affinity.
+
+    :param pid: Process ID
+    :param cpus: Indices of the CPUs
+
+    :return: True if the affinity is set, False if it can't be set on this platform
+    :rtype: bool
+    """
+    try:
+        if hasattr(os, "sched_setaffinity"):
+            for tid in _get_thread_ids(pid):
+                os.sched_setaffinity(tid, cpus)
+            return True
+        if psutil is not None:
+            psutil.Process(pid).cpu_affinity(cpus)
+            return True
+    except Exception:
+        pass
+    return False
+
+
+def set_process_priority(pid: int, priority: str) -> bool:
+    """
+    Sets the scheduling priority of the process. The threads and the child processes it starts
+    later inherit the priority. Raising the priority above normal usually requires privileges.
+
+    :param pid: Process ID
+    :param priority: One of "idle", "below_normal", "normal", "above_normal" or "high"
+
+    :return: True if the priority is set, False if it can't be set on this platform
+    :rtype: bool
+    """
+    try:
+        if sys.platform == "win32":
+            if psutil is None:
+                return False
+            psutil.Process(pid).nice(getattr(psutil, WINDOWS_PRIORITY_CLASSES[priority]))
+            return True
+        for tid in _get_thread_ids(pid):
+            os.setpriority(os.PRIO_PROCESS, tid, POSIX_PRIORITY_NICENESS[priority])
+        return True
+    except Exception:
+        return False
@@ -0,0 +1,115 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Callable, NamedTuple
+
+
+class ProgressSample(NamedTuple):
+    time: float
+    progress: float
+    frames_done: int | None
+
+
+def format_duration(seconds: float) -> str:
+    """
+    Returns the duration in the hours, minutes and seconds the operators read, e.g. "1h 05m"
+
+    :param seconds: Duration in seconds
+
+    :return: Formatted duration
+    :rtype: str
+    """
+    seconds = int(round(seconds))
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    if minutes:
+        return f"{minutes}m {seconds:02d}s"
+    return f"{seconds}s"
+
+
+class ProgressEstimator:
+    """
+    Estimates the throughput of the run and its remaining time from the moving average
+    of its progress: the progress samples of the last window are kept, so the estimation follows
+    the shots of different cost instead of the average of the whole render.
+    The throughput is counted in output frames, the frames the render writes.
+    """
+
+    def __init__(
+        self, window_seconds: float = 60.0, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        :param window_seconds: Duration of the moving average window in seconds
+        :param clock: Monotonic clock in seconds
+        """
+        self._window_seconds = window_seconds
+        self._clock = clock
+        self._samples: deque[ProgressSample] = deque()
+        self._activity = "Rendering"
+
+    def reset(self, activity: str = "Rendering") -> None:
+        """
+        Start the estimation of a new run
+
+        :param activity: Activity of the run the status message starts with, e.g. "Running"
+            for a custom script
+        """
+        self._samples.clear()
+        self._activity = activity
+
+    def update(self, progress: float, frames_done: int | None = None) -> None:
+        """
+        Adds the progress sample of the run
+
+        :param progress: Progress in percent
+        :param frames_done: Number of output frames rendered, None if it's unknown
+        """
+        now = self._clock()
+        self._samples.append(ProgressSample(now, progress, frames_done))
+        # The last two samples are kept when a frame takes longer than the window
+        while len(self._samples) > 2 and now - self._samples[0].time > self._window_seconds:
+            self._samples.popleft()
+
+    @property
+    def frames_per_minute(self) -> float | None:
+        """Output frames rendered per minute, None if there are not enough frame samples"""
+        if len(self._samples) < 2:
+            return None
+        first, last = self._samples[0], self._samples[-1]
+        if first.frames_done is None or last.frames_done is None or last.time <= first.time:
+            return None
+        return (last.frames_done - first.frames_done) / (last.time - first.time) * 60
+
+    @property
+    def eta_seconds(self) -> float | None:
+        """Remaining time of the run in seconds, None if the progress rate is unknown"""
+        if len(self._samples) < 2:
+            return None
+        first, last = self._samples[0], self._samples[-1]
+        if last.progress <= first.progress or last.time <= first.time:
+            return None
+        rate = (last.progress - first.progress) / (last.time - first.time)
+        return max(100 - last.progress, 0) / rate
+
+    def get_status_message(self) -> str:
+        """
+        Returns the status message of the run for the worker,
+        e.g. "Rendering 45%, 12.0 frames/min, ETA 4m 10s"
+
+        :rtype: str
+        """
+        if not self._samples:
+            return self._activity
+        parts = [f"{self._activity} {int(self._samples[-1].progress)}%"]
+        frames_per_minute = self.frames_per_minute
+        if frames_per_minute is not None:
+            parts.append(f"{frames_per_minute:.1f} frames/min")
+        eta_seconds = self.eta_seconds
+        if eta_seconds is not None:
+            parts.append(f"ETA {format_duration(eta_seconds)}")
+        return ", ".join(parts)
@@ -0,0 +1,148 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Callable, Iterable
+
+try:
+    import psutil  # type: ignore
+except ImportError:
+    psutil = None
+
+
+def get_process_cpu_seconds(pid: int) -> float | None:
+    """
+    Returns the CPU time (user and system) the process has used so far.
+    Uses psutil if it is installed, /proc otherwise.
+
+    :param pid: Process ID
+
+    :return: CPU time in seconds or None if it can't be read on this platform
+    :rtype: float | None
+    """
+    try:
+        if psutil is not None:
+            cpu_times = psutil.Process(pid).cpu_times()
+            return cpu_times.user + cpu_times.system
+
+        with open(f"/proc/{pid}/stat") as f:
+            stat = f.read()
+        # The process name may hold spaces, the fields after it are space separated:
+        # state is the 3rd field, utime and stime are the 14th and 15th ones
+        fields = stat[stat.rindex(")") + 2 :].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except Exception:
+        return None
+
+
+class ProgressWatchdog:
+    """
+    Tracks the time since the last progress of the current Unreal phase (startup or run)
+    and tells when it is longer than the stall timeout of the phase.
+
+    Also samples the CPU time of the Unreal process on every check, so the diagnostics tell
+    a deadlocked Unreal (no CPU usage) from a busy one (e.g. compiling shaders).
+    """
+
+    def __init__(
+        self,
+        get_pid: Callable[[], int | None],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param get_pid: Function returning the Unreal process ID, None if it is not running
+        :param clock: Monotonic clock in seconds
+        """
+        self._get_pid = get_pid
+        self._clock = clock
+        self.phase = ""
+        self.stall_timeout: float = 0
+        self._last_progress_time = clock()
+        self._cpu_sample: tuple[float, float] | None = None
+        self._cpu_usage: tuple[float, float] | None = None
+
+    def start(self, phase: str, stall_timeout: float) -> None:
+        """
+        Starts tracking the progress of the given phase
+
+        :param phase: Name of the phase, e.g. "startup" or "render"
+        :param stall_timeout: Maximum time in seconds without progress, 0 to never stall
+        """
+        self.phase = phase
+        self.stall_timeout = stall_timeout
+        self._last_progress_time = self._clock()
+        self._cpu_sample = None
+        self._cpu_usage = None
+
+    def progress(self, at: float | None = None) -> None:
+        """
+        Records the progress of the current phase
+
+        :param at: Clock time of the progress, now if None
+        """
+        at = self._clock() if at is None else at
+        if at > self._last_progress_time:
+            self._last_progress_time = at
+
+    @property
+    def stalled_seconds(self) -> float:
+        """Time in seconds since the last progress"""
+        return self._clock() - self._last_progress_time
+
+    def check(self) -> bool:
+        """
+        Samples the Unreal CPU time and tells if the phase is stalled
+
+        :return: True if there was no progress for longer than the stall timeout
+        :rtype: bool
+        """
+        self._cpu_usage = self._sample_cpu()
+        return 0 < self.stall_timeout < self.stalled_seconds
+
+    def _sample_cpu(self) -> tuple[float, float] | None:
+        """
+        Samples the Unreal CPU time
+
+        :return: CPU usage percent since the previous sample and the total CPU time,
+            None if there is no previous sample or the CPU time can't be read
+        :rtype: tuple[float, float] | None
+        """
+        pid = self._get_pid()
+        cpu_seconds = get_process_cpu_seconds(pid) if pid is not None else None
+        if cpu_seconds is None:
+            self._cpu_sample = None
+            return None
+
+        now = self._clock()
+        previous_sample, self._cpu_sample = self._cpu_sample, (now, cpu_seconds)
+        if previous_sample is None or now <= previous_sample[0]:
+            return None
+        usage = (cpu_seconds - previous_sample[1]) / (now - previous_sample[0]) * 100
+        return usage, cpu_seconds
+
+    def diagnostics(self, recent_lines: Iterable[str]) -> str:
+        """
+        Describes the stall: its duration, the Unreal CPU usage and the last Unreal log lines
+
+        :param recent_lines: Last Unreal log lines
+
+        :return: Diagnostics text
+        :rtype: str
+        """
+        cpu_usage = self._cpu_usage
+        lines = [
+            f"Unreal made no {self.phase} progress for {self.stalled_seconds:.0f} seconds "
+            f"(stall timeout {self.stall_timeout:.0f} seconds).",
+            (
+                f"Unreal process CPU usage: {cpu_usage[0]:.1f}% over the last check, "
+                f"{cpu_usage[1]:.1f} seconds in total."
+                if cpu_usage is not None
+                else "Unreal process CPU usage: unavailable."
+            ),
+        ]
+        recent_lines = list(recent_lines)
+        lines.append(f"Last {len(recent_lines)} Unreal log lines:")
+        lines.extend(recent_lines)
+        return os.linesep.join(lines)
@@ -0,0 +1,83 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+import sys
+import time
+import queue
+import threading
+from http import HTTPStatus
+from typing import Callable, Optional, Tuple
+
+from openjd.adaptor_runtime_client import Action
+
+
+class ActionPoller:
+    """
+    Long polls the adaptor server for the next actions on a background thread.
+
+    The adaptor server answers the action request only when it has an action, so the request can
+    block for the whole render. The poller keeps this wait off the game thread: received actions
+    are put in a queue the game thread empties on its next tick with
+    :meth:`deadline.unreal_adaptor.UnrealClient.action_poller.ActionPoller.get_actions()`.
+    Polling stops after the "close" action.
+    """
+
+    _ERROR_RETRY_SECONDS = 1
+
+    def __init__(self, request_next_action: Callable[[], Tuple[int, str, Optional[Action]]]):
+        """
+        :param request_next_action: Function requesting the next action from the adaptor server,
+            returns the response status, reason and the action
+        """
+        self._request_next_action = request_next_action
+        self._actions: "queue.Queue[Action]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_polling(self) -> bool:
+        """True while the polling thread waits for the actions"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the polling thread, if it is not started yet"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._poll, name="UnrealClientActionPollerThread", daemon=True
+        )
+        self._thread.start()
+
+    def get_actions(self) -> list[Action]:
+        """
+        Returns the actions received since the last call, without blocking
+
+        :return: List of the received actions in the order the server sent them
+        """
+        actions = []
+        while True:
+            try:
+                actions.append(self._actions.get_nowait())
+            except queue.Empty:
+                return actions
+
+    def _poll(self) -> None:
+        """Polling thread loop: requests the actions until the "close" one"""
+        while True:
+            try:
+                status, reason, action = self._request_next_action()
+            except Exception as e:
+                status, reason, action = HTTPStatus.SERVICE_UNAVAILABLE, str(e), None
+
+            if status != HTTPStatus.OK:
+                print(
+                    f"ERROR: An error was raised when trying to connect to the server: {status} "
+                    f"{reason}",
+                    file=sys.stderr,
+                    flush=True,
+                )
+                time.sleep(self._ERROR_RETRY_SECONDS)
+                continue
+
+            if action is not None:
+                self._actions.put(action)
+                if action.name == "close":
+                    return
@@ -0,0 +1,76 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+"""
+Asset registry warm up of the UnrealClient session.
+
+The adaptor asks the UnrealClient to warm the asset registry once, right after the editor
+starts, with the content paths the job references. The step handlers then don't wait for the
+registry scan of the project on every run.
+"""
+
+try:
+    import unreal
+except Exception:
+    unreal = None
+
+from typing import Iterable, Optional
+
+from . import step_events
+
+
+_is_warmed = False
+
+
+def get_scan_paths(asset_paths: Iterable[str]) -> list[str]:
+    """
+    Returns the content directories to scan for the given asset or directory paths
+
+    :param asset_paths: Unreal paths, e.g. /Game/Maps/Level.Level, /Game/Maps/Level or /Game/Maps/,
+        empty ones are ignored
+
+    :return: Unique content directories, e.g. /Game/Maps
+    :rtype: list[str]
+    """
+    scan_paths: list[str] = []
+    for asset_path in asset_paths:
+        asset_path = asset_path.strip().replace("\\", "/")
+        if not asset_path.startswith("/"):
+            continue
+        if asset_path.endswith("/"):
+            scan_path = asset_path.rstrip("/")
+        else:
+            # The object name follows the package name after the dot
+            scan_path = asset_path.split(".")[0].rsplit("/", 1)[0]
+        if scan_path and scan_path not in scan_paths:
+            scan_paths.append(scan_path)
+    return scan_paths
+
+
+def warm_asset_registry(asset_paths: Optional[Iterable[str]] = None) -> None:
+    """
+    Scans the content directories of the given paths synchronously first, then waits for
+    the full scan of the project: the job assets may reference the assets of other directories.
+
+    :param asset_paths: Unreal paths the job references, see :func:`get_scan_paths`
+    """
+    global _is_warmed
+
+    asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    scan_paths = get_scan_paths(asset_paths or [])
+    with step_events.phase("asset_registry"):
+        if scan_paths:
+            unreal.log(f"Asset registry: scanning {scan_paths}")
+            asset_registry.scan_paths_synchronous(scan_paths, force_rescan=False)
+        unreal.log("Asset registry: waiting for the full scan")
+        asset_registry.wait_for_completion()
+
+    _is_warmed = True
+
+
+def wait_for_asset_registry() -> None:
+    """
+    Makes sure the asset registry is warmed for the run. Waits for the full scan of the project
+    only if the asset registry was not warmed in this session yet.
+    """
+    if not _is_warmed:
+        warm_asset_registry()
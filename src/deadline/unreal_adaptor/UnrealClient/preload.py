@@ -0,0 +1,104 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+"""
+Map and level sequence preloading of the UnrealClient session.
+
+The adaptor asks the UnrealClient to load the map and the level sequence of the job right after
+the editor starts, while the worker waits for the first task. The map stays the editor world,
+so the render executor doesn't load it again for the runs rendering the same map, and the
+loaded assets are kept referenced for the whole session.
+"""
+
+try:
+    import unreal
+except Exception:
+    unreal = None
+
+from typing import Any
+
+from . import step_events
+
+
+_loaded_assets: dict[str, Any] = {}
+
+
+def get_package_name(asset_path: str) -> str:
+    """
+    Returns the package name of the asset path, e.g. /Game/Maps/Level for /Game/Maps/Level.Level
+
+    :param asset_path: Unreal object path or package name
+
+    :return: Package name
+    :rtype: str
+    """
+    return asset_path.strip().split(".")[0]
+
+
+def load_asset(asset_path: str) -> Any:
+    """
+    Returns the asset loaded in this session, loads it if it is not loaded yet
+
+    :param asset_path: Unreal path to the asset, e.g. /Game/Cinematics/Sequence.Sequence
+
+    :return: Loaded asset or None if it could not be loaded
+    """
+    package_name = get_package_name(asset_path)
+    asset = _loaded_assets.get(package_name)
+    if asset is None:
+        asset = unreal.load_asset(asset_path)
+        if asset is not None:
+            _loaded_assets[package_name] = asset
+    return asset
+
+
+def is_level_loaded(level_path: str) -> bool:
+    """
+    Tells if the level is the current editor world
+
+    :param level_path: Unreal path to the level, e.g. /Game/Maps/Level.Level
+
+    :return: True if the level is loaded in the editor, False otherwise
+    :rtype: bool
+    """
+    world = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_editor_world()
+    return world is not None and get_package_name(world.get_path_name()) == get_package_name(
+        level_path
+    )
+
+
+def load_level(level_path: str) -> bool:
+    """
+    Loads the level as the editor world unless it is loaded already
+
+    :param level_path: Unreal path to the level, e.g. /Game/Maps/Level.Level
+
+    :return: True if the level is loaded in the editor, False otherwise
+    :rtype: bool
+    """
+    if is_level_loaded(level_path):
+        unreal.log(f"Preload: level {level_path} is already loaded")
+        return True
+
+    unreal.log(f"Preload: loading level {level_path}")
+    return unreal.get_editor_subsystem(unreal.LevelEditorSubsystem).load_level(
+        get_package_name(level_path)
+    )
+
+
+def preload(level_path: str = "", level_sequence_path: str = "") -> None:
+    """
+    Loads the map and the level sequence of the job
+
+    :param level_path: Unreal path to the level, skipped if empty
+    :param level_sequence_path: Unreal path to the level sequence, skipped if empty
+    """
+    if level_path:
+        with step_events.phase("map_load"):
+            if not load_level(level_path):
+                unreal.log_warning(f"Preload: failed to load level {level_path}")
+
+    if level_sequence_path:
+        unreal.log(f"Preload: loading level sequence {level_sequence_path}")
+        with step_events.phase("sequence_load"):
+            if load_asset(level_sequence_path) is None:
+                unreal.log_warning(f"Preload: failed to load level sequence {level_sequence_path}")
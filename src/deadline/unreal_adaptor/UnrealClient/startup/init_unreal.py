@@ -0,0 +1,19 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+"""
+Startup script of the game render mode. The adaptor adds this directory to UE_PYTHONPATH,
+so Unreal runs the script before the MRQ command line executor is created, and registers the
+executor class the -ExecutorPythonClass argument refers to.
+"""
+
+import os
+import sys
+
+if "PYTHONPATH" in os.environ:
+    for p in os.environ["PYTHONPATH"].split(os.pathsep):
+        if p not in sys.path:
+            sys.path.insert(0, p.replace("\\", "/"))
+
+from deadline.unreal_adaptor.UnrealClient.step_handlers import (  # noqa: E402, F401
+    unreal_game_render_executor,
+)
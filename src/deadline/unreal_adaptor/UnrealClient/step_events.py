@@ -0,0 +1,147 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+"""
+Typed step events the UnrealClient sends to the UnrealAdaptor server.
+
+Step handlers and their executors call :func:`send_event` next to the log line they print,
+the UnrealClient installs the sender with :func:`set_event_sender`. The adaptor falls back to
+the log lines when no event reaches it (e.g. no sender is installed).
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+EVENT_REQUEST_PATH = "/unreal_event"
+
+STARTED = "started"  # Step started running, args: none
+PROGRESS = "progress"  # Step progress, args: progress (0-100)
+FRAME_DONE = "frame_done"  # Render frame done, args: frame, total
+COMPLETE = "complete"  # Step completed, args: result (optional)
+ERROR = "error"  # Step failed, args: message
+EXIT_READY = "exit_ready"  # Outputs and logs are flushed, Unreal may be killed, args: none
+PHASE = "phase"  # Phase of the step ended, args: phase (name), duration (seconds)
+
+
+_event_sender: Optional[Callable[[str, dict], bool]] = None
+
+# Start times of the phases measured in Unreal by their names
+_phase_start_times: Dict[str, float] = {}
+
+
+def set_event_sender(sender: Optional[Callable[[str, dict], bool]]) -> None:
+    """
+    Set the function that sends the events to the adaptor
+
+    :param sender: Function that sends the event name and arguments and returns True if the event
+        was delivered. None to stop sending events.
+    """
+    global _event_sender
+    _event_sender = sender
+
+
+def send_event(name: str, **args: Any) -> bool:
+    """
+    Send the step event to the adaptor
+
+    :param name: Event name, one of STARTED, PROGRESS, FRAME_DONE, COMPLETE, ERROR
+    :param args: Event arguments
+
+    :return: True if the event was delivered, False otherwise
+    """
+    if _event_sender is None:
+        return False
+    return _event_sender(name, args)
+
+
+def start_phase(name: str) -> None:
+    """
+    Start measuring the phase, see :func:`end_phase`
+
+    :param name: Phase name, e.g. "map_load"
+    """
+    _phase_start_times[name] = time.monotonic()
+
+
+def end_phase(name: str) -> bool:
+    """
+    End the phase and send its duration to the adaptor with the PHASE event
+
+    :param name: Phase name
+
+    :return: True if the event was delivered, False otherwise or if the phase is not started
+    """
+    start_time = _phase_start_times.pop(name, None)
+    if start_time is None:
+        return False
+    return send_event(PHASE, phase=name, duration=time.monotonic() - start_time)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """
+    Measure the phase of the code block and send its duration to the adaptor
+
+    :param name: Phase name
+    """
+    start_phase(name)
+    try:
+        yield
+    finally:
+        end_phase(name)
+
+
+class ProgressCoalescer:
+    """
+    Tells which progress values are worth reporting, so a render reports a few hundred progress
+    updates instead of one per engine frame: the first value, the values that changed by the
+    minimum step since the last reported one, the changed values once the minimum interval
+    elapsed and the completion.
+
+    Used by the render executors in Unreal and by the adaptor for the worker status.
+    """
+
+    def __init__(
+        self,
+        min_step: float = 1.0,
+        min_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param min_step: Minimum progress change in percent
+        :param min_interval: Minimum time between two reported values in seconds,
+            if the progress changed by less than the minimum step
+        :param clock: Monotonic clock in seconds
+        """
+        self._min_step = min_step
+        self._min_interval = min_interval
+        self._clock = clock
+        self._last_progress: Optional[float] = None
+        self._last_report_time = 0.0
+
+    def reset(self) -> None:
+        """Start a new render, its first value is reported"""
+        self._last_progress = None
+
+    def should_report(self, progress: float) -> bool:
+        """
+        Tells if the progress should be reported, remembers it as the last reported one if so
+
+        :param progress: Progress in percent
+
+        :return: True if the progress should be reported, False otherwise
+        """
+        now = self._clock()
+        last_progress = self._last_progress
+        if not (
+            last_progress is None
+            or (progress >= 100 and last_progress < 100)
+            or abs(progress - last_progress) >= self._min_step
+            or (progress != last_progress and now - self._last_report_time >= self._min_interval)
+        ):
+            return False
+
+        self._last_progress = progress
+        self._last_report_time = now
+        return True
@@ -35,7 +35,12 @@ class BaseStepHandler(ABC):
     @staticmethod
     @abstractmethod
     def regex_pattern_progress() -> list[re.Pattern]:
-        """Returns a list of regex Patterns that match the progress messages"""
+        """
+        Returns a list of regex Patterns that match the progress messages.
+
+        Patterns of all the regex_pattern_* methods should start with a literal text
+        (e.g. "Render Executor: "), which the adaptor uses to skip the other log lines cheaply.
+        """
         raise NotImplementedError("Abstract method, need to be implemented")
 
     @staticmethod
@@ -0,0 +1,313 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+import os
+import re
+import struct
+from typing import BinaryIO, Optional, Pattern, Tuple
+
+
+#: Image file extensions and the bytes their files start with
+IMAGE_FILE_HEADERS = {
+    ".png": b"\x89PNG\r\n\x1a\n",
+    ".jpg": b"\xff\xd8\xff",
+    ".jpeg": b"\xff\xd8\xff",
+    ".exr": b"\x76\x2f\x31\x01",
+    ".bmp": b"BM",
+}
+
+#: Image file extensions and the bytes their complete files end with
+IMAGE_FILE_TRAILERS = {
+    ".png": b"IEND\xae\x42\x60\x82",
+    ".jpg": b"\xff\xd9",
+    ".jpeg": b"\xff\xd9",
+}
+
+#: Files smaller than this are treated as not written completely
+MIN_IMAGE_FILE_SIZE = 64
+
+#: Format token of the MRQ output file name, e.g. {sequence_name}
+FORMAT_TOKEN_PATTERN = re.compile(r"\{([^{}]+)\}")
+
+#: Scan lines per chunk of the EXR compressions, by the value of the compression attribute
+EXR_LINES_PER_CHUNK = {0: 1, 1: 1, 2: 1, 3: 16, 4: 32, 5: 16, 6: 32, 7: 32, 8: 32, 9: 256}
+
+# EXR version flags
+_EXR_TILED = 0x200
+_EXR_MULTIPART = 0x1000
+
+
+def get_asset_name(asset_path: str) -> str:
+    """
+    Returns the name of the asset, e.g. Shot_010 for /Game/Sequences/Shot_010.Shot_010
+
+    :param asset_path: Unreal object path of the asset
+
+    :return: Asset name
+    :rtype: str
+    """
+    return asset_path.strip("'\"").rsplit("/", 1)[-1].rsplit(".", 1)[-1]
+
+
+def get_output_file_pattern(file_name_format: str, format_args: dict) -> Pattern[str]:
+    """
+    Returns the pattern of the output file paths of the MRQ job, relative to its output directory
+    and without extension. The {frame_number} token is the captured "frame" group, the tokens of
+    the format arguments are their values and the other tokens (render pass, camera, date)
+    match any name. MRQ appends the frame number when the format has none, and the render pass
+    and the camera name when it writes several of them.
+
+    :param file_name_format: File name format of the MRQ output setting,
+        e.g. "{sequence_name}.{frame_number}"
+    :param format_args: Values of the format tokens known before the render, e.g. sequence_name
+
+    :return: Compiled pattern
+    :rtype: Pattern[str]
+    """
+    file_name_format = file_name_format.replace("\\", "/")
+    if "{frame_number}" not in file_name_format:
+        file_name_format += ".{frame_number}"
+
+    parts = []
+    position = 0
+    for match in FORMAT_TOKEN_PATTERN.finditer(file_name_format):
+        parts.append(re.escape(file_name_format[position : match.start()]))
+        token = match.group(1)
+        if token == "frame_number":
+            parts.append("(?P=frame)" if "(?P<frame>" in "".join(parts) else "(?P<frame>-?[0-9]+)")
+        elif token in format_args:
+            parts.append(re.escape(str(format_args[token])))
+        else:
+            parts.append("[^/]*?")
+        position = match.end()
+    parts.append(re.escape(file_name_format[position:]))
+    return re.compile("".join(parts) + "[^/]*")
+
+
+def _read_exr_string(f: BinaryIO) -> bytes:
+    """Reads the null terminated string of the EXR header"""
+    value = bytearray()
+    while True:
+        byte = f.read(1)
+        if not byte or len(value) > 255:
+            raise ValueError("Invalid EXR header")
+        if byte == b"\0":
+            return bytes(value)
+        value += byte
+
+
+def _read_exr_header(f: BinaryIO) -> dict[str, bytes]:
+    """Reads the attributes of an EXR header, empty for the end of the multi-part headers"""
+    attributes: dict[str, bytes] = {}
+    while True:
+        name = _read_exr_string(f)
+        if not name:
+            return attributes
+        _read_exr_string(f)  # type
+        (size,) = struct.unpack("<i", f.read(4))
+        value = f.read(size)
+        if size < 0 or len(value) != size:
+            raise ValueError("Invalid EXR header")
+        attributes[name.decode("ascii", "replace")] = value
+
+
+def _get_exr_level_count(size: int, round_up: bool) -> int:
+    """Returns the number of mipmap levels of the EXR image size"""
+    return ((size - 1).bit_length() if round_up else size.bit_length() - 1) + 1
+
+
+def _get_exr_level_size(size: int, level: int, round_up: bool) -> int:
+    """Returns the size of the EXR mipmap level"""
+    level_size = (size + (1 << level) - 1) >> level if round_up else size >> level
+    return max(level_size, 1)
+
+
+def _get_exr_chunk_count(attributes: dict[str, bytes], tiled: bool) -> int:
+    """
+    Returns the number of chunks of the EXR part, the entries of its offset table
+
+    :raises ValueError: If the chunks can't be counted
+    """
+    if "chunkCount" in attributes:
+        return struct.unpack("<i", attributes["chunkCount"])[0]
+
+    x_min, y_min, x_max, y_max = struct.unpack("<4i", attributes["dataWindow"])
+    width, height = x_max - x_min + 1, y_max - y_min + 1
+    if not tiled:
+        lines_per_chunk = EXR_LINES_PER_CHUNK[attributes["compression"][0]]
+        return -(-height // lines_per_chunk)
+
+    tile_width, tile_height, mode = struct.unpack("<IIB", attributes["tiles"])
+    level_mode, round_up = mode & 0xF, bool(mode >> 4 & 1)
+
+    def tile_count(level_width: int, level_height: int) -> int:
+        return -(-level_width // tile_width) * -(-level_height // tile_height)
+
+    if level_mode == 0:
+        return tile_count(width, height)
+    if level_mode == 1:
+        return sum(
+            tile_count(
+                _get_exr_level_size(width, level, round_up),
+                _get_exr_level_size(height, level, round_up),
+            )
+            for level in range(_get_exr_level_count(max(width, height), round_up))
+        )
+    if level_mode == 2:
+        return sum(
+            tile_count(
+                _get_exr_level_size(width, x_level, round_up),
+                _get_exr_level_size(height, y_level, round_up),
+            )
+            for x_level in range(_get_exr_level_count(width, round_up))
+            for y_level in range(_get_exr_level_count(height, round_up))
+        )
+    raise ValueError(f"Unknown EXR level mode {level_mode}")
+
+
+def _is_complete_exr(f: BinaryIO, file_size: int) -> bool:
+    """
+    Checks the EXR file after its magic number: the offset table of its chunks lies inside
+    the file and its last chunk ends inside the file. The EXR writer fills the offset table
+    when it closes the file, an interrupted write leaves zeros or offsets past its end.
+    """
+    (flags,) = struct.unpack("<i", f.read(4))
+    multipart = bool(flags & _EXR_MULTIPART)
+    headers = []
+    while True:
+        attributes = _read_exr_header(f)
+        if not attributes:
+            break
+        headers.append(attributes)
+        if not multipart:
+            break
+
+    # Part index, tiled part and deep part by chunk offset
+    chunks: dict[int, Tuple[bool, bool]] = {}
+    for attributes in headers:
+        part_type = attributes.get("type", b"").rstrip(b"\0")
+        tiled = part_type in (b"tiledimage", b"deeptile") or (
+            not part_type and bool(flags & _EXR_TILED)
+        )
+        chunk_count = _get_exr_chunk_count(attributes, tiled)
+        offsets = struct.unpack(f"<{chunk_count}Q", f.read(8 * chunk_count))
+        if any(offset <= 0 or offset >= file_size for offset in offsets):
+            return False
+        for offset in offsets:
+            chunks[offset] = (tiled, part_type.startswith(b"deep"))
+
+    if not chunks:
+        return False
+    last_offset = max(chunks)
+    tiled, deep = chunks[last_offset]
+    if deep:
+        # The deep chunks hold several sizes, the offsets are checked only
+        return True
+    # Part number of the multi-part files, then the tile coordinates or the scan line
+    f.seek(last_offset + (4 if multipart else 0) + (16 if tiled else 4))
+    (data_size,) = struct.unpack("<i", f.read(4))
+    return data_size >= 0 and f.tell() + data_size <= file_size
+
+
+def is_complete_image(path: str) -> bool:
+    """
+    Sanity check of the rendered image file: the file has a plausible size, starts with the
+    header of its format and, for the formats that have one, ends with its trailer.
+    The EXR files have no trailer, their offset table must fit inside the file.
+    Catches the files truncated by the interrupted render.
+
+    :param path: Path to the image file
+
+    :return: True if the image looks complete, False otherwise
+    :rtype: bool
+    """
+    extension = os.path.splitext(path)[1].lower()
+    header = IMAGE_FILE_HEADERS.get(extension)
+    if header is None:
+        return False
+
+    try:
+        file_size = os.path.getsize(path)
+        if file_size < MIN_IMAGE_FILE_SIZE:
+            return False
+        with open(path, "rb") as f:
+            if f.read(len(header)) != header:
+                return False
+            if extension == ".exr":
+                return _is_complete_exr(f, file_size)
+            trailer = IMAGE_FILE_TRAILERS.get(extension)
+            if trailer is not None:
+                f.seek(-len(trailer), os.SEEK_END)
+                return f.read(len(trailer)) == trailer
+    except (OSError, ValueError, KeyError, IndexError, struct.error):
+        return False
+    return True
+
+
+def get_complete_frames(
+    output_directory: str, file_pattern: Pattern[str], written_since: Optional[float] = None
+) -> set[int]:
+    """
+    Scans the output directory for the frames of the MRQ job that are completely rendered.
+    Only the files of the job are counted, see :func:`get_output_file_pattern`. Every frame needs
+    all its image files (render passes) complete.
+
+    :param output_directory: Resolved output directory of the MRQ job
+    :param file_pattern: Pattern of the output files of the job
+    :param written_since: Time, in seconds since the epoch, the files must be written since
+        to be counted, e.g. the start of the run. All the files are counted if None.
+
+    :return: Frame numbers of the complete frames
+    :rtype: set[int]
+    """
+    complete_frames: set[int] = set()
+    incomplete_frames: set[int] = set()
+
+    for root, _, file_names in os.walk(output_directory):
+        for file_name in file_names:
+            stem, extension = os.path.splitext(file_name)
+            if extension.lower() not in IMAGE_FILE_HEADERS:
+                continue
+            relative_stem = os.path.relpath(os.path.join(root, stem), output_directory)
+            match = file_pattern.fullmatch(relative_stem.replace(os.sep, "/"))
+            if match is None:
+                continue
+
+            path = os.path.join(root, file_name)
+            frame = int(match.group("frame"))
+            try:
+                if written_since is not None and os.path.getmtime(path) < written_since:
+                    # Written by another render, it is rendered again
+                    incomplete_frames.add(frame)
+                    continue
+            except OSError:
+                incomplete_frames.add(frame)
+                continue
+            if is_complete_image(path):
+                complete_frames.add(frame)
+            else:
+                incomplete_frames.add(frame)
+
+    return complete_frames - incomplete_frames
+
+
+def get_missing_frame_range(
+    start_frame: int, end_frame: int, complete_frames: set[int]
+) -> Optional[Tuple[int, int]]:
+    """
+    Returns the frame range to render so all the missing frames of the given range are rendered.
+    MRQ renders a contiguous range, so the complete frames between the missing ones are rendered
+    again.
+
+    :param start_frame: First frame of the range
+    :param end_frame: End frame of the range, exclusive
+    :param complete_frames: Frame numbers of the complete frames
+
+    :return: Start and end (exclusive) frames to render or None if all the frames are complete
+    :rtype: Optional[Tuple[int, int]]
+    """
+    missing_frames = [
+        frame for frame in range(start_frame, end_frame) if frame not in complete_frames
+    ]
+    if not missing_frames:
+        return None
+    return missing_frames[0], missing_frames[-1] + 1
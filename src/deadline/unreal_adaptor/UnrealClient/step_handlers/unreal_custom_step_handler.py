@@ -9,21 +9,22 @@ from pathlib import Path
 from typing import Optional
 from types import ModuleType
 
+from .. import step_events
 from .base_step_handler import BaseStepHandler
 
 
 class UnrealCustomStepHandler(BaseStepHandler):
     @staticmethod
     def regex_pattern_progress() -> list[re.Pattern]:
-        return [re.compile(".*Custom Step Executor: Progress: ([0-9.]+)")]
+        return [re.compile("Custom Step Executor: Progress: ([0-9.]+)")]
 
     @staticmethod
     def regex_pattern_complete() -> list[re.Pattern]:
-        return [re.compile(".*Custom Step Executor: Complete")]
+        return [re.compile("Custom Step Executor: Complete")]
 
     @staticmethod
     def regex_pattern_error() -> list[re.Pattern]:
-        return [re.compile(".*Exception:.*|.*Custom Step Executor: Error:.*")]
+        return [re.compile("Exception:.*|Custom Step Executor: Error:.*")]
 
     @staticmethod
     def validate_script(script_path: str) -> ModuleType:
@@ -69,12 +70,12 @@ class UnrealCustomStepHandler(BaseStepHandler):
             script_args = args.get("script_args", {})
             result = script_module.main(**script_args)
             unreal.log(f"Custom Step Executor: Complete: {result}")
+            step_events.send_event(step_events.COMPLETE, result=str(result))
             return True
         except Exception as e:
-            unreal.log(
-                f"Custom Step Executor: Error: "
-                f'Error occured while executing the given script {args.get("script_path")}: {str(e)}\n'
-            )
+            message = f'Error occured while executing the given script {args.get("script_path")}: {str(e)}'
+            unreal.log(f"Custom Step Executor: Error: {message}\n")
+            step_events.send_event(step_events.ERROR, message=message)
             unreal.log(traceback.format_exc())
             return False
 
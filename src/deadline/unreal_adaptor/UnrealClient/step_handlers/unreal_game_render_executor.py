@@ -0,0 +1,218 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+"""
+Render executor of the game render mode: Unreal runs with -game instead of the editor
+and the MRQ command line executor renders the queue without the Play-In-Editor world.
+
+The adaptor launches Unreal for every run with the run data file on the command line::
+
+    UnrealEditor-Cmd Project.uproject /Game/Maps/Level -game
+        -MoviePipelineLocalExecutorClass=/Script/MovieRenderPipelineCore.MoviePipelinePythonHostExecutor
+        -ExecutorPythonClass=/Engine/PythonTypes.RemoteRenderMoviePipelineGameExecutor
+        -DeadlineRunData=/path/to/run-data.json
+
+The executor is registered by the startup script of the UnrealClient "startup" directory.
+It prints the same log lines as the editor render executor, the adaptor tracks the render with
+the :class:`deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_render_step_handler.UnrealRenderStepHandler`
+log patterns. Unreal exits when the queue is rendered.
+"""
+
+import re
+import json
+from typing import Any, List, Optional, Tuple
+
+try:
+    import unreal
+except Exception:
+    unreal = None
+
+from .. import preload, step_events
+from .unreal_render_step_handler import UnrealRenderStepHandler
+
+
+#: Command line argument holding the path to the run data file
+RUN_DATA_ARGUMENT = "DeadlineRunData"
+
+# Progress of the render, reported on the frames that change it enough, see on_begin_frame()
+_progress_coalescer = step_events.ProgressCoalescer()
+
+# Jobs of the queue being rendered with their output frames count, see on_begin_frame()
+_render_jobs_frames: List[Tuple[Any, int]] = []
+
+
+def get_run_data_path(command_line: str) -> Optional[str]:
+    """
+    Returns the run data file path of the Unreal command line
+
+    :param command_line: Unreal command line
+
+    :return: Path to the run data file or None if it's not on the command line
+    :rtype: Optional[str]
+    """
+    match = re.search(rf'-{RUN_DATA_ARGUMENT}=(?:"([^"]*)"|(\S+))', command_line, re.IGNORECASE)
+    if match is None:
+        return None
+    return match.group(1) if match.group(1) is not None else match.group(2)
+
+
+def create_render_queue(outer, run_data: dict):
+    """
+    Create the unreal.MoviePipelineQueue to render from the run data: from the queue manifest
+    or from the job arguments, restricted to the frame chunk of the task
+
+    :param outer: Outer object of the queue
+    :param run_data: Run data of the task
+
+    :return: unreal.MoviePipelineQueue instance
+    """
+    render_queue = unreal.new_object(unreal.MoviePipelineQueue, outer=outer)
+
+    if run_data.get("queue_manifest_path"):
+        render_queue.copy_from(
+            UnrealRenderStepHandler.load_manifest_queue(
+                run_data["queue_manifest_path"].replace("\\", "/")
+            )
+        )
+    else:
+        render_job = render_queue.allocate_new_job(unreal.MoviePipelineExecutorJob)
+        render_job.sequence = unreal.SoftObjectPath(run_data.get("level_sequence_path", ""))
+        render_job.map = unreal.SoftObjectPath(run_data.get("level_path", ""))
+        render_job.set_configuration(unreal.load_asset(run_data.get("job_configuration_path", "")))
+
+    UnrealRenderStepHandler.apply_frame_range(
+        pipeline_queue=render_queue,
+        frames=str(run_data.get("frames", "")),
+        warm_up_frames=run_data.get("warm_up_frames", 0),
+    )
+    return render_queue
+
+
+if unreal:
+
+    @unreal.uclass()
+    class RemoteRenderMoviePipelineGameExecutor(unreal.MoviePipelinePythonHostExecutor):
+        activeMoviePipeline = unreal.uproperty(unreal.MoviePipeline)  # Pipeline of the job
+        renderQueue = unreal.uproperty(unreal.MoviePipelineQueue)  # Queue built from run data
+        jobIndex = unreal.uproperty(int)  # Index of the job being rendered
+        pendingMapLoad = unreal.uproperty(bool)  # The job waits for its map to be loaded
+        totalFrameRange = unreal.uproperty(int)  # Frames count of all the queue jobs
+        currentFrame = unreal.uproperty(int)  # Output frames rendered, reported as progress
+
+        def _post_init(self):
+            self.activeMoviePipeline = None
+            self.renderQueue = None
+            self.jobIndex = 0
+            self.pendingMapLoad = False
+            self.totalFrameRange = 0
+            self.currentFrame = 0
+
+        def fail(self, message: str) -> None:
+            """Report the error to the adaptor and exit"""
+            unreal.log_error(f"Render Executor: Error: {message}")
+            self.activeMoviePipeline = None
+            self.on_executor_finished_impl()
+
+        @unreal.ufunction(override=True)
+        def execute_delayed(self, in_pipeline_queue):
+            """
+            Build the queue from the run data file and render its jobs one after another.
+            The queue of the command line is ignored.
+            """
+            run_data_path = get_run_data_path(unreal.SystemLibrary.get_command_line())
+            if run_data_path is None:
+                self.fail(f"No -{RUN_DATA_ARGUMENT} on the command line")
+                return
+
+            try:
+                with open(run_data_path, encoding="utf-8") as f:
+                    run_data = json.load(f)
+                unreal.log(f"Render Executor: Game render with run data: {run_data}")
+                self.renderQueue = create_render_queue(self, run_data)
+            except Exception as e:
+                self.fail(f"Failed to create the render queue: {e}")
+                return
+
+            if run_data.get("resume") is True:
+                # Requested with the ResumeRender job parameter,
+                # resolving the output directory of a job needs the editor
+                unreal.log_warning("Render Executor: Resume is not supported in game mode")
+
+            _render_jobs_frames.clear()
+            for job in self.renderQueue.get_jobs():
+                frame_range = UnrealRenderStepHandler.get_job_frame_range(job)
+                if frame_range is None:
+                    self.fail(f"Level Sequence of the job {job.job_name} not loaded")
+                    return
+                self.totalFrameRange += frame_range[1] - frame_range[0]
+                _render_jobs_frames.append((job, frame_range[1] - frame_range[0]))
+
+            if self.totalFrameRange == 0:
+                self.fail("Cannot render the Queue with frame range of zero length")
+                return
+
+            _progress_coalescer.reset()
+            self.render_next_job()
+
+        def render_next_job(self) -> None:
+            """Render the next job of the queue, load its map first if it's not loaded"""
+            jobs = self.renderQueue.get_jobs()
+            if self.jobIndex >= len(jobs):
+                unreal.log("Render Executor: Rendering is complete")
+                self.on_executor_finished_impl()
+                return
+
+            job = jobs[self.jobIndex]
+            map_path = preload.get_package_name(
+                unreal.SystemLibrary.conv_soft_object_reference_to_string(
+                    unreal.SystemLibrary.conv_soft_obj_path_to_soft_obj_ref(job.map)
+                )
+            )
+            world = self.get_last_loaded_world()
+            if world is None or preload.get_package_name(world.get_path_name()) != map_path:
+                unreal.log(f"Render Executor: Loading map {map_path}")
+                self.pendingMapLoad = True
+                unreal.GameplayStatics.open_level(world, map_path, True, "")
+                return
+
+            unreal.log(f"Render Executor: Rendering job {job.job_name}")
+            self.activeMoviePipeline = unreal.new_object(
+                self.target_pipeline_class, outer=world, base_type=unreal.MoviePipeline
+            )
+            self.activeMoviePipeline.on_movie_pipeline_work_finished_delegate.add_function_unique(
+                self, "on_movie_pipeline_finished"
+            )
+            self.activeMoviePipeline.initialize(job)
+
+        @unreal.ufunction(override=True)
+        def on_map_load(self, in_world):
+            if self.pendingMapLoad:
+                self.pendingMapLoad = False
+                self.render_next_job()
+
+        @unreal.ufunction(ret=None, params=[unreal.MoviePipelineOutputData])
+        def on_movie_pipeline_finished(self, results):
+            self.activeMoviePipeline = None
+            if not results.success:
+                self.fail(f"Job {self.jobIndex} of the queue failed to render")
+                return
+            self.jobIndex += 1
+            self.render_next_job()
+
+        @unreal.ufunction(override=True)
+        def is_rendering(self):
+            return self.activeMoviePipeline is not None
+
+        @unreal.ufunction(override=True)
+        def on_begin_frame(self):
+            """Report the progress the same way the editor render executor does"""
+            super(RemoteRenderMoviePipelineGameExecutor, self).on_begin_frame()
+
+            if self.activeMoviePipeline is None:
+                return
+            frames_done = UnrealRenderStepHandler.get_output_frames_done(_render_jobs_frames)
+            if frames_done <= self.currentFrame:
+                return
+            self.currentFrame = min(frames_done, self.totalFrameRange)
+            progress = self.currentFrame / self.totalFrameRange * 100
+            if _progress_coalescer.should_report(progress):
+                unreal.log(f"Render Executor: Progress: {progress}")
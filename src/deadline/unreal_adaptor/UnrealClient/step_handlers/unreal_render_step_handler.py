@@ -1,6 +1,8 @@
 #  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+import os
 import re
+import math
 from pathlib import Path
 
 try:
@@ -11,17 +13,37 @@ except Exception:
     )
     unreal = None
 
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from .. import asset_registry, preload, step_events
 from .base_step_handler import BaseStepHandler
+from .render_output import (
+    get_asset_name,
+    get_complete_frames,
+    get_missing_frame_range,
+    get_output_file_pattern,
+)
 
 
-if unreal:
+# Queue manifest path: modification time of the manifest and the queue parsed from it
+_manifest_queue_cache: Dict[str, Tuple[float, Any]] = {}
+
+# Progress of the render, reported on the frames that change it enough, see on_begin_frame()
+_progress_coalescer = step_events.ProgressCoalescer()
+
+# Jobs of the queue being rendered with their output frames count, see on_begin_frame()
+_render_jobs_frames: List[Tuple[Any, int]] = []
+
+
+# The PIE executor is an editor class, it doesn't exist when Unreal runs with -game
+if unreal and hasattr(unreal, "MoviePipelinePIEExecutor"):
 
     @unreal.uclass()
     class RemoteRenderMoviePipelineEditorExecutor(unreal.MoviePipelinePIEExecutor):
         totalFrameRange = unreal.uproperty(int)  # Total frame range of the job's level sequence
-        currentFrame = unreal.uproperty(int)  # Current frame handler that will be updating later
+        currentFrame = unreal.uproperty(int)  # Output frames rendered, reported as progress
+        doneFrames = unreal.uproperty(int)  # Frames already rendered by the interrupted render
+        renderStarted = unreal.uproperty(bool)  # The executor renders the first job
 
         def _post_init(self):
             """
@@ -30,6 +52,8 @@ if unreal:
             """
             self.totalFrameRange = 0
             self.currentFrame = 0
+            self.doneFrames = 0
+            self.renderStarted = False
 
         @unreal.ufunction(override=True)
         def execute(self, queue: unreal.MoviePipelineQueue):
@@ -37,51 +61,53 @@ if unreal:
             Execute the provided Queue.
             You are responsible for deciding how to handle each job in the queue and processing them.
 
-            Here we define totalFrameRange as frames count from the sequence/job configuration
+            Here we define totalFrameRange as the frames count of all the queue jobs,
+            from their sequence/job configuration, so the progress is aggregated over the jobs
 
             :param queue: The queue that this should process all jobs for
             :return: None
             """
 
-            # get the single job from queue
             jobs = queue.get_jobs()
             if len(jobs) == 0:
                 unreal.log_error(f"Render Executor: Error: {queue} has 0 jobs")
+                step_events.send_event(step_events.ERROR, message=f"{queue} has 0 jobs")
 
-            job = jobs[0]
-
-            # get output settings block
-            output_settings = job.get_configuration().find_or_add_setting_by_class(
-                unreal.MoviePipelineOutputSetting
-            )
-
-            # if user override frame range, use overriden values
-            if output_settings.use_custom_playback_range:
-                self.totalFrameRange = (
-                    output_settings.custom_end_frame - output_settings.custom_start_frame
-                )
-
-            # else use default frame range of the level sequence
-            else:
-                level_sequence = unreal.EditorAssetLibrary.load_asset(
-                    unreal.SystemLibrary.conv_soft_object_reference_to_string(
-                        unreal.SystemLibrary.conv_soft_obj_path_to_soft_obj_ref(job.sequence)
-                    )
-                )
-                if level_sequence is None:
+            self.totalFrameRange = 0
+            _render_jobs_frames.clear()
+            for job in jobs:
+                frame_range = UnrealRenderStepHandler.get_job_frame_range(job)
+                if frame_range is None:
                     unreal.log_error(
-                        "Render Executor: Error: Level Sequence not loaded. Check if the sequence "
-                        "exists and is valid"
+                        f"Render Executor: Error: Level Sequence of the job {job.job_name} not "
+                        "loaded. Check if the sequence exists and is valid"
                     )
+                    step_events.send_event(
+                        step_events.ERROR,
+                        message=f"Level Sequence of the job {job.job_name} not loaded. "
+                        "Check if the sequence exists and is valid",
+                    )
+                    continue
+                self.totalFrameRange += frame_range[1] - frame_range[0]
+                _render_jobs_frames.append((job, frame_range[1] - frame_range[0]))
 
-                self.totalFrameRange = (
-                    level_sequence.get_playback_end() - level_sequence.get_playback_start()
-                )
+            unreal.log(
+                f"Render Executor: Rendering {len(jobs)} job(s), {self.totalFrameRange} frames"
+            )
+
+            # Resumed render counts the progress from the frames already rendered
+            if self.doneFrames > 0:
+                self.totalFrameRange += self.doneFrames
+                self.currentFrame = self.doneFrames
 
             if self.totalFrameRange == 0:
                 unreal.log_error(
                     "Render Executor: Error: Cannot render the Queue with frame range of zero length"
                 )
+                step_events.send_event(
+                    step_events.ERROR,
+                    message="Cannot render the Queue with frame range of zero length",
+                )
 
             # don't forget to call parent's execute to run the render process
             super().execute(queue)
@@ -90,47 +116,98 @@ if unreal:
         def on_begin_frame(self):
             """
             Called once at the beginning of each engine frame (e.g. tick, fps)
-            Since the executor will work with Play in Editor widget, each rendered frame will match with widget frame tick.
+
+            Engine frames are not output frames: warm up frames and temporal samples tick
+            the engine too. The progress is counted in output frames from the status progress
+            MRQ sets on the job it renders, see
+            :meth:`deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_render_step_handler.UnrealRenderStepHandler.get_output_frames_done()`
             """
 
             super(RemoteRenderMoviePipelineEditorExecutor, self).on_begin_frame()
 
             # Since PIEExecutor launching Play in Editor before mrq is rendering, we should ensure, that
             # executor actually rendering the sequence.
-            if self.is_rendering():
-                self.currentFrame += 1
-                progress = self.currentFrame / self.totalFrameRange * 100
+            if not self.is_rendering():
+                return
 
-                # Executor work with the render queue after all frames are rendered - do all
-                # support stuff, handle safe quit, etc, so we should ignore progress that more than 100.
-                # TODO refactor if possible, check shot/job finished callbacks
-                if progress <= 100:
-                    unreal.log(f"Render Executor: Progress: {progress}")
+            # Play in Editor is started and the map loaded, the frames are being rendered
+            if not self.renderStarted:
+                self.renderStarted = True
+                step_events.end_phase("first_frame")
+                step_events.start_phase("render")
+
+            frames_done = self.doneFrames + UnrealRenderStepHandler.get_output_frames_done(
+                _render_jobs_frames
+            )
+            if frames_done <= self.currentFrame:
+                return
+            self.currentFrame = min(frames_done, self.totalFrameRange)
+            progress = self.currentFrame / self.totalFrameRange * 100
+
+            # Most of the output frames don't change the progress enough to be reported
+            if _progress_coalescer.should_report(progress):
+                unreal.log(f"Render Executor: Progress: {progress}")
+                step_events.send_event(
+                    step_events.FRAME_DONE,
+                    frame=self.currentFrame,
+                    total=self.totalFrameRange,
+                )
 
 
 class UnrealRenderStepHandler(BaseStepHandler):
     @staticmethod
     def regex_pattern_progress() -> list[re.Pattern]:
-        return [re.compile(".*Render Executor: Progress: ([0-9.]+)")]
+        return [re.compile("Render Executor: Progress: ([0-9.]+)")]
 
     @staticmethod
     def regex_pattern_complete() -> list[re.Pattern]:
         return [
-            re.compile(".*Render Executor: Rendering is complete"),
-            re.compile(".* finished ([0-9]+) jobs in .*"),
+            re.compile("Render Executor: Rendering is complete"),
+            re.compile(" finished ([0-9]+) jobs in .*"),
         ]
 
     @staticmethod
     def regex_pattern_error() -> list[re.Pattern]:
-        return [re.compile(".*Exception:.*|.*Render Executor: Error:.*|.*LogPython: Error:.*")]
+        return [re.compile("Exception:.*|Render Executor: Error:.*|LogPython: Error:.*")]
 
     @staticmethod
     def executor_failed_callback(executor, pipeline, is_fatal, error):
         unreal.log_error(f"Render Executor: Error: {error}")
+        step_events.send_event(step_events.ERROR, message=str(error))
 
     @staticmethod
     def executor_finished_callback(movie_pipeline=None, results=None):
         unreal.log("Render Executor: Rendering is complete")
+        step_events.end_phase("render")
+        step_events.send_event(step_events.COMPLETE)
+
+    @staticmethod
+    def load_manifest_queue(queue_manifest_path: str):
+        """
+        Returns the unreal.MoviePipelineQueue parsed from the given queue manifest.
+        The parsed queue is cached for the session by the manifest path and modification time,
+        so the tasks rendering the same manifest only copy its jobs.
+
+        :param queue_manifest_path: Path to the manifest file
+
+        :return: unreal.MoviePipelineQueue instance
+        """
+        try:
+            modification_time = os.path.getmtime(queue_manifest_path)
+        except OSError:
+            modification_time = None
+
+        cached = _manifest_queue_cache.get(queue_manifest_path)
+        if cached is not None and modification_time is not None and cached[0] == modification_time:
+            unreal.log(f"Render Executor: Using the cached queue of {queue_manifest_path}")
+            return cached[1]
+
+        manifest_queue = unreal.MoviePipelineLibrary.load_manifest_file_from_string(
+            queue_manifest_path
+        )
+        if modification_time is not None:
+            _manifest_queue_cache[queue_manifest_path] = (modification_time, manifest_queue)
+        return manifest_queue
 
     @staticmethod
     def create_queue_from_manifest(movie_pipeline_queue_subsystem, queue_manifest_path: str):
@@ -141,9 +218,7 @@ class UnrealRenderStepHandler(BaseStepHandler):
         :param queue_manifest_path: Path to the manifest file
         """
         queue_manifest_path = queue_manifest_path.replace("\\", "/")
-        manifest_queue = unreal.MoviePipelineLibrary.load_manifest_file_from_string(
-            queue_manifest_path
-        )
+        manifest_queue = UnrealRenderStepHandler.load_manifest_queue(queue_manifest_path)
 
         pipeline_queue = movie_pipeline_queue_subsystem.get_queue()
         pipeline_queue.delete_all_jobs()
@@ -187,6 +262,189 @@ class UnrealRenderStepHandler(BaseStepHandler):
         name = job_name or Path(level_sequence_path).stem
         render_job.job_name = name
 
+    @staticmethod
+    def parse_frames(frames: str) -> Optional[Tuple[int, int]]:
+        """
+        Parse the frame chunk of the task
+
+        :param frames: Frame chunk as "first-last" (last frame inclusive) or a single frame,
+            empty to render the whole frame range of the job
+
+        :raises ValueError: If the frames string is not a valid chunk
+
+        :return: Start and end (exclusive) frames of the chunk or None if frames is empty
+        :rtype: Optional[Tuple[int, int]]
+        """
+        frames = frames.strip()
+        if not frames:
+            return None
+
+        match = re.fullmatch(r"(-?[0-9]+)(?:-(-?[0-9]+))?", frames)
+        if match is None:
+            raise ValueError(f"Invalid frames: {frames}")
+
+        first_frame = int(match.group(1))
+        last_frame = int(match.group(2)) if match.group(2) is not None else first_frame
+        if last_frame < first_frame:
+            raise ValueError(f"Invalid frames: {frames}, last frame is less than the first one")
+        return first_frame, last_frame + 1
+
+    @staticmethod
+    def apply_frame_range(pipeline_queue, frames: str, warm_up_frames: int = 0) -> None:
+        """
+        Set the custom playback range of the task frame chunk to the output setting of the
+        every queue job, so the task renders only its chunk of the level sequence.
+
+        Warm up frames are set as engine warm up count of the anti-aliasing setting,
+        so the chunk starting in the middle of the sequence (e.g. with particles, motion blur)
+        renders the same frames as the whole sequence render.
+
+        :param pipeline_queue: unreal.MoviePipelineQueue instance
+        :param written_since: Time, in seconds since the epoch, of the run start the counted files
+            are written since, e.g. for the relaunch of a crashed run the submitter didn't resume.
+            All the files are counted if None.
+        :param frames: Frame chunk of the task, see
+            :meth:`deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_render_step_handler.UnrealRenderStepHandler.parse_frames()`
+        :param warm_up_frames: Number of engine frames to evaluate before the first frame
+        """
+        frame_range = UnrealRenderStepHandler.parse_frames(frames)
+        if frame_range is None:
+            return
+
+        start_frame, end_frame = frame_range
+        for job in pipeline_queue.get_jobs():
+            configuration = job.get_configuration()
+
+            output_setting = configuration.find_or_add_setting_by_class(
+                unreal.MoviePipelineOutputSetting
+            )
+            output_setting.use_custom_playback_range = True
+            output_setting.custom_start_frame = start_frame
+            output_setting.custom_end_frame = end_frame
+
+            if warm_up_frames > 0:
+                anti_aliasing_setting = configuration.find_or_add_setting_by_class(
+                    unreal.MoviePipelineAntiAliasingSetting
+                )
+                anti_aliasing_setting.engine_warm_up_count = max(
+                    anti_aliasing_setting.engine_warm_up_count, warm_up_frames
+                )
+
+            unreal.log(
+                f"Render Executor: Job {job.job_name} frame range: {start_frame}-{end_frame - 1}, "
+                f"warm up frames: {warm_up_frames}"
+            )
+
+    @staticmethod
+    def get_job_frame_range(job) -> Optional[Tuple[int, int]]:
+        """
+        Returns the frame range the MRQ job renders: the custom playback range of its output
+        setting if it is used, the playback range of its level sequence otherwise
+
+        :param job: unreal.MoviePipelineExecutorJob instance
+
+        :return: Start and end (exclusive) frames or None if the level sequence can't be loaded
+        :rtype: Optional[Tuple[int, int]]
+        """
+        output_setting = job.get_configuration().find_or_add_setting_by_class(
+            unreal.MoviePipelineOutputSetting
+        )
+        if output_setting.use_custom_playback_range:
+            return output_setting.custom_start_frame, output_setting.custom_end_frame
+
+        # Loaded once per session, see preload
+        level_sequence = preload.load_asset(
+            unreal.SystemLibrary.conv_soft_object_reference_to_string(
+                unreal.SystemLibrary.conv_soft_obj_path_to_soft_obj_ref(job.sequence)
+            )
+        )
+        if level_sequence is None:
+            return None
+        return level_sequence.get_playback_start(), level_sequence.get_playback_end()
+
+    @staticmethod
+    def get_output_frames_done(jobs_frames: List[Tuple[Any, int]]) -> int:
+        """
+        Returns the number of output frames rendered by the MRQ jobs. MRQ sets the status
+        progress of the job it renders to its output frames done over its output frames count,
+        the engine frames of the warm up and of the temporal samples are not counted.
+
+        :param jobs_frames: unreal.MoviePipelineExecutorJob instances with their output
+            frames count, see :meth:`get_job_frame_range()`
+
+        :return: Number of output frames rendered
+        :rtype: int
+        """
+        frames_done = 0
+        for job, frames_count in jobs_frames:
+            progress = min(max(job.get_status_progress(), 0.0), 1.0)
+            # The progress is a float ratio, its rounding must not lose a rendered frame
+            frames_done += min(math.floor(progress * frames_count + 1e-6), frames_count)
+        return frames_done
+
+    @staticmethod
+    def apply_resume(pipeline_queue, written_since: Optional[float] = None) -> int:
+        """
+        Restrict the frame range of every queue job to the frames missing in its output directory,
+        so the retried render doesn't render again the frames of the interrupted one.
+        Only the files named by the output file name format of the job are counted,
+        so the jobs sharing an output directory don't take the frames of each other.
+        Jobs with all the frames rendered are deleted from the queue.
+
+        See :func:`deadline.unreal_adaptor.UnrealClient.step_handlers.render_output.get_complete_frames`
+
+        :param pipeline_queue: unreal.MoviePipelineQueue instance
+
+        :return: Number of the complete output frames of all the jobs left in the queue,
+            the render executor counts the output frames it renders on top of them
+        :rtype: int
+        """
+        done_frames = []
+        for job in list(pipeline_queue.get_jobs()):
+            frame_range = UnrealRenderStepHandler.get_job_frame_range(job)
+            if frame_range is None:
+                # The render executor reports the job error
+                continue
+            start_frame, end_frame = frame_range
+            output_directory = unreal.MoviePipelineEditorLibrary.resolve_output_directory_from_job(
+                job
+            )
+            output_setting = job.get_configuration().find_or_add_setting_by_class(
+                unreal.MoviePipelineOutputSetting
+            )
+            file_pattern = get_output_file_pattern(
+                output_setting.file_name_format,
+                {
+                    "job_name": job.job_name,
+                    "sequence_name": get_asset_name(job.sequence.export_text()),
+                    "level_name": get_asset_name(job.map.export_text()),
+                },
+            )
+            complete_frames = get_complete_frames(output_directory, file_pattern, written_since)
+            missing_frame_range = get_missing_frame_range(start_frame, end_frame, complete_frames)
+
+            if missing_frame_range is None:
+                unreal.log(
+                    f"Render Executor: Job {job.job_name} frames {start_frame}-{end_frame - 1} "
+                    f"are already rendered in {output_directory}, skipping"
+                )
+                pipeline_queue.delete_job(job)
+                continue
+
+            output_setting.use_custom_playback_range = True
+            output_setting.custom_start_frame, output_setting.custom_end_frame = missing_frame_range
+
+            done_frames.append(
+                (end_frame - start_frame) - (missing_frame_range[1] - missing_frame_range[0])
+            )
+            unreal.log(
+                f"Render Executor: Job {job.job_name} resumes at frames "
+                f"{missing_frame_range[0]}-{missing_frame_range[1] - 1}, "
+                f"{done_frames[-1]} frames already rendered in {output_directory}"
+            )
+
+        return sum(done_frames)
+
     def run_script(self, args: dict) -> bool:
         """
         Create the unreal.MoviePipelineQueue object and render it with the render executor
@@ -196,9 +454,10 @@ class UnrealRenderStepHandler(BaseStepHandler):
             (https://docs.unrealengine.com/5.2/en-US/PythonAPI/class/MoviePipelineQueueEngineSubsystem.html#unreal.MoviePipelineQueueEngineSubsystem.render_queue_with_executor_instance)
         """
         unreal.log(f"{UnrealRenderStepHandler.run_script.__name__} executing with args: {args} ...")
+        step_events.start_phase("queue_setup")
 
-        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
-        asset_registry.wait_for_completion()
+        # Warmed once per session by the adaptor
+        asset_registry.wait_for_asset_registry()
 
         subsystem = unreal.get_editor_subsystem(unreal.MoviePipelineQueueSubsystem)
 
@@ -215,8 +474,26 @@ class UnrealRenderStepHandler(BaseStepHandler):
                 job_configuration_path=args.get("job_configuration_path", ""),
             )
 
+        UnrealRenderStepHandler.apply_frame_range(
+            pipeline_queue=subsystem.get_queue(),
+            frames=str(args.get("frames", "")),
+            warm_up_frames=args.get("warm_up_frames", 0),
+        )
+
+        done_frames = 0
+        if args.get("resume", False):
+            done_frames = UnrealRenderStepHandler.apply_resume(
+                subsystem.get_queue(), written_since=args.get("resume_since")
+            )
+            if len(subsystem.get_queue().get_jobs()) == 0:
+                step_events.end_phase("queue_setup")
+                UnrealRenderStepHandler.executor_finished_callback()
+                return True
+
         # Initialize Render executor
+        _progress_coalescer.reset()
         executor = RemoteRenderMoviePipelineEditorExecutor()
+        executor.doneFrames = done_frames
 
         # Add callbacks on complete and error actions to handle it and provide output to the Deadline Adaptor
         executor.on_executor_errored_delegate.add_callable(
@@ -226,7 +503,10 @@ class UnrealRenderStepHandler(BaseStepHandler):
             UnrealRenderStepHandler.executor_finished_callback
         )
 
-        # Render queue with the given executor
+        step_events.end_phase("queue_setup")
+
+        # Render queue with the given executor, it starts Play in Editor and loads the map first
+        step_events.start_phase("first_frame")
         subsystem.render_queue_with_executor_instance(executor)
 
         return True
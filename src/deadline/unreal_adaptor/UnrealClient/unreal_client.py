@@ -2,23 +2,31 @@
 
 import os
 import sys
+import json
+import time
 from http import HTTPStatus
 
 from typing import Optional
 
+# The last PYTHONPATH entries come first: the adaptor appends the client bundle, the zip archive
+# the client modules are imported from, see deadline.unreal_adaptor.UnrealAdaptor.client_bundle
 if "PYTHONPATH" in os.environ:
     for p in os.environ["PYTHONPATH"].split(os.pathsep):
         if p not in sys.path:
             sys.path.insert(0, p.replace("\\", "/"))
 
-for p in sys.path:
-    print(p)
+# Reported as the client_import phase of the start
+_import_start_time = time.perf_counter()
 
 from openjd.adaptor_runtime_client.win_client_interface import WinClientInterface  # noqa: E402
 from deadline.unreal_adaptor.UnrealClient.step_handlers.base_step_handler import (  # noqa: E402
     BaseStepHandler,
 )
 from deadline.unreal_adaptor.UnrealClient.step_handlers import get_step_handler_class  # noqa: E402
+from deadline.unreal_adaptor.UnrealClient import asset_registry, preload, step_events  # noqa: E402
+from deadline.unreal_adaptor.UnrealClient.action_poller import ActionPoller  # noqa: E402
+
+_import_seconds = time.perf_counter() - _import_start_time
 
 
 class UnrealClient(WinClientInterface):
@@ -29,7 +37,16 @@ class UnrealClient(WinClientInterface):
     def __init__(self, socket_path: str) -> None:
         super().__init__(socket_path)
         self.handler: BaseStepHandler
-        self.actions.update({"set_handler": self.set_handler})
+        self.actions.update(
+            {
+                "set_handler": self.set_handler,
+                "warm_asset_registry": self.warm_asset_registry,
+                "preload": self.preload_assets,
+                "fast_exit": self.fast_exit,
+            }
+        )
+        self.action_poller = ActionPoller(self._request_next_action)
+        step_events.set_event_sender(self.send_event)
 
     def set_handler(self, handler_dict: dict) -> None:
         """Set the current Step Handler"""
@@ -39,6 +56,55 @@ class UnrealClient(WinClientInterface):
         # This is an abstract method in a base class and isn't callable but the actual handler will implement this as callable.
         # TODO: Properly type hint self.handler
         self.actions.update(self.handler.action_dict)  # type: ignore
+        self.actions["run_script"] = self.run_script
+
+    def warm_asset_registry(self, args: dict) -> None:
+        """Warm the asset registry with the content paths the job references"""
+        asset_registry.warm_asset_registry(args.get("paths", []))
+
+    def preload_assets(self, args: dict) -> None:
+        """Load the map and the level sequence of the job for the runs of the session"""
+        preload.preload(args.get("level_path", ""), args.get("level_sequence_path", ""))
+
+    def run_script(self, args: dict) -> None:
+        """
+        Run the script of the current Step Handler.
+
+        Render scripts keep running on the game thread after this method returns and report
+        their result with the complete or error event, so the adaptor doesn't need to feed
+        the client with "wait_result" actions. If the events can't be delivered,
+        the adaptor falls back to the log lines.
+        """
+        step_events.send_event(step_events.STARTED)
+        self.handler.run_script(args)
+
+    def send_event(self, name: str, args: dict) -> bool:
+        """
+        Send the step event to the adaptor server
+
+        :param name: Event name
+        :param args: Event arguments
+
+        :return: True if the adaptor received the event, False otherwise
+        """
+        try:
+            response = self._send_request(
+                "GET",
+                step_events.EVENT_REQUEST_PATH,
+                query_string_params={"event": json.dumps({"name": name, "args": args})},
+            )
+        except Exception as e:
+            print(f"ERROR: Failed to send the {name} event: {e}", file=sys.stderr, flush=True)
+            return False
+
+        if response.status != HTTPStatus.OK:
+            print(
+                f"ERROR: Failed to send the {name} event: {response.status} {response.reason}",
+                file=sys.stderr,
+                flush=True,
+            )
+            return False
+        return True
 
     def close(self, args: Optional[dict] = None) -> None:
         """Close the Unreal Engine"""
@@ -47,6 +113,23 @@ class UnrealClient(WinClientInterface):
         unreal.log("Quit the Editor: normal shutdown")
         unreal.SystemLibrary.quit_editor()
 
+    def fast_exit(self, args: Optional[dict] = None) -> None:
+        """
+        Flush the logs and tell the adaptor that Unreal may be killed, skipping the engine
+        shutdown. The render outputs are written once the render completes. Quit the Editor
+        normally if the adaptor can't be told.
+        """
+        import unreal
+
+        unreal.log("Quit the Editor: fast exit")
+        unreal.SystemLibrary.execute_console_command(None, "FLUSHLOG")
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        if not step_events.send_event(step_events.EXIT_READY):
+            unreal.log_warning("Quit the Editor: fast exit not confirmed, normal shutdown")
+            unreal.SystemLibrary.quit_editor()
+
     def graceful_shutdown(self, *args, **kwargs) -> None:
         """Close the Unreal Engine if the UnrealAdaptor terminate the client with 0s grace time"""
         import unreal
@@ -56,25 +139,18 @@ class UnrealClient(WinClientInterface):
 
     def poll(self) -> None:
         """
-        This function will poll the server for the next task. If the server is in between Subtasks
-        (no actions in the queue), a backoff function will be called to add a delay between the
-        requests.
+        Performs the actions received from the adaptor server since the last call.
+        Called by the game thread on every tick: the server requests are made by the
+        :class:`deadline.unreal_adaptor.UnrealClient.action_poller.ActionPoller` thread,
+        so the call never waits for the server.
         """
-        status, reason, action = self._request_next_action()
-        if status == HTTPStatus.OK:
-            if action is not None:
-                print(
-                    f"Performing action: {action}",
-                    flush=True,
-                )
-                self._perform_action(action)
-        else:  # Any other status or reason
+        self.action_poller.start()
+        for action in self.action_poller.get_actions():
             print(
-                f"ERROR: An error was raised when trying to connect to the server: {status} "
-                f"{reason}",
-                file=sys.stderr,
+                f"Performing action: {action}",
                 flush=True,
             )
+            self._perform_action(action)
 
 
 def main():
@@ -103,17 +179,14 @@ def main():
         """
 
         client = UnrealClient(socket_path)
-        time_elapsed = unreal.uproperty(float)
-
-        def _post_init(self):
-            self.time_elapsed = 0
 
         @unreal.ufunction(override=True)
         def execute(self, delta_time: float):
-            self.time_elapsed += delta_time
-            if self.time_elapsed >= 1:
-                self.time_elapsed = 0
-                self.client.poll()
+            # Actions are received on the client polling thread, run them on this tick
+            self.client.poll()
+
+    # Reported in the timing report of the adaptor start
+    step_events.send_event(step_events.PHASE, phase="client_import", duration=_import_seconds)
 
 
 if __name__ == "__main__":  # pragma: no cover
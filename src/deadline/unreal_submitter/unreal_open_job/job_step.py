@@ -3,12 +3,35 @@ import yaml
 import unreal
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 from deadline.unreal_submitter.settings import DEFAULT_JOB_STEP_TEMPLATE_FILE_PATH
 from deadline.unreal_submitter.unreal_dependency_collector.common import os_abs_from_relative
 
 
+def get_frame_chunks(start_frame: int, end_frame: int, chunk_size: int) -> list[str]:
+    """
+    Split the frame range into chunks of the given size
+
+    :param start_frame: First frame of the range
+    :param end_frame: End frame of the range, exclusive (as the level sequence playback end)
+    :param chunk_size: Number of frames in each chunk. 0 makes a single chunk of the whole range
+
+    :return: List of the chunks as "first-last" strings, last frame inclusive
+    :rtype: list[str]
+    """
+    if end_frame <= start_frame:
+        raise Exception(f"Cannot split the frame range of zero length: {start_frame}-{end_frame}")
+
+    if chunk_size <= 0:
+        chunk_size = end_frame - start_frame
+
+    return [
+        f"{chunk_start}-{min(chunk_start + chunk_size, end_frame) - 1}"
+        for chunk_start in range(start_frame, end_frame, chunk_size)
+    ]
+
+
 class HostRequirements:
     """OpenJob host requirements representation"""
 
@@ -112,7 +135,9 @@ class JobStep:
     Represents a OpenJob Step
     """
 
-    def __init__(self, step_template, step_settings, host_requirements, queue_manifest_path):
+    def __init__(
+        self, step_template, step_settings, host_requirements, queue_manifest_path, frame_range
+    ):
         """
         Build JobStep, set its name and fill dependencies list
 
@@ -190,11 +215,15 @@ class CustomScriptJobStep(JobStep):
     Represents a OpenJob Step for Custom Script executing
     """
 
-    def __init__(self, step_template, step_settings, host_requirements, queue_manifest_path):
+    def __init__(
+        self, step_template, step_settings, host_requirements, queue_manifest_path, frame_range
+    ):
         """
         Build JobStep, set its name, fill dependencies list and set script path parameter
         """
-        super().__init__(step_template, step_settings, host_requirements, queue_manifest_path)
+        super().__init__(
+            step_template, step_settings, host_requirements, queue_manifest_path, frame_range
+        )
 
         self._set_script_path_parameter(os_abs_from_relative(step_settings.script.file_path))
 
@@ -241,13 +270,20 @@ class RenderJobStep(JobStep):
     Represents a OpenJob Step for Render executing
     """
 
-    def __init__(self, step_template, step_settings, host_requirements, queue_manifest_path):
+    def __init__(
+        self, step_template, step_settings, host_requirements, queue_manifest_path, frame_range
+    ):
         """
-        Build JobStep, set its name, fill dependencies list and set queue manifest path parameter
+        Build JobStep, set its name, fill dependencies list, set queue manifest path parameter
+        and split the frame range into the Frames task parameter
         """
-        super().__init__(step_template, step_settings, host_requirements, queue_manifest_path)
+        super().__init__(
+            step_template, step_settings, host_requirements, queue_manifest_path, frame_range
+        )
 
         self._set_queue_manifest_path_parameter(queue_manifest_path)
+        self._set_frames_parameter(frame_range, step_settings.chunk_size)
+        self._set_warm_up_frames_parameter(step_settings.warm_up_frames)
 
     def _set_name(self, step_settings):
         """
@@ -268,6 +304,34 @@ class RenderJobStep(JobStep):
             parameter_name="QueueManifestPath", path_value=queue_manifest_path
         )
 
+    def _set_frames_parameter(self, frame_range: Tuple[int, int], chunk_size: int):
+        """
+        Fill the parameter "Frames" with the chunks of the given frame range,
+        so each chunk is rendered by its own task.
+
+        Use :meth:`deadline.unreal_submitter.unreal_open_job.job_step.get_frame_chunks`
+
+        :param frame_range: Start and end (exclusive) frames of the MRQ job
+        :type frame_range: Tuple[int, int]
+        :param chunk_size: Number of frames in each task, 0 to render the whole range in one task
+        :type chunk_size: int
+        """
+        for parameter_definition in self._job_step["parameterSpace"]["taskParameterDefinitions"]:
+            if parameter_definition["name"] == "Frames":
+                parameter_definition["range"] = get_frame_chunks(*frame_range, chunk_size)
+
+    def _set_warm_up_frames_parameter(self, warm_up_frames: int):
+        """
+        Fill the parameter "WarmUpFrames" with the number of frames
+        to evaluate before the first frame of each task
+
+        :param warm_up_frames: Number of warm up frames
+        :type warm_up_frames: int
+        """
+        for parameter_definition in self._job_step["parameterSpace"]["taskParameterDefinitions"]:
+            if parameter_definition["name"] == "WarmUpFrames":
+                parameter_definition["range"] = [max(warm_up_frames, 0)]
+
 
 @dataclass
 class JobStepDescriptor:
@@ -355,6 +419,7 @@ class JobStepFactory:
         job_settings: list[unreal.MoviePipelineSetting],
         queue_manifest_path: str,
         host_requirements,
+        frame_range: Tuple[int, int],
     ) -> list[JobStep]:
         """
         Create the Job Steps list using the provided job settings and other parameters
@@ -364,6 +429,8 @@ class JobStepFactory:
         :param queue_manifest_path: OS path for the queue manifest file
         :type queue_manifest_path: str
         :param host_requirements: AWS Host requirements settings
+        :param frame_range: Start and end (exclusive) frames of the MRQ job to render
+        :type frame_range: Tuple[int, int]
 
         :return: list of the :class:`deadline.unreal_submitter.unreal_open_job.job_step.JobStep` instances
         :rtype: :class:`deadline.unreal_submitter.unreal_open_job.job_step.JobStep`
@@ -386,6 +453,7 @@ class JobStepFactory:
                             step_settings=script_step_setting,
                             host_requirements=host_requirements,
                             queue_manifest_path=queue_manifest_path,
+                            frame_range=frame_range,
                         )
                     )
 
@@ -396,6 +464,7 @@ class JobStepFactory:
                         step_settings=setting,
                         host_requirements=host_requirements,
                         queue_manifest_path=queue_manifest_path,
+                        frame_range=frame_range,
                     )
                 )
 
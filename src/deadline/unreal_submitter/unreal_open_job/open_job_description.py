@@ -364,6 +364,7 @@ class OpenJobDescription:
                 job_settings=mrq_job.get_configuration().get_all_settings(),
                 host_requirements=preset_overrides.host_requirements,
                 queue_manifest_path=self._manifest_path,
+                frame_range=self._get_frame_range(mrq_job),
             )
             return self._steps
 
@@ -373,6 +374,32 @@ class OpenJobDescription:
             )
             raise e
 
+    @staticmethod
+    def _get_frame_range(mrq_job) -> tuple[int, int]:
+        """
+        Get the frame range the MRQ Job renders:
+        the custom playback range of the output setting if it is used,
+        the playback range of the level sequence otherwise.
+
+        :param mrq_job: unreal.MoviePipelineExecutorJob instance
+        :type mrq_job: unreal.MoviePipelineExecutorJob
+
+        :return: Start and end (exclusive) frames
+        :rtype: tuple[int, int]
+        """
+        output_setting = mrq_job.get_configuration().find_setting_by_class(
+            unreal.MoviePipelineOutputSetting
+        )
+        if output_setting and output_setting.use_custom_playback_range:
+            return output_setting.custom_start_frame, output_setting.custom_end_frame
+
+        level_sequence = unreal.EditorAssetLibrary.load_asset(
+            soft_obj_path_to_str(mrq_job.sequence)
+        )
+        if level_sequence is None:
+            raise Exception(f"Level Sequence not loaded: {soft_obj_path_to_str(mrq_job.sequence)}")
+        return level_sequence.get_playback_start(), level_sequence.get_playback_end()
+
     def _build_job_bundle(self) -> str:
         """
         Convert OpenJob to the bundle and write it on the disk.
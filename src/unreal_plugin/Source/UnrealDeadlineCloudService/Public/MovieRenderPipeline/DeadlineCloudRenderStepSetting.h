@@ -15,6 +15,14 @@ class UNREALDEADLINECLOUDSERVICE_API UDeadlineCloudRenderStepSetting : public UD
 	GENERATED_BODY()
 
 public:
+	/** Number of frames rendered by each task of the step. 0 renders the whole frame range in one task */
+	UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Rendering", meta = (ClampMin = "0", UIMin = "0"))
+	int32 ChunkSize = 0;
+
+	/** Number of engine frames evaluated before the first frame of each task is rendered */
+	UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Rendering", meta = (ClampMin = "0", UIMin = "0"))
+	int32 WarmUpFrames = 0;
+
 #if WITH_EDITOR
 	virtual FText GetDisplayText() const override { return NSLOCTEXT("MovieRenderPipeline", "DeadlineCloudRenderStepSettingDisplayName", "Render"); }
 #endif
@@ -0,0 +1,135 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+"""
+Stand-in for UnrealEditor-Cmd used by the adaptor benchmarks.
+
+The fake editor is put on the PATH under the "UnrealEditor-Cmd" name, so the UnrealAdaptor launches
+it exactly as it launches the real editor. It pays a configurable startup delay (editor boot),
+connects to the adaptor server with UNREAL_ADAPTOR_SOCKET_PATH and answers the actions the same way
+UnrealClient does, sending the step events and printing the log lines the adaptor waits for.
+
+Timings are configured with the environment variables:
+
+- FAKE_UNREAL_STARTUP_SECONDS: delay before the client connects to the adaptor server
+- FAKE_UNREAL_SHUTDOWN_SECONDS: delay between the "close" action and the process exit
+- FAKE_UNREAL_FRAMES: number of frames each render run reports
+- FAKE_UNREAL_FRAME_SECONDS: time spent on each rendered frame
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import stat
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def install_fake_unreal_editor(
+    bin_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    startup_seconds: float = 0.0,
+    shutdown_seconds: float = 0.0,
+    frames: int = 1,
+    frame_seconds: float = 0.0,
+) -> Path:
+    """
+    Put the fake UnrealEditor-Cmd executable in the given directory and prepend it to the PATH
+
+    :param bin_dir: Directory to create the executable in
+    :param monkeypatch: pytest MonkeyPatch fixture used to restore the environment after the test
+    :param startup_seconds: Time the fake editor needs to boot
+    :param shutdown_seconds: Time the fake editor needs to quit
+    :param frames: Number of frames each render run reports
+    :param frame_seconds: Time spent on each rendered frame
+
+    :return: Path to the fake UnrealEditor-Cmd executable
+    """
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    executable = bin_dir / "UnrealEditor-Cmd"
+    executable.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{__file__}" "$@"\n')
+    executable.chmod(executable.stat().st_mode | stat.S_IEXEC)
+
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setenv("FAKE_UNREAL_STARTUP_SECONDS", str(startup_seconds))
+    monkeypatch.setenv("FAKE_UNREAL_SHUTDOWN_SECONDS", str(shutdown_seconds))
+    monkeypatch.setenv("FAKE_UNREAL_FRAMES", str(frames))
+    monkeypatch.setenv("FAKE_UNREAL_FRAME_SECONDS", str(frame_seconds))
+
+    # Adaptor mutates these variables on start, restore them after the test
+    monkeypatch.setenv("PYTHONPATH", os.environ.get("PYTHONPATH", ""))
+    monkeypatch.setenv("UNREAL_ADAPTOR_SOCKET_PATH", "")
+
+    return executable
+
+
+def main() -> None:  # pragma: no cover
+    import json
+
+    from openjd.adaptor_runtime_client import ClientInterface
+    from deadline.unreal_adaptor.UnrealClient import step_events
+
+    class FakeUnrealClient(ClientInterface):
+        """Answers the UnrealAdaptor actions like UnrealClient with its step handlers does"""
+
+        def __init__(self, server_path: str) -> None:
+            super().__init__(server_path)
+            self.handler: Optional[str] = None
+            self.actions.update(
+                {
+                    "set_handler": self.set_handler,
+                    "run_script": self.run_script,
+                    "wait_result": self.wait_result,
+                }
+            )
+
+        def set_handler(self, args: dict) -> None:
+            self.handler = args.get("handler", "base")
+
+        def send_event(self, name: str, **args) -> None:
+            self._send_request(
+                "GET",
+                step_events.EVENT_REQUEST_PATH,
+                query_string_params={"event": json.dumps({"name": name, "args": args})},
+            )
+
+        def run_script(self, args: dict) -> None:
+            self.send_event(step_events.STARTED)
+            if self.handler == "custom":
+                print("LogPython: Custom Step Executor: Complete: True", flush=True)
+                self.send_event(step_events.COMPLETE, result="True")
+                return
+
+            frames = int(os.environ.get("FAKE_UNREAL_FRAMES", "1"))
+            frame_seconds = float(os.environ.get("FAKE_UNREAL_FRAME_SECONDS", "0"))
+            for frame in range(1, frames + 1):
+                time.sleep(frame_seconds)
+                print(f"LogPython: Render Executor: Progress: {frame / frames * 100}", flush=True)
+                self.send_event(step_events.FRAME_DONE, frame=frame, total=frames)
+            print("LogPython: Render Executor: Rendering is complete", flush=True)
+            self.send_event(step_events.COMPLETE)
+
+        def wait_result(self, args: Optional[dict] = None) -> None:
+            pass
+
+        def close(self, args: Optional[dict] = None) -> None:
+            print("LogPython: Quit the Editor: normal shutdown", flush=True)
+            time.sleep(float(os.environ.get("FAKE_UNREAL_SHUTDOWN_SECONDS", "0")))
+
+        def graceful_shutdown(self, *args, **kwargs) -> None:
+            sys.exit(0)
+
+    print(f"LogInit: Command Line: {' '.join(sys.argv[1:])}", flush=True)
+    time.sleep(float(os.environ.get("FAKE_UNREAL_STARTUP_SECONDS", "0")))
+    print("LogInit: Display: Engine is initialized.", flush=True)
+
+    # Polls the actions until the "close" one is performed
+    FakeUnrealClient(os.environ["UNREAL_ADAPTOR_SOCKET_PATH"]).poll()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
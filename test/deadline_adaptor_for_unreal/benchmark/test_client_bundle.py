@@ -0,0 +1,98 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import sys
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import openjd.adaptor_runtime_client
+
+import deadline.unreal_adaptor
+from deadline.unreal_adaptor.UnrealAdaptor import client_bundle
+from deadline.unreal_adaptor.UnrealAdaptor.client_bundle import get_client_bundle
+
+
+pytestmark = pytest.mark.benchmark
+
+RUNS = 5
+
+# Imports of unreal_client.py, but the Windows client interface which needs pywin32
+IMPORT_SCRIPT = """
+import sys, time
+sys.path[0:0] = sys.argv[1:]
+start_time = time.perf_counter()
+import openjd.adaptor_runtime_client
+from deadline.unreal_adaptor.UnrealClient.step_handlers import get_step_handler_class
+from deadline.unreal_adaptor.UnrealClient import asset_registry, preload, step_events
+from deadline.unreal_adaptor.UnrealClient.action_poller import ActionPoller
+print(time.perf_counter() - start_time)
+"""
+
+
+def import_seconds(paths: list[str]) -> float:
+    """
+    Returns the best time of the client imports in a fresh interpreter without the site packages,
+    like the isolated Python of Unreal, and without writing bytecode
+    """
+    return min(
+        float(
+            subprocess.run(
+                [sys.executable, "-S", "-B", "-c", IMPORT_SCRIPT, *paths],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.splitlines()[-1]
+        )
+        for _ in range(RUNS)
+    )
+
+
+def copy_sources(source_root: str, package: str, destination_root: Path) -> None:
+    shutil.copytree(
+        os.path.join(source_root, package),
+        destination_root / package,
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+
+
+class TestClientBundleBenchmark:
+    def test_client_import_time(self, tmp_path: Path) -> None:
+        """
+        Compares the editor-side import of the client modules from the source trees,
+        without bytecode like on a read-only share and with the bytecode cached next to them,
+        with the import from the precompiled bundle
+        """
+        # GIVEN
+        openjd_root = os.path.dirname(
+            os.path.dirname(os.path.dirname(openjd.adaptor_runtime_client.__file__))
+        )
+        deadline_root = os.path.dirname(
+            os.path.dirname(os.path.dirname(deadline.unreal_adaptor.__file__))
+        )
+        source_root = tmp_path / "sources"
+        copy_sources(openjd_root, "openjd/adaptor_runtime_client", source_root)
+        copy_sources(deadline_root, "deadline/unreal_adaptor/UnrealClient", source_root)
+        shutil.copy(deadline.unreal_adaptor.__file__, source_root / "deadline/unreal_adaptor")
+
+        # WHEN
+        sources_seconds = import_seconds([str(source_root)])
+        cached_sources_seconds = import_seconds([openjd_root, deadline_root])
+        # The benchmark interpreter stands for the Python of Unreal
+        with patch.object(client_bundle, "find_unreal_python", return_value=sys.executable):
+            bundle_path = get_client_bundle(cache_directory=str(tmp_path / "bundle"))
+        bundle_seconds = import_seconds([bundle_path])
+
+        print(
+            f"Client import: sources {sources_seconds * 1000:.1f} ms, "
+            f"sources with cached bytecode {cached_sources_seconds * 1000:.1f} ms, "
+            f"bundle {bundle_seconds * 1000:.1f} ms"
+        )
+
+        # THEN
+        # Nothing is compiled on import, the limit leaves room for the noise of a loaded host
+        assert bundle_seconds < sources_seconds * 1.5
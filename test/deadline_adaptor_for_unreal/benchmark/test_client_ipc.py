@@ -0,0 +1,147 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import time
+import random
+import threading
+from statistics import mean
+from typing import Callable, Iterator
+from unittest.mock import Mock
+
+import pytest
+from openjd.adaptor_runtime.application_ipc import ActionsQueue
+from openjd.adaptor_runtime_client import Action, ClientInterface
+
+from deadline.unreal_adaptor.UnrealAdaptor.adaptor import UnrealActionsQueue
+from deadline.unreal_adaptor.UnrealAdaptor.adaptor_server import UnrealAdaptorServer
+from deadline.unreal_adaptor.UnrealClient.action_poller import ActionPoller
+
+
+pytestmark = pytest.mark.benchmark
+
+TICK_SECONDS = 1 / 60
+ACTIONS = 6
+# Former OnTickThreadExecutorImplementation poll interval and UnrealAdaptor wait_result interval
+LEGACY_POLL_INTERVAL_SECONDS = 1
+WAIT_RESULT_INTERVAL_SECONDS = 1
+
+
+class Client(ClientInterface):
+    def close(self, args: dict | None = None) -> None:
+        pass
+
+    def graceful_shutdown(self, *args, **kwargs) -> None:
+        pass
+
+
+class GameThreadRun:
+    """
+    Simulates the Unreal game thread ticking at 60 FPS while the adaptor sends it actions.
+    Records the time each tick spends in the client IPC (stall) and the time between the adaptor
+    enqueuing an action and the game thread performing it (latency).
+    """
+
+    def __init__(self, server: UnrealAdaptorServer, queue: ActionsQueue) -> None:
+        self.server = server
+        self.queue = queue
+        self.stalls: list[float] = []
+        self.latencies: list[float] = []
+        self._enqueued_at: dict[str, float] = {}
+        self._performed = threading.Event()
+        self._done = threading.Event()
+
+    def perform(self, action: Action) -> None:
+        if action.name in self._enqueued_at:
+            self.latencies.append(time.monotonic() - self._enqueued_at.pop(action.name))
+            self._performed.set()
+
+    def adaptor(self, keep_client_busy: bool) -> None:
+        """Enqueues the actions one after the other, like on_run enqueues the task actions"""
+        rng = random.Random(0)
+        for i in range(ACTIONS):
+            time.sleep(rng.uniform(0.05, 0.3))
+            self._performed.clear()
+            self._enqueued_at[f"action_{i}"] = time.monotonic()
+            self.queue.enqueue_action(Action(f"action_{i}", {}))
+            while not self._performed.wait(timeout=WAIT_RESULT_INTERVAL_SECONDS):
+                # Former on_run loop keeping the game thread poll from blocking
+                if keep_client_busy and len(self.queue) == 0:
+                    self.queue.enqueue_action(Action("wait_result", {}))
+        self._done.set()
+
+    def run(self, tick: Callable[[float], None], keep_client_busy: bool = False) -> None:
+        threading.Thread(target=self.adaptor, args=(keep_client_busy,), daemon=True).start()
+        last_tick = time.monotonic()
+        while not self._done.is_set():
+            time.sleep(TICK_SECONDS)
+            now = time.monotonic()
+            tick(now - last_tick)
+            self.stalls.append(time.monotonic() - now)
+            last_tick = now
+
+    def report(self, name: str) -> str:
+        return (
+            f"{name}: action latency mean {mean(self.latencies) * 1000:.1f} ms "
+            f"max {max(self.latencies) * 1000:.1f} ms, game thread stall "
+            f"max {max(self.stalls) * 1000:.2f} ms total {sum(self.stalls) * 1000:.1f} ms"
+        )
+
+
+@pytest.mark.skipif(os.name != "posix", reason="Serves the actions on a UNIX socket")
+class TestClientIPCBenchmark:
+    @pytest.fixture()
+    def server(self) -> Iterator[UnrealAdaptorServer]:
+        server = UnrealAdaptorServer(UnrealActionsQueue(Mock()), Mock(), on_event=Mock())
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.actions_queue.enqueue_action(Action("close"))
+        server.shutdown()
+        thread.join(timeout=5)
+
+    def test_action_latency_and_stall(self, server: UnrealAdaptorServer) -> None:
+        """
+        Compares the former once per second game thread poll with the polling thread handing
+        the actions to every game thread tick
+        """
+        # GIVEN
+        client = Client(server.server_path)
+        legacy = GameThreadRun(server, server.actions_queue)
+        elapsed = [0.0]
+
+        def legacy_tick(delta_time: float) -> None:
+            elapsed[0] += delta_time
+            if elapsed[0] >= LEGACY_POLL_INTERVAL_SECONDS:
+                elapsed[0] = 0
+                _, _, action = client._request_next_action()
+                if action is not None:
+                    legacy.perform(action)
+
+        legacy.run(legacy_tick, keep_client_busy=True)
+        # Let the legacy client take the last keep-alive action
+        while len(server.actions_queue) > 0:
+            server.actions_queue.dequeue_action()
+
+        # WHEN
+        poller = ActionPoller(client._request_next_action)
+        threaded = GameThreadRun(server, server.actions_queue)
+
+        def threaded_tick(delta_time: float) -> None:
+            poller.start()
+            for action in poller.get_actions():
+                threaded.perform(action)
+
+        threaded.run(threaded_tick)
+
+        print(legacy.report("Game thread poll"))
+        print(threaded.report("Polling thread"))
+
+        # THEN
+        assert len(legacy.latencies) == len(threaded.latencies) == ACTIONS
+        # The actions are performed by the next ticks instead of the next poll, and the game thread
+        # never waits for the socket. The limits leave room for a loaded host.
+        assert max(threaded.latencies) < LEGACY_POLL_INTERVAL_SECONDS / 2
+        assert mean(threaded.latencies) < mean(legacy.latencies) / 4
+        assert max(threaded.stalls) < TICK_SECONDS
@@ -0,0 +1,89 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor import UnrealAdaptor
+
+from .fake_unreal_editor import install_fake_unreal_editor
+
+
+pytestmark = pytest.mark.benchmark
+
+STARTUP_SECONDS = 1.0
+FRAMES = 2
+FRAME_SECONDS = 0.05
+TASKS = 3
+
+
+@pytest.fixture()
+def adaptor_cls(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> type[UnrealAdaptor]:
+    install_fake_unreal_editor(
+        tmp_path / "bin",
+        monkeypatch,
+        startup_seconds=STARTUP_SECONDS,
+        frames=FRAMES,
+        frame_seconds=FRAME_SECONDS,
+    )
+    monkeypatch.setattr(UnrealAdaptor, "_is_rendering", False)
+    monkeypatch.setattr(UnrealAdaptor, "_get_deadline_telemetry_client", Mock())
+    return UnrealAdaptor
+
+
+def init_data() -> dict:
+    return {"project_path": "C:/LocalProjects/AWS_RND/AWS_RND.uproject"}
+
+
+def run_data() -> dict:
+    return {
+        "handler": "render",
+        "queue_manifest_path": "C:/LocalProjects/AWS_RND/Saved/MovieRenderPipeline/QueueManifest.utxt",
+    }
+
+
+def per_task_overhead(total_seconds: float) -> float:
+    return total_seconds / TASKS - FRAMES * FRAME_SECONDS
+
+
+@pytest.mark.skipif(os.name != "posix", reason="Fake Unreal Editor is a POSIX shell launcher")
+class TestDaemonModeBenchmark:
+    def test_per_task_overhead(self, adaptor_cls: type[UnrealAdaptor]) -> None:
+        """
+        Compares the per task overhead of the "run" command, which starts and stops Unreal for every
+        task, with the daemon mode that keeps one Unreal alive for all the tasks of the session.
+        """
+        # GIVEN
+        start = time.monotonic()
+        for _ in range(TASKS):
+            adaptor = adaptor_cls(init_data())
+            adaptor.on_start()
+            adaptor.on_run(run_data())
+            adaptor.on_stop()
+            adaptor.on_cleanup()
+        run_overhead = per_task_overhead(time.monotonic() - start)
+
+        # WHEN
+        start = time.monotonic()
+        adaptor = adaptor_cls(init_data())
+        adaptor.on_start()
+        for _ in range(TASKS):
+            adaptor.on_run(run_data())
+        adaptor.on_stop()
+        adaptor.on_cleanup()
+        daemon_overhead = per_task_overhead(time.monotonic() - start)
+
+        print(
+            f"Per task overhead over {TASKS} tasks with {STARTUP_SECONDS}s editor startup: "
+            f"run {run_overhead:.3f}s, daemon {daemon_overhead:.3f}s"
+        )
+
+        # THEN
+        # The editor startup is paid once per session instead of once per task,
+        # at least half of the saved startups are left on a loaded host
+        assert run_overhead - daemon_overhead >= STARTUP_SECONDS * (TASKS - 1) / TASKS * 0.5
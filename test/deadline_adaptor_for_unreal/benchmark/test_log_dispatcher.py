@@ -0,0 +1,124 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import re
+import sys
+import time
+import threading
+from pathlib import Path
+
+import pytest
+from openjd.adaptor_runtime.app_handlers import RegexCallback
+
+from deadline.unreal_adaptor.UnrealAdaptor.adaptor import UnrealSubprocessWithLogs
+from deadline.unreal_adaptor.UnrealAdaptor.log_matcher import UnrealLogDispatcher, UnrealLogMatcher
+
+
+pytestmark = pytest.mark.benchmark
+
+FRAMES = 100
+NOISE_LINES_PER_FRAME = 20
+PROGRESS_CALLBACK_SECONDS = 0.02
+
+# Prints the render log as fast as it can and writes the time it spent blocked on stdout
+CHATTY_UNREAL = """
+import sys
+import time
+
+frames, noise_lines, duration_path = int(sys.argv[1]), int(sys.argv[2]), sys.argv[3]
+start = time.monotonic()
+for frame in range(1, frames + 1):
+    for i in range(noise_lines):
+        print(f"LogStreaming: Display: Flushing async loaders, frame {frame}, package {i}")
+    print(f"LogPython: Render Executor: Progress: {frame / frames * 100}")
+print("LogPython: Error: Traceback (most recent call last):")
+print("LogPython: Render Executor: Rendering is complete")
+sys.stdout.flush()
+with open(duration_path, "w") as f:
+    f.write(str(time.monotonic() - start))
+"""
+
+
+class ChattyUnrealRun:
+    """Runs the chatty Unreal stand-in with the given handler type and records the callbacks"""
+
+    def __init__(self, tmp_path: Path, handler_type: type[UnrealLogMatcher]) -> None:
+        self.progress: list[float] = []
+        self.completed = 0
+        self.errors = 0
+
+        script = tmp_path / "chatty_unreal.py"
+        script.write_text(CHATTY_UNREAL)
+        duration_path = tmp_path / f"{handler_type.__name__}.duration"
+
+        callbacks = [
+            RegexCallback([re.compile("Render Executor: Progress: ([0-9.]+)")], self.on_progress),
+            RegexCallback([re.compile("Render Executor: Rendering is complete")], self.on_complete),
+            RegexCallback([re.compile("LogPython: Error:.*")], self.on_error),
+        ]
+        handler: UnrealLogMatcher
+        if handler_type is UnrealLogDispatcher:
+            handler = UnrealLogDispatcher(callbacks, coalescible_callbacks=[self.on_progress])
+        else:
+            handler = handler_type(callbacks)
+
+        exited = threading.Event()
+        UnrealSubprocessWithLogs(
+            args=[
+                sys.executable,
+                str(script),
+                str(FRAMES),
+                str(NOISE_LINES_PER_FRAME),
+                str(duration_path),
+            ],
+            stdout_handler=handler,
+            stderr_handler=handler,
+            on_exit=exited.set,
+        )
+        assert exited.wait(timeout=60)
+        self.write_seconds = float(duration_path.read_text())
+
+    def on_progress(self, match: re.Match) -> None:
+        # Stands for the status update and telemetry the adaptor does on every progress
+        time.sleep(PROGRESS_CALLBACK_SECONDS)
+        self.progress.append(float(match.group(1)))
+
+    def on_complete(self, match: re.Match) -> None:
+        self.completed += 1
+
+    def on_error(self, match: re.Match) -> None:
+        self.errors += 1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Pipe buffer sizes differ on Windows")
+class TestLogDispatcherBenchmark:
+    def test_chatty_unreal_does_not_stall(self, tmp_path: Path) -> None:
+        """
+        Compares the time a chatty Unreal spends writing its log when the slow progress callback
+        runs on the pipe reader thread and when it runs on the dispatcher thread
+        """
+        # GIVEN
+        inline = ChattyUnrealRun(tmp_path, UnrealLogMatcher)
+
+        # WHEN
+        dispatched = ChattyUnrealRun(tmp_path, UnrealLogDispatcher)
+
+        print(
+            f"Unreal writing {FRAMES * (NOISE_LINES_PER_FRAME + 1)} lines with a "
+            f"{PROGRESS_CALLBACK_SECONDS}s progress callback: inline {inline.write_seconds:.3f}s, "
+            f"dispatched {dispatched.write_seconds:.3f}s, "
+            f"{len(dispatched.progress)}/{FRAMES} progress lines dispatched"
+        )
+
+        # THEN
+        # Inline, Unreal is blocked on its stdout for the progress callbacks, about
+        # FRAMES * PROGRESS_CALLBACK_SECONDS. Dispatched, it never waits for them: the limit
+        # leaves room for a loaded host.
+        assert dispatched.write_seconds < FRAMES * PROGRESS_CALLBACK_SECONDS / 2
+        # Only progress is coalesced, the latest one is always dispatched
+        assert inline.progress == [frame / FRAMES * 100 for frame in range(1, FRAMES + 1)]
+        assert dispatched.progress[-1] == 100
+        assert dispatched.progress == sorted(dispatched.progress)
+        assert (inline.completed, inline.errors) == (1, 1)
+        assert (dispatched.completed, dispatched.errors) == (1, 1)
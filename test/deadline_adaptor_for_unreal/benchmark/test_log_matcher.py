@@ -0,0 +1,107 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import re
+import time
+import logging
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from openjd.adaptor_runtime.app_handlers import RegexCallback, RegexHandler
+
+from deadline.unreal_adaptor.UnrealAdaptor import UnrealAdaptor
+from deadline.unreal_adaptor.UnrealAdaptor.log_matcher import UnrealLogMatcher
+
+
+pytestmark = pytest.mark.benchmark
+
+# Excerpt of an UnrealEditor-Cmd stdout during a Movie Render Queue render:
+# shader compilation, streaming and texture building lines with the Render Executor progress
+RECORDED_LOG = Path(__file__).parent / "data" / "unreal_render.log"
+LINES_COUNT = 50000
+
+
+def recorded_log_records() -> list[logging.LogRecord]:
+    lines = RECORDED_LOG.read_text().splitlines()
+    lines = (lines * (LINES_COUNT // len(lines) + 1))[:LINES_COUNT]
+    return [
+        logging.LogRecord("stdout", logging.INFO, __file__, 0, line, None, None) for line in lines
+    ]
+
+
+def regex_callbacks(
+    on_match: Callable[[str, re.Match], None], leading_wildcard: bool = False
+) -> list[RegexCallback]:
+    """
+    Returns the adaptor regex callbacks calling on_match with the callback name.
+    With leading_wildcard, the patterns start with ".*" as the step handlers patterns did before.
+    """
+    adaptor = UnrealAdaptor({"project_path": "C:/LocalProjects/AWS_RND/AWS_RND.uproject"})
+    callbacks = []
+    for regex_callback in adaptor._get_regex_callbacks():
+        regex_list = regex_callback.regex_list
+        if leading_wildcard:
+            regex_list = [
+                re.compile("|".join(f".*{branch}" for branch in regex.pattern.split("|")))
+                for regex in regex_list
+            ]
+        callbacks.append(
+            RegexCallback(regex_list, named_callback(on_match, regex_callback.callback.__name__))
+        )
+    return callbacks
+
+
+def named_callback(
+    on_match: Callable[[str, re.Match], None], name: str
+) -> Callable[[re.Match], None]:
+    """Returns the regex callback calling on_match with the callback name"""
+
+    def callback(match: re.Match) -> None:
+        on_match(name, match)
+
+    return callback
+
+
+def lines_per_second(handler: logging.Handler, records: list[logging.LogRecord]) -> float:
+    start = time.perf_counter()
+    for record in records:
+        handler.emit(record)
+    return len(records) / (time.perf_counter() - start)
+
+
+class TestLogMatcherBenchmark:
+    def test_lines_per_second(self) -> None:
+        """
+        Compares the lines per second RegexHandler with the former leading ".*" patterns and
+        UnrealLogMatcher process on a recorded Unreal log
+        """
+        # GIVEN
+        records = recorded_log_records()
+        expected_matches: list[tuple[str, tuple]] = []
+        matches: list[tuple[str, tuple]] = []
+        regex_handler = RegexHandler(
+            regex_callbacks(
+                lambda name, match: expected_matches.append((name, match.groups())),
+                leading_wildcard=True,
+            )
+        )
+        matcher = UnrealLogMatcher(
+            regex_callbacks(lambda name, match: matches.append((name, match.groups())))
+        )
+
+        # WHEN
+        regex_handler_rate = lines_per_second(regex_handler, records)
+        matcher_rate = lines_per_second(matcher, records)
+
+        print(
+            f"Recorded Unreal log, {LINES_COUNT} lines: RegexHandler {regex_handler_rate:,.0f} "
+            f"lines/s, UnrealLogMatcher {matcher_rate:,.0f} lines/s "
+            f"(x{matcher_rate / regex_handler_rate:.1f})"
+        )
+
+        # THEN
+        assert matches == expected_matches
+        # The prefilter skips most lines without a regex, the limit leaves room for the host
+        assert matcher_rate > regex_handler_rate * 5
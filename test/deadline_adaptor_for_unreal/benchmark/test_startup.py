@@ -0,0 +1,68 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from openjd.adaptor_runtime_client import Action
+
+from deadline.unreal_adaptor.UnrealAdaptor import UnrealAdaptor
+
+from .fake_unreal_editor import install_fake_unreal_editor
+
+
+pytestmark = pytest.mark.benchmark
+
+STARTUP_SECONDS = 2.0
+# Setup of the adaptor that doesn't need to be done before the launch, e.g. a long list of
+# initialization actions to build
+SETUP_SECONDS = 2.0
+
+
+@pytest.mark.skipif(os.name != "posix", reason="Fake Unreal Editor is a POSIX shell launcher")
+class TestStartupBenchmark:
+    def test_startup_critical_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Tests that the editor is launched as soon as the socket path is known
+        and boots while the rest of the adaptor setup is done
+        """
+        # GIVEN
+        install_fake_unreal_editor(tmp_path / "bin", monkeypatch, startup_seconds=STARTUP_SECONDS)
+        monkeypatch.setattr(UnrealAdaptor, "_get_deadline_telemetry_client", Mock())
+
+        def slow_populate_action_queue(adaptor: UnrealAdaptor) -> None:
+            time.sleep(SETUP_SECONDS)
+            adaptor._action_queue.enqueue_action(Action("wait_result", {}))
+
+        monkeypatch.setattr(UnrealAdaptor, "_populate_action_queue", slow_populate_action_queue)
+        adaptor = UnrealAdaptor({"project_path": "C:/LocalProjects/AWS_RND/AWS_RND.uproject"})
+
+        # WHEN
+        try:
+            adaptor.on_start()
+        finally:
+            adaptor.on_stop()
+            adaptor.on_cleanup()
+
+        # THEN
+        record_event = adaptor._get_deadline_telemetry_client().record_event
+        report = next(
+            call.kwargs["event_details"]
+            for call in record_event.call_args_list
+            if call.kwargs["event_details"]["scope"] == "start"
+        )
+        phases = {phase["name"]: phase for phase in report["phases"]}
+        print(
+            f"Start with {STARTUP_SECONDS}s editor boot and {SETUP_SECONDS}s setup: "
+            f"launched after {phases['editor_boot']['start']:.3f}s, "
+            f"started after {report['total']:.3f}s"
+        )
+
+        # Launched before the setup is done, which is then no longer on the critical path.
+        # Done one after the other, they take STARTUP_SECONDS + SETUP_SECONDS.
+        assert phases["editor_boot"]["start"] < SETUP_SECONDS / 2
+        assert report["total"] < max(STARTUP_SECONDS, SETUP_SECONDS) * 1.5
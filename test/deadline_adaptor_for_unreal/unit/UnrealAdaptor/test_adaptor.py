@@ -2,15 +2,39 @@
 
 from __future__ import annotations
 
+import os
 import re
+import json
+import sys
+import signal
+import time
+import logging
+import threading
+from pathlib import Path
 from unittest.mock import Mock, PropertyMock, patch
 
 import pytest
 import jsonschema  # type: ignore
+from openjd.adaptor_runtime_client import Action
 
 
 from deadline.unreal_adaptor.UnrealAdaptor import UnrealAdaptor
-from deadline.unreal_adaptor.UnrealAdaptor.adaptor import UnrealNotRunningError
+from deadline.unreal_adaptor.UnrealAdaptor.adaptor import (
+    UnrealNotRunningError,
+    UnrealRunCanceledError,
+    UnrealStalledError,
+    UnrealSubprocessWithLogs,
+)
+from deadline.unreal_adaptor.UnrealAdaptor.derived_data_cache import (
+    get_fill_fingerprint,
+    get_fill_marker_path,
+)
+from deadline.unreal_adaptor.UnrealAdaptor.process_tree import get_child_pids
+from deadline.unreal_adaptor.UnrealAdaptor.progress_estimator import ProgressEstimator
+from deadline.unreal_adaptor.UnrealClient import step_events
+
+from .test_process_tree import FAKE_UNREAL_SCRIPT, wait_for_exit
+from .test_watchdog import FakeClock
 
 
 @pytest.fixture()
@@ -45,13 +69,20 @@ def run_data() -> dict:
     }
 
 
+def log_match(pattern: str, line: str) -> re.Match:
+    """Returns the match of the Unreal log line the adaptor callbacks receive"""
+    match = re.search(pattern, line)
+    assert match is not None
+    return match
+
+
 class TestUnrealAdaptor_on_start:
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_no_error(
         self,
         mock_server: Mock,
@@ -65,62 +96,70 @@ class TestUnrealAdaptor_on_start:
         mock_server.return_value.server_path = "/tmp/9999"
         adaptor.on_start()
 
-    @patch("time.sleep")
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
-    def test__wait_for_socket(
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    def test_socket_path_set_before_launch(
         self,
         mock_server: Mock,
         mock_logging_subprocess: Mock,
         mock_actions_queue: Mock,
         mock_telemetry_client: Mock,
-        mock_sleep: Mock,
         init_data: dict,
     ) -> None:
-        """Tests that the _wait_for_socket method sleeps until a socket is available"""
+        """Tests that Unreal is launched with the socket path of the server it serves on"""
         # GIVEN
         adaptor = UnrealAdaptor(init_data)
-        socket_mock = PropertyMock(
-            side_effect=[None, None, None, "/tmp/9999", "/tmp/9999", "/tmp/9999"]
-        )
-        type(mock_server.return_value).server_path = socket_mock
+        server: Mock = mock_server.return_value
+        server.server_path = "/tmp/9999"
+        launch_socket_paths: list[str] = []
+
+        def launch(**kwargs):
+            launch_socket_paths.append(os.environ["UNREAL_ADAPTOR_SOCKET_PATH"])
+            return mock_logging_subprocess.return_value
+
+        mock_logging_subprocess.side_effect = launch
 
         # WHEN
         adaptor.on_start()
 
         # THEN
-        assert mock_sleep.call_count == 3
+        assert adaptor._server is server
+        assert launch_socket_paths == ["/tmp/9999"]
+        assert adaptor._server_thread is not None
+        adaptor._server_thread.join(timeout=5)
+        server.serve_forever.assert_called_once()
 
-    @patch("threading.Thread")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
-    def test_server_init_fail(self, mock_server: Mock, mock_thread: Mock, init_data: dict) -> None:
-        """Tests that an error is raised if no socket becomes available"""
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    def test_server_init_fail(
+        self, mock_server: Mock, mock_logging_subprocess: Mock, init_data: dict
+    ) -> None:
+        """Tests that Unreal is not launched if the server cannot be created"""
         # GIVEN
         adaptor = UnrealAdaptor(init_data)
+        mock_server.side_effect = OSError("Address already in use")
 
         with (
-            patch.object(adaptor, "_SERVER_START_TIMEOUT_SECONDS", 0.01),
-            pytest.raises(RuntimeError) as exc_info,
+            patch.object(adaptor, "_get_deadline_telemetry_client"),
+            pytest.raises(OSError) as exc_info,
         ):
             # WHEN
             adaptor.on_start()
 
         # THEN
-        assert (
-            str(exc_info.value)
-            == "Could not find a socket path because the server did not finish initializing"
-        )
+        assert str(exc_info.value) == "Address already in use"
+        mock_logging_subprocess.assert_not_called()
 
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=1)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_unreal_init_timeout(
         self,
         mock_server: Mock,
@@ -158,7 +197,7 @@ class TestUnrealAdaptor_on_start:
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=1)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_unreal_init_fail(
         self,
         mock_server: Mock,
@@ -187,7 +226,7 @@ class TestUnrealAdaptor_on_start:
     @patch.object(UnrealAdaptor, "_unreal_is_running", False)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=1)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_init_data_wrong_schema(
         self,
         mock_server: Mock,
@@ -211,80 +250,75 @@ class TestUnrealAdaptor_on_start:
 
 
 class TestUnrealAdaptor_on_run:
-    @patch("time.sleep")
+    @patch.object(UnrealAdaptor, "_is_rendering", False)
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_on_run(
         self,
         mock_server: Mock,
         mock_logging_subprocess: Mock,
         mock_actions_queue: Mock,
         mock_telemetry_client: Mock,
-        mock_sleep: Mock,
         init_data: dict,
         run_data: dict,
     ) -> None:
-        """Tests that on_run completes without error, and waits"""
+        """Tests that on_run completes without error, and keeps the client busy while waiting"""
         # GIVEN
         adaptor = UnrealAdaptor(init_data)
         mock_server.return_value.server_path = "/tmp/9999"
-        # First side_effect value consumed by setter
-        is_rendering_mock = PropertyMock(side_effect=[None, True, False])
-        UnrealAdaptor._is_rendering = is_rendering_mock
         adaptor.on_start()
+        complete = re.compile("Render Executor: Rendering is complete").search(
+            "Render Executor: Rendering is complete"
+        )
 
         # WHEN
-        adaptor.on_run(run_data)
+        with patch.object(adaptor, "_WAIT_RESULT_INTERVAL_SECONDS", 0.01):
+            threading.Timer(0.1, adaptor._handle_complete, args=(complete,)).start()
+            adaptor.on_run(run_data)
 
         # THEN
-        mock_sleep.assert_called_once_with(1)
+        enqueued_actions = [action.name for action in adaptor._action_queue._actions_queue]
+        assert enqueued_actions[:2] == ["set_handler", "run_script"]
+        assert "wait_result" in enqueued_actions[2:]
 
-    @patch("time.sleep")
-    @patch(
-        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._is_rendering",
-        new_callable=PropertyMock,
-    )
-    @patch(
-        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_is_running",
-        new_callable=PropertyMock,
-    )
+    @patch.object(UnrealAdaptor, "_is_rendering", False)
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_on_run_render_fail(
         self,
         mock_server: Mock,
         mock_logging_subprocess: Mock,
         mock_actions_queue: Mock,
         mock_telemetry_client: Mock,
-        mock_unreal_is_running: Mock,
-        mock_is_rendering: Mock,
-        mock_sleep: Mock,
         init_data: dict,
         run_data: dict,
     ) -> None:
         """Tests that on_run raises an error if the render fails"""
         # GIVEN
-        mock_is_rendering.side_effect = [None, True, False]
-        mock_unreal_is_running.side_effect = [True, True, True, False, False]
         mock_logging_subprocess.return_value.returncode = 1
         adaptor = UnrealAdaptor(init_data)
         mock_server.return_value.server_path = "/tmp/9999"
         adaptor.on_start()
+        on_exit = mock_logging_subprocess.call_args.kwargs["on_exit"]
+
+        def unreal_exit():
+            mock_logging_subprocess.return_value.is_running = False
+            on_exit()
 
         # WHEN
         with pytest.raises(RuntimeError) as exc_info:
+            threading.Timer(0.1, unreal_exit).start()
             adaptor.on_run(run_data)
 
         # THEN
-        mock_sleep.assert_called_once_with(1)
         assert str(exc_info.value) == (
             "Unreal exited early and did not render successfully, please check render logs. "
             "Exit code 1"
@@ -296,7 +330,7 @@ class TestUnrealAdaptor_on_run:
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_run_data_wrong_schema(
         self,
         mock_server: Mock,
@@ -332,7 +366,7 @@ class TestUnrealAdaptor_on_stop:
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_on_stop(
         self,
         mock_server: Mock,
@@ -414,7 +448,7 @@ class TestUnrealAdaptor_on_cleanup:
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_on_cleanup(
         self,
         mock_server: Mock,
@@ -485,7 +519,9 @@ class TestUnrealAdaptor_on_cleanup:
 
         # THEN
         assert match is not None
-        mock_update_status.assert_called_once_with(progress=expected_progress)
+        mock_update_status.assert_called_once_with(
+            progress=expected_progress, status_message=f"Rendering {expected_progress}%"
+        )
 
     @pytest.mark.parametrize(
         "stdout, error_regex",
@@ -550,6 +586,64 @@ class TestUnrealAdaptor_on_cleanup:
         assert raised_err.match("Cannot render because Unreal is not running.")
 
 
+class TestUnrealAdaptor_fast_teardown:
+    def cleanup(self, adaptor: UnrealAdaptor, exit_ready: bool) -> tuple[Mock, list[str]]:
+        """
+        Cleans up the adaptor with Unreal running, the UnrealClient confirms the fast exit
+        if exit_ready is True. Returns the Unreal client mock and the names of the sent actions.
+        """
+        actions: list[str] = []
+        mock_client = Mock(is_running=True)
+
+        def enqueue_action(action: Action, front: bool = False) -> None:
+            actions.append(action.name)
+            if action.name == "fast_exit" and exit_ready:
+                adaptor._handle_unreal_event(step_events.EXIT_READY, {})
+
+        def terminate(grace_time_s: float) -> None:
+            mock_client.is_running = False
+
+        mock_client.terminate.side_effect = terminate
+        adaptor._unreal_client = mock_client
+        with (
+            patch.object(adaptor, "_UNREAL_END_TIMEOUT_SECONDS", 0.01),
+            patch.object(adaptor, "_FAST_EXIT_TIMEOUT_SECONDS", 0.01),
+            patch.object(adaptor._action_queue, "enqueue_action", side_effect=enqueue_action),
+        ):
+            adaptor.on_cleanup()
+        return mock_client, actions
+
+    def test_fast_exit(self, init_data: dict) -> None:
+        """Tests that Unreal is terminated once the UnrealClient flushed its outputs"""
+        adaptor = UnrealAdaptor({**init_data, "fast_teardown": True})
+
+        mock_client, actions = self.cleanup(adaptor, exit_ready=True)
+
+        assert actions == ["fast_exit"]
+        mock_client.terminate.assert_called_once_with(grace_time_s=0)
+
+    def test_fast_exit_not_confirmed(self, init_data: dict) -> None:
+        """Tests that Unreal is closed normally if the UnrealClient doesn't confirm the fast exit"""
+        adaptor = UnrealAdaptor({**init_data, "fast_teardown": True})
+
+        _, actions = self.cleanup(adaptor, exit_ready=False)
+
+        assert actions == ["fast_exit", "close"]
+
+    def test_normal_close_to_write_asset_registry_cache(
+        self, init_data: dict, tmp_path: Path
+    ) -> None:
+        """Tests that Unreal is closed normally when the asset registry cache is not written yet"""
+        adaptor = UnrealAdaptor(
+            {**init_data, "fast_teardown": True, "asset_registry_cache_path": str(tmp_path)}
+        )
+        adaptor._restore_asset_registry_cache()
+
+        _, actions = self.cleanup(adaptor, exit_ready=True)
+
+        assert actions == ["close"]
+
+
 class TestUnrealAdaptor_on_cancel:
     """Tests for UnrealAdaptor.on_cancel"""
 
@@ -582,3 +676,1149 @@ class TestUnrealAdaptor_on_cancel:
         # THEN
         assert "CANCEL REQUESTED" in caplog.text
         assert "Nothing to cancel because Unreal is not running" in caplog.text
+
+
+class TestUnrealAdaptor_wait_latency:
+    """Tests that the adaptor waiters are woken up by the Unreal events instead of polling"""
+
+    # Much lower than the _WAIT_RESULT_INTERVAL_SECONDS the former polling loop slept for
+    MAX_LATENCY_SECONDS = 0.2
+
+    @pytest.mark.parametrize("event", ["complete", "error", "exit"])
+    @patch.object(UnrealAdaptor, "_is_rendering", False)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    def test_completion_to_return_latency(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_telemetry_client: Mock,
+        event: str,
+        init_data: dict,
+        run_data: dict,
+    ) -> None:
+        """Measures the time between the Unreal event and the return of on_run"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        mock_server.return_value.server_path = "/tmp/9999"
+        adaptor.on_start()
+        on_exit = mock_logging_subprocess.call_args.kwargs["on_exit"]
+        event_time: list[float] = []
+
+        def fire_event():
+            event_time.append(time.monotonic())
+            if event == "complete":
+                adaptor._handle_complete(log_match(".*", "Render Executor: Rendering is complete"))
+            elif event == "error":
+                adaptor._handle_error(log_match(".*", "Render Executor: Error: failed"))
+            else:
+                mock_logging_subprocess.return_value.is_running = False
+                on_exit()
+
+        # WHEN
+        threading.Timer(0.3, fire_event).start()
+        try:
+            adaptor.on_run(run_data)
+        except RuntimeError:
+            assert event != "complete"
+        latency = time.monotonic() - event_time[0]
+
+        # THEN
+        print(f"Completion to return latency on {event}: {latency * 1000:.1f} ms")
+        assert latency < self.MAX_LATENCY_SECONDS
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    def test_unreal_started_latency(
+        self, mock_server: Mock, mock_logging_subprocess: Mock, init_data: dict
+    ) -> None:
+        """Measures the time between the last initialization action taken and the end of the wait"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._action_queue.enqueue_action(Action("initialize", {}))
+        dequeue_time: list[float] = []
+
+        def take_action():
+            dequeue_time.append(time.monotonic())
+            adaptor._action_queue.dequeue_action()
+
+        # WHEN
+        adaptor._start_unreal_client()
+        threading.Timer(0.3, take_action).start()
+        with patch.object(adaptor, "_get_deadline_telemetry_client"):
+            adaptor._wait_for_unreal_started()
+        latency = time.monotonic() - dequeue_time[0]
+
+        # THEN
+        assert latency < self.MAX_LATENCY_SECONDS
+
+
+class TestUnrealAdaptor_events:
+    @pytest.mark.parametrize(
+        "name, args, expected_progress",
+        [
+            ("progress", {"progress": 42.5}, 42),
+            ("frame_done", {"frame": 3, "total": 12}, 25),
+            ("frame_done", {"frame": 13, "total": 12}, 100),
+        ],
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_progress_events(
+        self,
+        mock_update_status: Mock,
+        name: str,
+        args: dict,
+        expected_progress: int,
+        init_data: dict,
+    ) -> None:
+        """Tests that the progress and frame_done events update the progress"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+
+        # WHEN
+        adaptor._handle_unreal_event(name, args)
+
+        # THEN
+        mock_update_status.assert_called_once_with(
+            progress=expected_progress, status_message=f"Rendering {expected_progress}%"
+        )
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_progress_of_custom_step(self, mock_update_status: Mock, init_data: dict) -> None:
+        """Tests that the status of a custom script step doesn't tell it renders"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._reset_progress("custom")
+
+        # WHEN
+        adaptor._handle_unreal_event("progress", {"progress": 42.5})
+
+        # THEN
+        mock_update_status.assert_called_once_with(progress=42, status_message="Running 42%")
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_progress_coalesced(self, mock_update_status: Mock, init_data: dict) -> None:
+        """
+        Tests that the worker status is updated when the progress changed enough,
+        with the throughput and the ETA of the run
+        """
+        # GIVEN
+        clock = FakeClock()
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._progress_coalescer = step_events.ProgressCoalescer(
+            min_step=1, min_interval=60, clock=clock
+        )
+        adaptor._progress_estimator = ProgressEstimator(clock=clock)
+        adaptor._reset_progress()
+
+        # WHEN
+        # 800 frames of 4 temporal samples each, 2 seconds per frame
+        for engine_frame in range(1, 3201):
+            clock.now += 0.5
+            adaptor._handle_unreal_event("frame_done", {"frame": engine_frame // 4, "total": 800})
+
+        # THEN
+        assert mock_update_status.call_count == 101
+        assert mock_update_status.call_args_list[50].kwargs == {
+            "progress": 50,
+            "status_message": "Rendering 50%, 30.0 frames/min, ETA 13m 20s",
+        }
+        assert mock_update_status.call_args.kwargs["progress"] == 100
+
+    @patch.object(UnrealAdaptor, "_is_rendering", True)
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_complete_event(self, mock_update_status: Mock, init_data: dict) -> None:
+        """Tests that the complete event ends the render, and the log line doesn't repeat it"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        complete_regex = adaptor._get_regex_callbacks()[1].regex_list[0]
+
+        # WHEN
+        adaptor._handle_unreal_event("complete", {})
+        adaptor._handle_complete(
+            log_match(complete_regex.pattern, "Render Executor: Rendering is complete")
+        )
+
+        # THEN
+        assert adaptor._is_rendering is False
+        mock_update_status.assert_called_once_with(progress=100)
+
+    @patch.object(UnrealAdaptor, "_is_rendering", True)
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_late_complete_line(self, mock_update_status: Mock, init_data: dict) -> None:
+        """Tests that the complete line of the previous run, logged late, doesn't end the next run"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        complete_regex = adaptor._get_regex_callbacks()[1].regex_list[0]
+        adaptor._handle_unreal_event("complete", {})
+        adaptor._is_rendering = True  # next run
+        adaptor._handle_unreal_event("started", {})
+
+        # WHEN
+        adaptor._handle_complete(
+            log_match(complete_regex.pattern, "Render Executor: Rendering is complete")
+        )
+
+        # THEN
+        assert adaptor._is_rendering is True
+        mock_update_status.assert_called_once_with(progress=100)
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._run_on_unreal")
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    def test_task_timing_report(
+        self,
+        mock_logging_subprocess: Mock,
+        mock_telemetry_client: Mock,
+        mock_run_on_unreal: Mock,
+        init_data: dict,
+        run_data: dict,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Tests that the phases reported by Unreal are in the timing report of the task"""
+        # GIVEN
+        caplog.set_level(0)
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._unreal_client = mock_logging_subprocess.return_value
+        mock_run_on_unreal.side_effect = lambda run_data: adaptor._handle_unreal_event(
+            "phase", {"phase": "render", "duration": 2.5}
+        )
+
+        # WHEN
+        adaptor.on_run(run_data)
+
+        # THEN
+        record_event = mock_telemetry_client.return_value.record_event
+        record_event.assert_called_once()
+        assert record_event.call_args.kwargs["event_type"] == (
+            "com.amazon.rum.deadline.adaptor.runtime.task"
+        )
+        report = record_event.call_args.kwargs["event_details"]
+        phases = {phase["name"]: phase for phase in report["phases"]}
+        assert sorted(phases) == ["render", "run"]
+        assert phases["render"]["duration"] == 2.5
+        assert f"Unreal adaptor task timings: {json.dumps(report)}" in caplog.messages
+
+    def test_error_event(self, init_data: dict) -> None:
+        """Tests that the error event stores the error to raise"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+
+        # WHEN
+        adaptor._handle_unreal_event("error", {"message": "Render failed"})
+
+        # THEN
+        assert str(adaptor._exc_info) == "Unreal Encountered an Error: Render failed"
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_log_progress_ignored_after_events(
+        self, mock_update_status: Mock, init_data: dict
+    ) -> None:
+        """Tests that the progress log lines are only a fallback once the events are received"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        progress_regex = adaptor._get_regex_callbacks()[0].regex_list[0]
+        adaptor._handle_unreal_event("started", {})
+
+        # WHEN
+        adaptor._handle_progress(
+            log_match(progress_regex.pattern, "Render Executor: Progress: 50.0")
+        )
+
+        # THEN
+        mock_update_status.assert_not_called()
+
+    @patch.object(UnrealAdaptor, "_is_rendering", False)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    def test_on_run_without_wait_result(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+        run_data: dict,
+    ) -> None:
+        """Tests that on_run doesn't keep the client busy when it sends the step events"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        mock_server.return_value.server_path = "/tmp/9999"
+        adaptor.on_start()
+
+        def unreal_client():
+            # UnrealClient takes the actions, starts the render and reports it with the events.
+            # Started is sent first so the test doesn't depend on the wait interval.
+            adaptor._handle_unreal_event("started", {})
+            while True:
+                action = adaptor._action_queue.dequeue_action()
+                if action is not None and action.name == "run_script":
+                    break
+            for frame in range(1, 4):
+                time.sleep(0.02)
+                adaptor._handle_unreal_event("frame_done", {"frame": frame, "total": 3})
+            adaptor._handle_unreal_event("complete", {})
+
+        # WHEN
+        with patch.object(adaptor, "_WAIT_RESULT_INTERVAL_SECONDS", 0.01):
+            threading.Timer(0.1, unreal_client).start()
+            adaptor.on_run(run_data)
+
+        # THEN
+        assert len(adaptor._action_queue) == 0
+
+
+class TestUnrealAdaptor_crash_recovery:
+    @patch.object(UnrealAdaptor, "_is_rendering", False)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    @pytest.mark.parametrize("resume", [False, True])
+    def test_relaunch_and_resume(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_telemetry_client: Mock,
+        resume: bool,
+        init_data: dict,
+        run_data: dict,
+    ) -> None:
+        """
+        Tests that the run resumes on a relaunched Unreal after a crash, from the frames of the
+        crashed run unless the submitter resumed the render
+        """
+        # GIVEN
+        crashed_unreal = Mock(is_running=True, returncode=-11)
+        relaunched_unreal = Mock(is_running=True)
+        mock_logging_subprocess.side_effect = [crashed_unreal, relaunched_unreal]
+        mock_server.return_value.server_path = "/tmp/9999"
+        adaptor = UnrealAdaptor(init_data)
+        adaptor.on_start()
+        run_scripts: list[dict] = []
+
+        def take_run_script() -> None:
+            while True:
+                action = adaptor._action_queue.dequeue_action()
+                if action is not None and action.name == "run_script":
+                    run_scripts.append(action.args or {})
+                    return
+                time.sleep(0.001)
+
+        def unreal_client():
+            take_run_script()
+            adaptor._handle_unreal_event("started", {})
+            crashed_unreal.is_running = False
+            mock_logging_subprocess.call_args.kwargs["on_exit"]()
+
+            take_run_script()
+            adaptor._handle_unreal_event("started", {})
+            adaptor._handle_unreal_event("complete", {})
+
+        # WHEN
+        threading.Thread(target=unreal_client, daemon=True).start()
+        run_start_time = time.time()
+        adaptor.on_run({**run_data, "frames": "0-99", "resume": resume})
+
+        # THEN
+        assert mock_logging_subprocess.call_count == 2
+        assert mock_server.call_count == 1
+        assert run_scripts[0]["resume"] is resume
+        if not resume:
+            # Only the frames of the crashed run are kept
+            resume_since = run_scripts[1].pop("resume_since")
+            assert run_start_time <= resume_since <= time.time()
+        assert run_scripts[1] == {**run_data, "frames": "0-99", "resume": True}
+        assert adaptor._unreal_client is relaunched_unreal
+
+    @patch.object(UnrealAdaptor, "_is_rendering", False)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    def test_cancel_not_relaunched(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+        run_data: dict,
+    ) -> None:
+        """Tests that Unreal terminated by the cancel is not taken for a crash and relaunched"""
+        # GIVEN
+        unreal = Mock(is_running=True, returncode=-9)
+
+        def terminate(grace_time_s: float) -> None:
+            unreal.is_running = False
+            mock_logging_subprocess.call_args.kwargs["on_exit"]()
+
+        unreal.terminate.side_effect = terminate
+        mock_logging_subprocess.return_value = unreal
+        mock_server.return_value.server_path = "/tmp/9999"
+        adaptor = UnrealAdaptor({**init_data, "crash_retries": 2})
+        adaptor.on_start()
+
+        def unreal_client():
+            # Unreal renders the first frames when the task is canceled
+            while True:
+                action = adaptor._action_queue.dequeue_action()
+                if action is not None and action.name == "run_script":
+                    break
+                time.sleep(0.001)
+            adaptor._handle_unreal_event("started", {})
+            adaptor._handle_unreal_event("frame_done", {"frame": 1, "total": 100})
+            adaptor.on_cancel()
+
+        # WHEN
+        threading.Thread(target=unreal_client, daemon=True).start()
+        with pytest.raises(UnrealRunCanceledError):
+            adaptor.on_run(run_data)
+
+        # THEN
+        unreal.terminate.assert_called_once_with(grace_time_s=0)
+        assert mock_logging_subprocess.call_count == 1
+        with pytest.raises(UnrealRunCanceledError):
+            adaptor.on_run(run_data)
+        assert mock_logging_subprocess.call_count == 1
+
+    @patch.object(UnrealAdaptor, "_is_rendering", False)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    def test_retry_budget(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+        run_data: dict,
+    ) -> None:
+        """Tests that the run fails once Unreal crashed more times than the retry budget"""
+        # GIVEN
+        mock_logging_subprocess.return_value.returncode = -11
+        mock_server.return_value.server_path = "/tmp/9999"
+        adaptor = UnrealAdaptor({**init_data, "crash_retries": 2})
+        adaptor.on_start()
+
+        def unreal_crash():
+            # Every relaunched Unreal exits right away
+            while len(adaptor._action_queue) == 0:
+                time.sleep(0.001)
+            mock_logging_subprocess.return_value.is_running = False
+            mock_logging_subprocess.call_args.kwargs["on_exit"]()
+
+        # WHEN
+        threading.Thread(target=unreal_crash, daemon=True).start()
+        with pytest.raises(RuntimeError) as exc_info:
+            adaptor.on_run(run_data)
+
+        # THEN
+        assert str(exc_info.value) == (
+            "Unreal exited early and did not render successfully, please check render logs. "
+            "Exit code -11"
+        )
+        # Launched once on start and relaunched twice
+        assert mock_logging_subprocess.call_count == 3
+
+
+class TestUnrealAdaptor_watchdog:
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    def test_startup_stall(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Tests that the startup fails fast when Unreal stops logging"""
+        # GIVEN
+        mock_server.return_value.server_path = "/tmp/9999"
+        adaptor = UnrealAdaptor({**init_data, "startup_stall_timeout_seconds": 0.1})
+        # Initialization action the hung Unreal never takes
+        adaptor._action_queue.enqueue_action(Action("initialize", {}))
+
+        # WHEN
+        with (
+            patch.object(adaptor, "_WATCHDOG_INTERVAL_SECONDS", 0.01),
+            pytest.raises(UnrealStalledError),
+        ):
+            start = time.monotonic()
+            adaptor._start_unreal_client()
+            assert adaptor._unreal_log_handler is not None
+            adaptor._unreal_log_handler.emit(Mock(msg="LogShaderCompilers: Display: Waiting"))
+            adaptor._wait_for_unreal_started()
+
+        # THEN
+        assert time.monotonic() - start < 1
+        mock_logging_subprocess.return_value.terminate.assert_called_once_with(grace_time_s=0)
+        assert "Unreal made no startup progress" in caplog.text
+        assert "LogShaderCompilers: Display: Waiting" in caplog.text
+
+    @patch.object(UnrealAdaptor, "_is_rendering", False)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    def test_run_stall(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+        run_data: dict,
+    ) -> None:
+        """Tests that the run fails fast when the render stops progressing, without relaunch"""
+        # GIVEN
+        mock_server.return_value.server_path = "/tmp/9999"
+        adaptor = UnrealAdaptor({**init_data, "run_stall_timeout_seconds": 0.2})
+        adaptor.on_start()
+
+        def unreal_client():
+            adaptor._handle_unreal_event("started", {})
+            for frame in range(1, 3):
+                time.sleep(0.05)
+                adaptor._handle_unreal_event("frame_done", {"frame": frame, "total": 100})
+
+        # WHEN
+        with (
+            patch.object(adaptor, "_WAIT_RESULT_INTERVAL_SECONDS", 0.01),
+            pytest.raises(UnrealStalledError) as exc_info,
+        ):
+            threading.Thread(target=unreal_client, daemon=True).start()
+            adaptor.on_run(run_data)
+
+        # THEN
+        assert str(exc_info.value).startswith("Unreal made no render progress for")
+        assert mock_logging_subprocess.call_count == 1
+        mock_logging_subprocess.return_value.terminate.assert_called_once_with(grace_time_s=0)
+
+    @patch.object(UnrealAdaptor, "_is_rendering", False)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    def test_progress_keeps_run_alive(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+        run_data: dict,
+    ) -> None:
+        """Tests that a run longer than the stall timeout completes while it progresses"""
+        # GIVEN
+        mock_server.return_value.server_path = "/tmp/9999"
+        adaptor = UnrealAdaptor({**init_data, "run_stall_timeout_seconds": 0.15})
+        adaptor.on_start()
+
+        def unreal_client():
+            adaptor._handle_unreal_event("started", {})
+            for frame in range(1, 11):
+                time.sleep(0.05)
+                adaptor._handle_unreal_event("frame_done", {"frame": frame, "total": 10})
+            adaptor._handle_unreal_event("complete", {})
+
+        # WHEN
+        with patch.object(adaptor, "_WAIT_RESULT_INTERVAL_SECONDS", 0.01):
+            threading.Thread(target=unreal_client, daemon=True).start()
+            adaptor.on_run(run_data)
+
+        # THEN
+        mock_logging_subprocess.return_value.terminate.assert_not_called()
+
+    @patch.object(UnrealAdaptor, "_is_rendering", False)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    def test_log_output_keeps_run_alive(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+        run_data: dict,
+    ) -> None:
+        """Tests that the Unreal log output before the first frame counts as run progress"""
+        # GIVEN
+        mock_server.return_value.server_path = "/tmp/9999"
+        adaptor = UnrealAdaptor({**init_data, "run_stall_timeout_seconds": 0.15})
+        adaptor.on_start()
+        log_handler = mock_logging_subprocess.call_args.kwargs["stdout_handler"]
+
+        def unreal_client():
+            adaptor._handle_unreal_event("started", {})
+            for i in range(10):
+                time.sleep(0.05)
+                log_handler.emit(
+                    logging.LogRecord(
+                        "stdout", logging.INFO, __file__, 0, f"LogShaderCompilers: {i}", None, None
+                    )
+                )
+            adaptor._handle_unreal_event("complete", {})
+
+        # WHEN
+        with patch.object(adaptor, "_WAIT_RESULT_INTERVAL_SECONDS", 0.01):
+            threading.Thread(target=unreal_client, daemon=True).start()
+            adaptor.on_run(run_data)
+
+        # THEN
+        mock_logging_subprocess.return_value.terminate.assert_not_called()
+
+
+class TestUnrealAdaptor_memory_recycling:
+    MB = 1024 * 1024
+
+    @pytest.mark.parametrize(
+        "limits, rss_mb, expected_reason",
+        [
+            ({"memory_ceiling_mb": 8000}, [4000, 6000, 7000], None),
+            ({"memory_ceiling_mb": 8000}, [4000, 6000, 9000], "over the ceiling of 8000 MB"),
+            ({"memory_growth_mb_per_run": 1000}, [4000, 5000, 6000], None),
+            ({"memory_growth_mb_per_run": 1000}, [4000, 5000, 7000], "grew by 1500 MB per run"),
+            ({}, [4000, 50000, 90000], None),
+        ],
+    )
+    def test_recycle_reason(
+        self, init_data: dict, limits: dict, rss_mb: list[int], expected_reason: str | None
+    ) -> None:
+        """Tests that Unreal is recycled once its memory crosses the ceiling or the growth rate"""
+        # GIVEN
+        adaptor = UnrealAdaptor({**init_data, **limits})
+        adaptor._unreal_client = Mock()
+
+        # WHEN
+        reasons = []
+        with patch(
+            "deadline.unreal_adaptor.UnrealAdaptor.adaptor.get_process_tree_rss",
+            side_effect=[rss * self.MB for rss in rss_mb],
+        ):
+            for _ in rss_mb:
+                reasons.append(adaptor._get_recycle_reason())
+                adaptor._unreal_runs_count += 1
+
+        # THEN
+        assert reasons[:-1] == [None] * (len(rss_mb) - 1)
+        if expected_reason is None:
+            assert reasons[-1] is None
+        else:
+            assert reasons[-1] is not None and expected_reason in reasons[-1]
+
+    @patch.object(UnrealAdaptor, "_is_rendering", False)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    def test_recycle_before_run(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+        run_data: dict,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Tests that the recycled Unreal is closed and a new one renders the next run"""
+        # GIVEN
+        caplog.set_level(0)
+        old_unreal = Mock(is_running=True)
+        new_unreal = Mock(is_running=True)
+        mock_logging_subprocess.side_effect = [old_unreal, new_unreal]
+        mock_server.return_value.server_path = "/tmp/9999"
+        adaptor = UnrealAdaptor({**init_data, "memory_ceiling_mb": 8000})
+        adaptor.on_start()
+        adaptor._memory_baseline = 4000 * self.MB
+        adaptor._unreal_runs_count = 3
+        actions: list[str] = []
+
+        def unreal_client():
+            while True:
+                action = adaptor._action_queue.dequeue_action()
+                if action is None:
+                    time.sleep(0.001)
+                    continue
+                actions.append(action.name)
+                if action.name == "close":
+                    old_unreal.is_running = False
+                    mock_logging_subprocess.call_args.kwargs["on_exit"]()
+                elif action.name == "run_script":
+                    adaptor._handle_unreal_event("complete", {})
+                    return
+
+        # WHEN
+        threading.Thread(target=unreal_client, daemon=True).start()
+        with patch(
+            "deadline.unreal_adaptor.UnrealAdaptor.adaptor.get_process_tree_rss",
+            return_value=9000 * self.MB,
+        ):
+            adaptor.on_run(run_data)
+
+        # THEN
+        assert actions == ["close", "set_handler", "run_script"]
+        assert adaptor._unreal_client is new_unreal
+        assert adaptor._unreal_runs_count == 1
+        assert "Recycling Unreal: memory 9000 MB is over the ceiling of 8000 MB" in caplog.text
+
+
+@patch.dict(os.environ)
+class TestUnrealAdaptor_derived_data_cache:
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    def test_fill_once_per_node(
+        self, mock_logging_subprocess: Mock, init_data: dict, tmp_path: Path
+    ) -> None:
+        """Tests that the DDC fill environment fills the DDC of the node for the project once"""
+        # GIVEN
+        mock_logging_subprocess.return_value.returncode = 0
+        fill_init_data = {**init_data, "ddc_path": str(tmp_path), "ddc_fill": True}
+        fingerprint = get_fill_fingerprint(init_data["project_path"], "UnrealEditor-Cmd")
+
+        # WHEN
+        for _ in range(2):
+            adaptor = UnrealAdaptor(fill_init_data)
+            adaptor.on_start()
+            adaptor.on_run({"handler": "ddc_fill"})
+            adaptor.on_cleanup()
+
+        # THEN
+        mock_logging_subprocess.assert_called_once()
+        args = mock_logging_subprocess.call_args.kwargs["args"]
+        assert args[1:4] == [init_data["project_path"], "-run=DerivedDataCache", "-fill"]
+        assert os.environ["UE-LocalDataCachePath"] == str(tmp_path)
+        assert os.path.exists(
+            get_fill_marker_path(str(tmp_path), init_data["project_path"], fingerprint)
+        )
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    def test_fill_failure(self, mock_logging_subprocess: Mock, init_data: dict, tmp_path: Path):
+        # GIVEN
+        mock_logging_subprocess.return_value.returncode = 1
+        adaptor = UnrealAdaptor({**init_data, "ddc_path": str(tmp_path), "ddc_fill": True})
+        fingerprint = get_fill_fingerprint(init_data["project_path"], "UnrealEditor-Cmd")
+
+        # WHEN
+        with pytest.raises(RuntimeError):
+            adaptor.on_start()
+
+        # THEN
+        assert not os.path.exists(
+            get_fill_marker_path(str(tmp_path), init_data["project_path"], fingerprint)
+        )
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    def test_fill_disabled(self, mock_logging_subprocess: Mock, init_data: dict, tmp_path: Path):
+        """Tests that the DDC fill environment neither fills nor launches Unreal when disabled"""
+        adaptor = UnrealAdaptor({**init_data, "ddc_path": str(tmp_path), "ddc_fill": False})
+
+        adaptor.on_start()
+        adaptor.on_run({"handler": "ddc_fill"})
+        adaptor.on_cleanup()
+
+        mock_logging_subprocess.assert_not_called()
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    def test_launch_with_ddc(self, mock_logging_subprocess: Mock, init_data: dict, tmp_path: Path):
+        """Tests that Unreal uses the node-local DDC and the DDC is evicted after the session"""
+        # GIVEN
+        ddc_file = tmp_path / "Shaders" / "1.udd"
+        ddc_file.parent.mkdir()
+        ddc_file.write_bytes(b"0" * 2 * 1024 * 1024)
+        adaptor = UnrealAdaptor({**init_data, "ddc_path": str(tmp_path), "ddc_max_size_mb": 1})
+
+        # WHEN
+        adaptor._start_unreal_client()
+        launch_ddc_path = os.environ["UE-LocalDataCachePath"]
+        mock_logging_subprocess.return_value.is_running = False
+        adaptor.on_cleanup()
+
+        # THEN
+        assert launch_ddc_path == str(tmp_path)
+        assert not ddc_file.exists()
+
+
+class TestUnrealAdaptor_initialization_actions:
+    def test_warm_on_start(self, init_data: dict) -> None:
+        """Tests that the asset registry warm up is an initialization action of Unreal"""
+        # GIVEN
+        adaptor = UnrealAdaptor({**init_data, "asset_registry_paths": ["/Game/Maps/Level.Level"]})
+
+        # WHEN
+        adaptor._populate_action_queue()
+
+        # THEN
+        action = adaptor._action_queue.dequeue_action()
+        assert action is not None
+        assert action.name == "warm_asset_registry"
+        assert action.args == {"paths": ["/Game/Maps/Level.Level"]}
+
+    def test_preload_on_start(self, init_data: dict) -> None:
+        """Tests that loading the map and the level sequence is an initialization action"""
+        # GIVEN
+        adaptor = UnrealAdaptor(
+            {**init_data, "level_path": "/Game/Maps/Level.Level", "level_sequence_path": ""}
+        )
+
+        # WHEN
+        adaptor._populate_action_queue()
+
+        # THEN
+        action = adaptor._action_queue.dequeue_action()
+        assert action is not None
+        assert action.name == "preload"
+        assert action.args == {"level_path": "/Game/Maps/Level.Level"}
+        assert adaptor._action_queue.dequeue_action() is None
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    def test_cache_kept_across_sessions(
+        self, mock_logging_subprocess: Mock, init_data: dict, tmp_path: Path
+    ) -> None:
+        """Tests that the asset registry cache of a session is restored by the next session"""
+        # GIVEN
+        project_directory = tmp_path / "Project"
+        (project_directory / "Intermediate").mkdir(parents=True)
+        cache_path = project_directory / "Intermediate" / "CachedAssetRegistry_0.bin"
+        cache_path.write_bytes(b"registry")
+        session_init_data = {
+            **init_data,
+            "project_path": str(project_directory / "Project.uproject"),
+            "asset_registry_cache_path": str(tmp_path / "cache"),
+        }
+        mock_logging_subprocess.return_value.is_running = False
+
+        # WHEN
+        adaptor = UnrealAdaptor(session_init_data)
+        adaptor._restore_asset_registry_cache()
+        adaptor.on_cleanup()
+        cache_path.unlink()
+        UnrealAdaptor(session_init_data)._restore_asset_registry_cache()
+
+        # THEN
+        assert cache_path.read_bytes() == b"registry"
+
+
+@patch.dict(os.environ)
+class TestUnrealAdaptor_client_bundle:
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.get_client_bundle")
+    def test_bundle_comes_first(
+        self, mock_get_client_bundle: Mock, init_data: dict, tmp_path: Path
+    ) -> None:
+        """Tests that the bundle is the last PYTHONPATH entry, the first one of the UnrealClient"""
+        # GIVEN
+        bundle_path = tmp_path / "unreal_client.zip"
+        bundle_path.touch()
+        mock_get_client_bundle.return_value = str(bundle_path)
+        os.environ.pop("PYTHONPATH", None)
+        adaptor = UnrealAdaptor(init_data)
+
+        # WHEN
+        adaptor._add_client_to_pythonpath()
+        adaptor._add_client_to_pythonpath()
+
+        # THEN
+        python_path = os.environ["PYTHONPATH"].split(os.pathsep)
+        assert python_path[-1] == str(bundle_path)
+        assert python_path.count(str(bundle_path)) == 1
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.get_client_bundle",
+        side_effect=PermissionError("Permission denied"),
+    )
+    def test_sources_if_bundle_fails(
+        self, mock_get_client_bundle: Mock, init_data: dict, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Tests that the UnrealClient imports the sources if the bundle can't be built"""
+        # GIVEN
+        os.environ.pop("PYTHONPATH", None)
+        adaptor = UnrealAdaptor(init_data)
+
+        # WHEN
+        adaptor._add_client_to_pythonpath()
+
+        # THEN
+        assert not [p for p in os.environ["PYTHONPATH"].split(os.pathsep) if p.endswith(".zip")]
+        assert "Failed to build the UnrealClient bundle" in caplog.text
+
+
+class TestUnrealAdaptor_launch_profile:
+    LAUNCH_PROFILE = {
+        "args": ["-NoSound"],
+        "ini_overrides": [
+            {
+                "file": "Engine",
+                "section": "/Script/Engine.RendererSettings",
+                "key": "r.Streaming.PoolSize",
+                "value": 4000,
+            }
+        ],
+        "exec_cmds": ["r.ShaderPipelineCache.Enabled 1"],
+        "environment": {"UE_TEST_LAUNCH_PROFILE": "1"},
+        "cpu_affinity": [0, 1],
+        "priority": "below_normal",
+    }
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.set_process_priority")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.set_process_affinity")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    def test_launch_with_profile(
+        self,
+        mock_logging_subprocess: Mock,
+        mock_set_affinity: Mock,
+        mock_set_priority: Mock,
+        init_data: dict,
+    ) -> None:
+        """Tests that Unreal is launched with the arguments, environment and scheduling"""
+        # GIVEN
+        mock_logging_subprocess.return_value.pid = 123
+        adaptor = UnrealAdaptor({**init_data, "launch_profile": self.LAUNCH_PROFILE})
+
+        # WHEN
+        adaptor._start_unreal_client()
+
+        # THEN
+        args = mock_logging_subprocess.call_args.kwargs["args"]
+        assert "-NoSound" in args
+        assert "-ini:Engine:[/Script/Engine.RendererSettings]:r.Streaming.PoolSize=4000" in args
+        assert args[-1].startswith("-execcmds=r.HLOD 0,r.ShaderPipelineCache.Enabled 1,py ")
+        assert os.environ["UE_TEST_LAUNCH_PROFILE"] == "1"
+        mock_set_affinity.assert_called_once_with(123, [0, 1])
+        mock_set_priority.assert_called_once_with(123, "below_normal")
+
+    @pytest.mark.parametrize(
+        "launch_profile",
+        [
+            {"args": ["NoSound"]},
+            {"ini_overrides": [{"file": "Engine", "key": "r.Streaming.PoolSize", "value": 1}]},
+            {"exec_cmds": ["r.HLOD 0,r.Streaming.PoolSize 1"]},
+            {"cpu_affinity": []},
+            {"priority": "realtime"},
+            {"unknown": True},
+        ],
+    )
+    def test_invalid_profile(self, init_data: dict, launch_profile: dict) -> None:
+        adaptor = UnrealAdaptor({**init_data, "launch_profile": launch_profile})
+
+        with pytest.raises(jsonschema.exceptions.ValidationError):
+            adaptor.on_start()
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc"), reason="Reads /proc")
+@patch.dict(os.environ)
+class TestUnrealAdaptor_process_tree:
+    def launch_fake_unreal(self, adaptor: UnrealAdaptor) -> list[int]:
+        """Launches the fake Unreal, returns the IDs of its helper and worker processes"""
+        adaptor._launch_unreal_process([sys.executable, "-c", FAKE_UNREAL_SCRIPT])
+        assert adaptor._unreal_client is not None
+        for _ in range(100):
+            descendant_pids = get_child_pids(adaptor._unreal_client.pid)
+            if len(descendant_pids) == 2:
+                return descendant_pids
+            time.sleep(0.05)
+        raise TimeoutError("The fake Unreal did not start its helper processes")
+
+    def test_cancel_kills_process_tree(self, init_data: dict) -> None:
+        """Tests that the processes Unreal started are killed with it on cancel"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        descendant_pids = self.launch_fake_unreal(adaptor)
+
+        # WHEN
+        adaptor.on_cancel()
+
+        # THEN
+        assert not adaptor._unreal_is_running
+        assert wait_for_exit(descendant_pids)
+
+    def test_crash_kills_process_tree(self, init_data: dict) -> None:
+        """Tests that the processes a crashed Unreal left are killed"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        descendant_pids = self.launch_fake_unreal(adaptor)
+        assert adaptor._unreal_client is not None
+
+        # WHEN
+        os.kill(adaptor._unreal_client.pid, signal.SIGKILL)
+        adaptor._unreal_client.wait_for_exit(timeout=10)
+
+        # THEN
+        assert wait_for_exit(descendant_pids)
+
+    def test_cleanup_kills_process_tree(self, init_data: dict) -> None:
+        """Tests that the processes Unreal started are killed when it's terminated on cleanup"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._UNREAL_END_TIMEOUT_SECONDS = 0
+        descendant_pids = self.launch_fake_unreal(adaptor)
+
+        # WHEN
+        adaptor.on_cleanup()
+
+        # THEN
+        assert not adaptor._unreal_is_running
+        assert wait_for_exit(descendant_pids)
+
+
+@patch.dict(os.environ)
+class TestUnrealAdaptor_game_render_mode:
+    @patch.object(UnrealAdaptor, "_is_rendering", False)
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    def test_run_launches_game(
+        self, mock_logging_subprocess: Mock, init_data: dict, run_data: dict
+    ) -> None:
+        """Tests that every run launches Unreal with -game and the run data file"""
+        # GIVEN
+        adaptor = UnrealAdaptor({**init_data, "render_mode": "game"})
+        launches: list[tuple[list[str], dict]] = []
+        os.environ["UE_PYTHONPATH"] = os.path.join("studio", "python")
+
+        def launch_game(**kwargs) -> Mock:
+            run_data_path = next(
+                arg.split("=", 1)[1]
+                for arg in kwargs["args"]
+                if arg.startswith("-DeadlineRunData=")
+            )
+            with open(run_data_path, encoding="utf-8") as f:
+                launches.append((kwargs["args"], json.load(f)))
+            # Unreal renders the run data and exits
+            adaptor._unreal_is_rendering = False
+            return Mock(is_running=False, returncode=0)
+
+        mock_logging_subprocess.side_effect = launch_game
+
+        # WHEN
+        adaptor.on_start()
+        adaptor.on_run(run_data)
+        adaptor.on_run(run_data)
+
+        # THEN
+        assert len(launches) == 2
+        args, launch_run_data = launches[0]
+        assert args[:2] == ["UnrealEditor-Cmd", init_data["project_path"]]
+        assert "-game" in args
+        assert (
+            "-ExecutorPythonClass=/Engine/PythonTypes.RemoteRenderMoviePipelineGameExecutor" in args
+        )
+        assert launch_run_data == run_data
+        ue_python_paths = os.environ["UE_PYTHONPATH"].split(os.pathsep)
+        assert len(ue_python_paths) == 2
+        assert ue_python_paths[0].endswith("startup")
+        assert ue_python_paths[1] == os.path.join("studio", "python")
+        assert not os.path.exists(args[-1].split("=", 1)[1])
+
+    @patch.object(UnrealAdaptor, "_is_rendering", False)
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    def test_run_raises_if_game_exits_before_complete(
+        self, mock_logging_subprocess: Mock, init_data: dict, run_data: dict
+    ) -> None:
+        # GIVEN
+        mock_logging_subprocess.return_value = Mock(is_running=False, returncode=3)
+        adaptor = UnrealAdaptor({**init_data, "render_mode": "game"})
+        adaptor.on_start()
+
+        # WHEN
+        with pytest.raises(RuntimeError) as raised_err:
+            adaptor.on_run(run_data)
+
+        # THEN
+        assert "Exit code 3" in str(raised_err.value)
+
+    @patch.object(UnrealAdaptor, "_UNREAL_END_TIMEOUT_SECONDS", 0.1)
+    @patch.object(UnrealAdaptor, "_is_rendering", False)
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    def test_game_terminated_if_not_exiting(
+        self, mock_logging_subprocess: Mock, init_data: dict, run_data: dict
+    ) -> None:
+        """Tests that the run ends once rendered and Unreal not exiting on its own is terminated"""
+        # GIVEN
+        game_unreal = Mock(is_running=True, returncode=None)
+        mock_logging_subprocess.return_value = game_unreal
+        adaptor = UnrealAdaptor({**init_data, "render_mode": "game"})
+        adaptor.on_start()
+
+        def render() -> None:
+            while not mock_logging_subprocess.called:
+                time.sleep(0.001)
+            adaptor._handle_unreal_event("complete", {})
+
+        # WHEN
+        threading.Thread(target=render, daemon=True).start()
+        adaptor.on_run(run_data)
+
+        # THEN
+        game_unreal.terminate.assert_called_once_with(grace_time_s=0)
+
+    @patch.object(UnrealAdaptor, "_is_rendering", False)
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    def test_game_terminated_on_error(
+        self, mock_logging_subprocess: Mock, init_data: dict, run_data: dict
+    ) -> None:
+        """Tests that Unreal is terminated when it reported an error, before the next run"""
+        # GIVEN
+        game_unreal = Mock(is_running=True, returncode=None)
+        mock_logging_subprocess.return_value = game_unreal
+        adaptor = UnrealAdaptor({**init_data, "render_mode": "game"})
+        adaptor.on_start()
+
+        def fail() -> None:
+            while not mock_logging_subprocess.called:
+                time.sleep(0.001)
+            adaptor._exc_info = RuntimeError("Render failed")
+            adaptor._notify_unreal_state_changed()
+
+        # WHEN
+        threading.Thread(target=fail, daemon=True).start()
+        with pytest.raises(RuntimeError, match="Render failed"):
+            adaptor.on_run(run_data)
+
+        # THEN
+        game_unreal.terminate.assert_called_once_with(grace_time_s=0)
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    def test_run_raises_if_not_render(
+        self, mock_logging_subprocess: Mock, init_data: dict, run_data: dict
+    ) -> None:
+        # GIVEN
+        adaptor = UnrealAdaptor({**init_data, "render_mode": "game"})
+        adaptor.on_start()
+
+        # WHEN
+        with pytest.raises(RuntimeError):
+            adaptor.on_run({**run_data, "handler": "custom"})
+
+        # THEN
+        mock_logging_subprocess.assert_not_called()
+
+
+class TestUnrealSubprocessWithLogs:
+    def test_on_exit_called(self) -> None:
+        """Tests that the on_exit callback is called once the process exits"""
+        # GIVEN
+        exited = threading.Event()
+
+        # WHEN
+        process = UnrealSubprocessWithLogs(
+            args=[sys.executable, "-c", "print('Unreal')"], on_exit=exited.set
+        )
+
+        # THEN
+        assert exited.wait(timeout=10)
+        process.wait()
+        assert process.returncode == 0
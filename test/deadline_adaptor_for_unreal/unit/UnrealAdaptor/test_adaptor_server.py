@@ -0,0 +1,101 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import json
+import threading
+from http import HTTPStatus
+from typing import Iterator
+from unittest.mock import Mock
+
+import pytest
+from openjd.adaptor_runtime.application_ipc import ActionsQueue
+from openjd.adaptor_runtime_client import ClientInterface
+
+from deadline.unreal_adaptor.UnrealAdaptor.adaptor_server import (
+    UnrealAdaptorServer,
+    parse_event_params,
+)
+from deadline.unreal_adaptor.UnrealClient.step_events import EVENT_REQUEST_PATH
+
+
+class TestParseEventParams:
+    @pytest.mark.parametrize(
+        "params, expected_event",
+        [
+            ({"event": ['{"name": "complete"}']}, ("complete", {})),
+            (
+                {"event": ['{"name": "frame_done", "args": {"frame": 2, "total": 10}}']},
+                ("frame_done", {"frame": 2, "total": 10}),
+            ),
+            (
+                {"event": '{"name": "progress", "args": {"progress": 5}}'},
+                ("progress", {"progress": 5}),
+            ),
+        ],
+    )
+    def test_parse_event_params(self, params: dict, expected_event: tuple) -> None:
+        assert parse_event_params(params) == expected_event
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {},
+            {"event": []},
+            {"event": ["not json"]},
+            {"event": ['{"args": {}}']},
+            {"event": ["[]"]},
+        ],
+    )
+    def test_invalid_params(self, params: dict) -> None:
+        with pytest.raises(ValueError):
+            parse_event_params(params)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="Serves the events on a UNIX socket")
+class TestUnrealAdaptorServer:
+    class EventClient(ClientInterface):
+        def close(self, args: dict | None = None) -> None:
+            pass
+
+        def graceful_shutdown(self, *args, **kwargs) -> None:
+            pass
+
+        def send(self, query_string_params: dict | None):
+            return self._send_request(
+                "GET", EVENT_REQUEST_PATH, query_string_params=query_string_params
+            )
+
+    @pytest.fixture()
+    def on_event(self) -> Mock:
+        return Mock()
+
+    @pytest.fixture()
+    def client(self, on_event: Mock) -> Iterator[EventClient]:
+        server = UnrealAdaptorServer(ActionsQueue(), Mock(), on_event=on_event)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield self.EventClient(server.server_path)
+        server.shutdown()
+        thread.join(timeout=5)
+
+    def test_event_request(self, client: EventClient, on_event: Mock) -> None:
+        """Tests that the events sent by the client reach the event callback"""
+        # WHEN
+        response = client.send(
+            {"event": json.dumps({"name": "frame_done", "args": {"frame": 1, "total": 5}})}
+        )
+
+        # THEN
+        assert response.status == HTTPStatus.OK
+        on_event.assert_called_once_with("frame_done", {"frame": 1, "total": 5})
+
+    def test_invalid_event_request(self, client: EventClient, on_event: Mock) -> None:
+        """Tests that the invalid events are rejected"""
+        # WHEN
+        response = client.send({"event": "not json"})
+
+        # THEN
+        assert response.status == HTTPStatus.BAD_REQUEST
+        on_event.assert_not_called()
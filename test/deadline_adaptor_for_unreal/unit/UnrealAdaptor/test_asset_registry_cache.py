@@ -0,0 +1,88 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor.asset_registry_cache import (
+    MAX_CACHE_ENTRY_AGE_SECONDS,
+    get_cache_directory,
+    restore_cache,
+    save_cache,
+)
+
+
+@pytest.fixture()
+def project_path(tmp_path: Path) -> str:
+    project_directory = tmp_path / "session" / "Project"
+    (project_directory / "Content" / "Maps").mkdir(parents=True)
+    (project_directory / "Content" / "Maps" / "Level.umap").write_bytes(b"0" * 10)
+    (project_directory / "Project.uproject").write_text("{}")
+    return str(project_directory / "Project.uproject")
+
+
+class TestAssetRegistryCache:
+    def test_cache_directory_keyed_by_project(self, project_path: str, tmp_path: Path) -> None:
+        """
+        Tests that the cache directory changes with the .uproject file of the project,
+        not with its content, nor with the session directory of the project
+        """
+        # GIVEN
+        cache_root = str(tmp_path / "cache")
+        cache_directory = get_cache_directory(cache_root, project_path)
+        other_session_project = tmp_path / "other_session" / "Project" / "Project.uproject"
+        other_session_project.parent.mkdir(parents=True)
+        other_session_project.write_text("{}")
+
+        # WHEN
+        Path(project_path).parent.joinpath("Content", "New.uasset").write_bytes(b"0")
+        content_cache_directory = get_cache_directory(cache_root, project_path)
+        Path(project_path).write_text('{"Plugins": []}')
+
+        # THEN
+        assert os.path.basename(cache_directory).startswith("Project-")
+        assert content_cache_directory == cache_directory
+        assert get_cache_directory(cache_root, str(other_session_project)) == cache_directory
+        assert get_cache_directory(cache_root, project_path) != cache_directory
+
+    def test_save_and_restore(self, project_path: str, tmp_path: Path) -> None:
+        """Tests that the cache saved by a session is restored by the next one"""
+        # GIVEN
+        intermediate_directory = Path(project_path).parent / "Intermediate"
+        intermediate_directory.mkdir()
+        (intermediate_directory / "CachedAssetRegistry_0.bin").write_bytes(b"registry")
+        (intermediate_directory / "Other.bin").write_bytes(b"other")
+        cache_directory = get_cache_directory(str(tmp_path / "cache"), project_path)
+
+        # WHEN
+        assert restore_cache(cache_directory, project_path) == []
+        saved_paths = save_cache(cache_directory, project_path)
+        for path in intermediate_directory.iterdir():
+            path.unlink()
+        restored_paths = restore_cache(cache_directory, project_path)
+
+        # THEN
+        assert [os.path.basename(path) for path in saved_paths] == ["CachedAssetRegistry_0.bin"]
+        assert restored_paths == [str(intermediate_directory / "CachedAssetRegistry_0.bin")]
+        assert Path(restored_paths[0]).read_bytes() == b"registry"
+
+    def test_save_prunes_unused_entries(self, project_path: str, tmp_path: Path) -> None:
+        # GIVEN
+        intermediate_directory = Path(project_path).parent / "Intermediate"
+        intermediate_directory.mkdir()
+        (intermediate_directory / "CachedAssetRegistry_0.bin").write_bytes(b"registry")
+        old_entry = tmp_path / "cache" / "Project-0123456789abcdef"
+        old_entry.mkdir(parents=True)
+        old_time = time.time() - MAX_CACHE_ENTRY_AGE_SECONDS - 1
+        os.utime(old_entry, (old_time, old_time))
+
+        # WHEN
+        save_cache(get_cache_directory(str(tmp_path / "cache"), project_path), project_path)
+
+        # THEN
+        assert not old_entry.exists()
+        assert len(list((tmp_path / "cache").iterdir())) == 1
@@ -0,0 +1,155 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import sys
+import zipfile
+import subprocess
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import Mock, patch
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor import client_bundle
+from deadline.unreal_adaptor.UnrealAdaptor.client_bundle import (
+    find_unreal_python,
+    get_bundle_key,
+    get_client_bundle,
+    get_client_sources,
+)
+
+UNREAL_EXECUTABLE = "UnrealEditor-Cmd.exe" if sys.platform == "win32" else "UnrealEditor-Cmd"
+PYTHON_EXECUTABLE = "python.exe" if sys.platform == "win32" else os.path.join("bin", "python3")
+
+
+@pytest.fixture()
+def unreal_python(tmp_path: Path) -> Iterator[str]:
+    """
+    Installs a fake engine on the PATH, its Python is the current interpreter.
+    Returns the path to the Python of the engine.
+    """
+    binaries_path = tmp_path / "Engine" / "Binaries"
+    (binaries_path / "Linux").mkdir(parents=True)
+    (binaries_path / "Linux" / UNREAL_EXECUTABLE).touch(mode=0o755)
+    python_path = binaries_path / "ThirdParty" / "Python3" / "Linux" / PYTHON_EXECUTABLE
+    python_path.parent.mkdir(parents=True)
+    python_path.symlink_to(sys.executable)
+    with patch.dict(os.environ, {"PATH": str(binaries_path / "Linux")}):
+        yield str(python_path)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Symlinks the interpreter")
+class TestClientBundle:
+    def test_find_unreal_python(self, unreal_python: str) -> None:
+        assert find_unreal_python("UnrealEditor-Cmd") == unreal_python
+        assert find_unreal_python("UnrealEditor-Missing") is None
+
+    def test_bundle_content(self, unreal_python: str, tmp_path: Path) -> None:
+        """Tests that the bundle holds the sources and the bytecode of the client packages"""
+        # WHEN
+        bundle_path = get_client_bundle("UnrealEditor-Cmd", str(tmp_path / "bundles"))
+
+        # THEN
+        names = zipfile.ZipFile(bundle_path).namelist()
+        for name in [
+            "openjd/",
+            "openjd/adaptor_runtime_client/__init__.py",
+            "openjd/adaptor_runtime_client/__init__.pyc",
+            "deadline/",
+            "deadline/unreal_adaptor/__init__.py",
+            "deadline/unreal_adaptor/UnrealClient/step_events.py",
+            "deadline/unreal_adaptor/UnrealClient/step_events.pyc",
+            "deadline/unreal_adaptor/UnrealClient/step_handlers/unreal_render_step_handler.pyc",
+        ]:
+            assert name in names
+        assert not [name for name in names if "__pycache__" in name]
+
+    def test_source_only_bundle(self, tmp_path: Path) -> None:
+        """Tests that the bundle holds no bytecode if the Python of Unreal is not found"""
+        # GIVEN
+        with patch.dict(os.environ, {"PATH": str(tmp_path)}):
+            # WHEN
+            bundle_path = get_client_bundle("UnrealEditor-Cmd", str(tmp_path / "bundles"))
+
+        # THEN
+        names = zipfile.ZipFile(bundle_path).namelist()
+        assert "deadline/unreal_adaptor/UnrealClient/step_events.py" in names
+        assert not [name for name in names if name.endswith(".pyc")]
+
+    def test_import_from_bundle(self, unreal_python: str, tmp_path: Path) -> None:
+        """Tests that the Python of Unreal imports the client modules from the bundle bytecode"""
+        # GIVEN
+        bundle_path = get_client_bundle("UnrealEditor-Cmd", str(tmp_path / "bundles"))
+        script = (
+            "import sys; "
+            f"sys.path.insert(0, {bundle_path!r}); "
+            "from deadline.unreal_adaptor.UnrealClient import step_events; "
+            "import openjd.adaptor_runtime_client as client; "
+            "print(step_events.__file__); print(client.__file__); "
+            "print(step_events.send_event.__code__.co_filename)"
+        )
+
+        # WHEN
+        output = subprocess.run(
+            [unreal_python, "-S", "-c", script], check=True, capture_output=True, text=True
+        ).stdout.splitlines()
+
+        # THEN
+        # The modules are loaded from the bytecode, which refers to the sources of the bundle
+        assert output == [
+            os.path.join(bundle_path, "deadline/unreal_adaptor/UnrealClient/step_events.pyc"),
+            os.path.join(bundle_path, "openjd/adaptor_runtime_client/__init__.pyc"),
+            os.path.join(bundle_path, "deadline/unreal_adaptor/UnrealClient/step_events.py"),
+        ]
+
+    def test_cached(self, unreal_python: str, tmp_path: Path) -> None:
+        """Tests that the bundle is built once for the sources and the Python of Unreal"""
+        # GIVEN
+        cache_directory = str(tmp_path / "bundles")
+        bundle_path = get_client_bundle("UnrealEditor-Cmd", cache_directory)
+
+        # WHEN
+        with patch.object(
+            client_bundle, "build_bundle", Mock(wraps=client_bundle.build_bundle)
+        ) as mock_build_bundle:
+            cached_bundle_path = get_client_bundle("UnrealEditor-Cmd", cache_directory)
+
+        # THEN
+        assert cached_bundle_path == bundle_path
+        mock_build_bundle.assert_not_called()
+        assert os.listdir(cache_directory) == [os.path.basename(bundle_path)]
+
+    def test_key_follows_sources(self, unreal_python: str, tmp_path: Path) -> None:
+        """Tests that a changed source or another Python of Unreal changes the bundle key"""
+        # GIVEN
+        source_path = tmp_path / "step_events.py"
+        source_path.write_text("EVENT = 1\n")
+        sources = [(str(source_path), "deadline/unreal_adaptor/UnrealClient/step_events.py")]
+        key = get_bundle_key(sources, unreal_python)
+
+        # WHEN
+        source_path.write_text("EVENT = 2\n")
+
+        # THEN
+        assert get_bundle_key(sources, unreal_python) != key
+        assert get_bundle_key(sources, None) != get_bundle_key(sources, unreal_python)
+        assert len(get_client_sources()) > 1
+
+    def test_private_directory(self, tmp_path: Path) -> None:
+        """Tests that the bundle directory is private and a shared one is rejected"""
+        # GIVEN
+        shared_directory = tmp_path / "shared"
+        shared_directory.mkdir()
+        shared_directory.chmod(0o777)
+
+        # WHEN
+        with patch.dict(os.environ, {"PATH": str(tmp_path)}):
+            bundle_path = get_client_bundle("UnrealEditor-Cmd", str(tmp_path / "bundles"))
+            with pytest.raises(PermissionError):
+                get_client_bundle("UnrealEditor-Cmd", str(shared_directory))
+
+        # THEN
+        assert os.stat(os.path.dirname(bundle_path)).st_mode & 0o777 == 0o700
+        assert not os.listdir(shared_directory)
@@ -0,0 +1,109 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+from deadline.unreal_adaptor.UnrealAdaptor.derived_data_cache import (
+    LOCK_FILE_NAME,
+    DerivedDataCacheLock,
+    evict_least_recently_written,
+    get_fill_fingerprint,
+    get_fill_marker_path,
+    write_fill_marker,
+)
+
+
+def write_ddc_file(path: Path, size: int, last_write: float, last_access: float = 0) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"0" * size)
+    os.utime(path, (last_access or last_write, last_write))
+
+
+class TestEvictLeastRecentlyWritten:
+    def test_evicts_oldest_files(self, tmp_path: Path) -> None:
+        """Tests that the least recently written files are deleted until the DDC is under the size"""
+        # GIVEN
+        for i, name in enumerate(["a/1.udd", "b/2.udd", "a/3.udd", "c/4.udd"]):
+            # The access times are not reliable, they don't change the eviction order
+            write_ddc_file(tmp_path / name, 100, 1000 + i, last_access=2000 - i)
+
+        # WHEN
+        evicted = evict_least_recently_written(str(tmp_path), 250)
+
+        # THEN
+        assert evicted == (2, 200)
+        assert sorted(p.name for p in tmp_path.rglob("*.udd")) == ["3.udd", "4.udd"]
+
+    def test_keeps_lock_and_markers(self, tmp_path: Path) -> None:
+        """Tests that the lock and the fill markers are neither counted nor deleted"""
+        # GIVEN
+        with DerivedDataCacheLock(str(tmp_path)):
+            write_fill_marker(str(tmp_path), "/projects/Project.uproject", "fingerprint")
+            write_ddc_file(tmp_path / "a/1.udd", 100, 1000)
+
+            # WHEN
+            evicted = evict_least_recently_written(str(tmp_path), 100)
+
+        # THEN
+        assert evicted == (0, 0)
+        assert (tmp_path / LOCK_FILE_NAME).exists()
+        assert os.path.exists(
+            get_fill_marker_path(str(tmp_path), "/projects/Project.uproject", "fingerprint")
+        )
+
+
+class TestDerivedDataCacheLock:
+    def test_lock_is_exclusive(self, tmp_path: Path) -> None:
+        # GIVEN
+        first_lock = DerivedDataCacheLock(str(tmp_path))
+        second_lock = DerivedDataCacheLock(str(tmp_path))
+
+        # WHEN
+        assert first_lock.acquire()
+        locked = second_lock.acquire(blocking=False)
+        first_lock.release()
+        unlocked = second_lock.acquire(blocking=False)
+        second_lock.release()
+
+        # THEN
+        assert not locked
+        assert unlocked
+
+    def test_marker_per_project(self, tmp_path: Path) -> None:
+        assert get_fill_marker_path(str(tmp_path), "/a/A.uproject", "f") != get_fill_marker_path(
+            str(tmp_path), "/b/B.uproject", "f"
+        )
+
+
+class TestFillFingerprint:
+    def test_content_and_engine(self, tmp_path: Path) -> None:
+        """Tests that the fingerprint changes with the project content and the engine"""
+        # GIVEN
+        project_path = tmp_path / "Project" / "Project.uproject"
+        (project_path.parent / "Content").mkdir(parents=True)
+        (project_path.parent / "Content" / "Map.umap").write_bytes(b"0" * 10)
+        engine_path = (
+            tmp_path
+            / "Engine"
+            / ("UnrealEditor-Cmd.exe" if sys.platform == "win32" else "UnrealEditor-Cmd")
+        )
+        engine_path.parent.mkdir()
+        engine_path.write_bytes(b"engine")
+        engine_path.chmod(0o755)
+
+        # WHEN
+        with patch.dict(os.environ, {"PATH": str(engine_path.parent)}):
+            fingerprint = get_fill_fingerprint(str(project_path), "UnrealEditor-Cmd")
+            (project_path.parent / "Content" / "Map.umap").write_bytes(b"0" * 20)
+            content_fingerprint = get_fill_fingerprint(str(project_path), "UnrealEditor-Cmd")
+            engine_path.write_bytes(b"updated engine")
+            engine_fingerprint = get_fill_fingerprint(str(project_path), "UnrealEditor-Cmd")
+            same_fingerprint = get_fill_fingerprint(str(project_path), "UnrealEditor-Cmd")
+
+        # THEN
+        assert len({fingerprint, content_fingerprint, engine_fingerprint}) == 3
+        assert same_fingerprint == engine_fingerprint
@@ -0,0 +1,224 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import threading
+from typing import Callable
+from unittest.mock import Mock, patch
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor import UnrealAdaptor
+from deadline.unreal_adaptor.UnrealAdaptor.adaptor import UnrealInstanceAdaptor
+from deadline.unreal_adaptor.UnrealAdaptor.instance_pool import (
+    UnrealInstancePool,
+    run_weight,
+    split_run_data,
+)
+
+
+class FakeInstance:
+    """Instance adaptor reporting the progress of its run halfway and at the end"""
+
+    def __init__(self, on_progress: Callable[[float], None], barrier: threading.Barrier | None):
+        self.on_progress = on_progress
+        self.barrier = barrier
+        self.runs: list[dict] = []
+        self.on_start = Mock()
+        self.on_cleanup = Mock()
+        self.on_cancel = Mock()
+
+    def on_run(self, run_data: dict) -> None:
+        self.runs.append(run_data)
+        self.on_progress(50)
+        if self.barrier is not None:
+            # All the sub-runs must be rendering at the same time
+            self.barrier.wait(timeout=5)
+        if run_data.get("frames") == "error":
+            raise RuntimeError("Unreal Encountered an Error")
+        self.on_progress(100)
+
+
+def create_pool(count: int, barrier: threading.Barrier | None = None):
+    update_status = Mock()
+    instances: list[FakeInstance] = []
+
+    def create_instance(on_progress: Callable[[float], None]) -> FakeInstance:
+        instances.append(FakeInstance(on_progress, barrier))
+        return instances[-1]
+
+    pool = UnrealInstancePool(create_instance, count, update_status)  # type: ignore[arg-type]
+    return pool, instances, update_status
+
+
+class TestSplitRunData:
+    @pytest.mark.parametrize(
+        "frames, count, expected_frames",
+        [
+            ("0-99", 4, ["0-24", "25-49", "50-74", "75-99"]),
+            ("0-9", 3, ["0-3", "4-6", "7-9"]),
+            ("10-11", 4, ["10-10", "11-11"]),
+            ("5", 4, ["5-5"]),
+            ("0-99", 1, ["0-99"]),
+        ],
+    )
+    def test_split_frames(self, frames: str, count: int, expected_frames: list[str]) -> None:
+        run_data = {"handler": "render", "frames": frames, "warm_up_frames": 8}
+
+        sub_runs = split_run_data(run_data, count)
+
+        assert [sub_run.get("frames") for sub_run in sub_runs] == expected_frames
+        assert all(sub_run["warm_up_frames"] == 8 for sub_run in sub_runs)
+
+    @pytest.mark.parametrize(
+        "run_data",
+        [
+            {"handler": "render"},
+            {"handler": "render", "frames": ""},
+            {"handler": "custom", "script_path": "/path/to/script.py"},
+        ],
+    )
+    def test_not_split(self, run_data: dict) -> None:
+        assert split_run_data(run_data, 4) == [run_data]
+        assert run_weight(run_data) == 1
+
+    def test_run_weight(self) -> None:
+        assert run_weight({"handler": "render", "frames": "0-24"}) == 25
+
+
+class TestUnrealInstancePool:
+    def test_run_dispatched_to_all_instances(self) -> None:
+        """Tests that the sub-ranges of a run are rendered concurrently by all the instances"""
+        # GIVEN
+        pool, instances, update_status = create_pool(4, threading.Barrier(4))
+
+        # WHEN
+        pool.run({"handler": "render", "frames": "0-99"})
+
+        # THEN
+        assert sorted(run["frames"] for instance in instances for run in instance.runs) == [
+            "0-24",
+            "25-49",
+            "50-74",
+            "75-99",
+        ]
+        progress = [call.kwargs["progress"] for call in update_status.call_args_list]
+        assert max(progress) == 100
+        assert progress[-1] == 100
+
+    def test_aggregated_progress(self) -> None:
+        """Tests that the progress of the sub-runs is weighted by their frames count"""
+        # GIVEN
+        pool, instances, update_status = create_pool(2)
+        pool._run_weights = [30, 10]
+        pool._run_progress = [0.0, 0.0]
+        pool._instance_runs = {0: 0, 1: 1}
+
+        # WHEN
+        instances[0].on_progress(50)
+        instances[1].on_progress(100)
+
+        # THEN
+        assert [call.kwargs for call in update_status.call_args_list] == [
+            {"progress": 37.5, "status_message": "37% on 2 Unreal instances"},
+            {"progress": 62.5, "status_message": "62% on 2 Unreal instances"},
+        ]
+
+    def test_progress_ignored_between_runs(self) -> None:
+        """Tests that the progress of an instance that doesn't render is not reported"""
+        pool, instances, update_status = create_pool(2)
+
+        instances[0].on_progress(0)
+
+        update_status.assert_not_called()
+
+    def test_runs_wait_for_free_instance(self) -> None:
+        """Tests that the run that can't be split goes to a free instance"""
+        # GIVEN
+        pool, instances, _ = create_pool(3)
+
+        # WHEN
+        for _ in range(3):
+            pool.run({"handler": "custom", "script_path": "/path/to/script.py"})
+
+        # THEN
+        assert sum(len(instance.runs) for instance in instances) == 3
+        assert pool._free_instances.qsize() == 3
+
+    def test_run_error(self) -> None:
+        """Tests that the error of an instance fails the run and frees the instance"""
+        # GIVEN
+        pool, instances, _ = create_pool(2)
+
+        # WHEN
+        with pytest.raises(RuntimeError):
+            pool.run({"handler": "custom", "frames": "error"})
+
+        # THEN
+        assert pool._free_instances.qsize() == 2
+
+    def test_start_cleanup_cancel(self) -> None:
+        # GIVEN
+        pool, instances, _ = create_pool(3)
+        instances[1].on_start.side_effect = TimeoutError("Unreal did not start")
+
+        # WHEN
+        with pytest.raises(TimeoutError):
+            pool.start()
+        pool.cancel()
+        pool.cleanup()
+
+        # THEN
+        for instance in instances:
+            instance.on_start.assert_called_once()
+            instance.on_cancel.assert_called_once()
+            instance.on_cleanup.assert_called_once()
+
+
+class TestUnrealAdaptor_instance_pool:
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealInstanceAdaptor")
+    def test_pool_of_instances(self, mock_instance_adaptor: Mock) -> None:
+        """Tests that the adaptor delegates to its instances with the instance count > 1"""
+        # GIVEN
+        init_data = {
+            "project_path": "C:/LocalProjects/AWS_RND/AWS_RND.uproject",
+            "instance_count": 3,
+        }
+        adaptor = UnrealAdaptor(init_data)
+
+        # WHEN
+        adaptor.on_start()
+        adaptor.on_run({"handler": "render", "frames": "0-2"})
+        adaptor.on_cancel()
+        adaptor.on_cleanup()
+
+        # THEN
+        assert mock_instance_adaptor.call_count == 3
+        assert mock_instance_adaptor.call_args.args[0]["instance_count"] == 1
+        instance = mock_instance_adaptor.return_value
+        assert instance.on_start.call_count == 3
+        assert sorted(call.args[0]["frames"] for call in instance.on_run.call_args_list) == [
+            "0-0",
+            "1-1",
+            "2-2",
+        ]
+        assert instance.on_cancel.call_count == 3
+        assert instance.on_cleanup.call_count == 3
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_instance_reports_only_progress(self, mock_update_status: Mock) -> None:
+        """Tests that the instance status messages don't interleave with the pool's one"""
+        # GIVEN
+        on_progress = Mock()
+        instance = UnrealInstanceAdaptor(
+            {"project_path": "C:/LocalProjects/AWS_RND/AWS_RND.uproject"},
+            on_progress=on_progress,
+        )
+
+        # WHEN
+        instance.update_status(progress=50, status_message="Rendering 50%")
+        instance.update_status(status_message="Rendering")
+
+        # THEN
+        on_progress.assert_called_once_with(50)
+        mock_update_status.assert_not_called()
@@ -0,0 +1,56 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+from deadline.unreal_adaptor.UnrealAdaptor.launch_profile import (
+    apply_environment,
+    get_exec_cmds,
+    get_launch_args,
+)
+
+
+class TestLaunchProfile:
+    def test_get_launch_args(self) -> None:
+        """Tests that the extra arguments are followed by the ini overrides"""
+        # GIVEN
+        launch_profile = {
+            "args": ["-NoSound", "-DDC=NoShared"],
+            "ini_overrides": [
+                {
+                    "file": "Engine",
+                    "section": "/Script/Engine.RendererSettings",
+                    "key": "r.Streaming.PoolSize",
+                    "value": 4000,
+                },
+                {
+                    "file": "Engine",
+                    "section": "Core.System",
+                    "key": "UseSeekFreeLoading",
+                    "value": True,
+                },
+            ],
+        }
+
+        # WHEN
+        args = get_launch_args(launch_profile)
+
+        # THEN
+        assert args == [
+            "-NoSound",
+            "-DDC=NoShared",
+            "-ini:Engine:[/Script/Engine.RendererSettings]:r.Streaming.PoolSize=4000",
+            "-ini:Engine:[Core.System]:UseSeekFreeLoading=True",
+        ]
+
+    def test_empty_launch_profile(self) -> None:
+        assert get_launch_args({}) == []
+        assert get_exec_cmds({}) == []
+
+    @patch.dict(os.environ, {"NODE_SCRATCH": "/scratch"})
+    def test_apply_environment(self) -> None:
+        apply_environment({"environment": {"UE_SHADER_DIR": "$NODE_SCRATCH/shaders"}})
+
+        assert os.environ["UE_SHADER_DIR"] == "/scratch/shaders"
@@ -0,0 +1,308 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import re
+import logging
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from openjd.adaptor_runtime.app_handlers import RegexCallback, RegexHandler
+
+from deadline.unreal_adaptor.UnrealAdaptor import UnrealAdaptor
+from deadline.unreal_adaptor.UnrealAdaptor.log_matcher import (
+    UnrealLogDispatcher,
+    UnrealLogMatcher,
+    literal_prefix,
+    split_alternation,
+)
+
+
+def log_record(line: str) -> logging.LogRecord:
+    return logging.LogRecord("stdout", logging.INFO, __file__, 0, line, None, None)
+
+
+class TestSplitAlternation:
+    @pytest.mark.parametrize(
+        "pattern, expected_branches",
+        [
+            ("Exception:.*", ["Exception:.*"]),
+            (
+                "Exception:.*|Render Executor: Error:.*|LogPython: Error:.*",
+                ["Exception:.*", "Render Executor: Error:.*", "LogPython: Error:.*"],
+            ),
+            ("Progress: (a|b)|Complete", ["Progress: (a|b)", "Complete"]),
+            ("Set [|]|Escaped \\||End", ["Set [|]", "Escaped \\|", "End"]),
+        ],
+    )
+    def test_split_alternation(self, pattern: str, expected_branches: list[str]) -> None:
+        assert split_alternation(pattern) == expected_branches
+
+
+class TestLiteralPrefix:
+    @pytest.mark.parametrize(
+        "pattern, expected_literal",
+        [
+            ("Render Executor: Progress: ([0-9.]+)", "Render Executor: Progress: "),
+            ("Render Executor: Rendering is complete", "Render Executor: Rendering is complete"),
+            (" finished ([0-9]+) jobs in .*", " finished "),
+            ("Exception:.*", "Exception:"),
+            ("Frames?: done", "Frame"),
+            ("Path \\(C:\\\\\\) done", "Path (C:\\) done"),
+            ("\\d+ frames", ""),
+            (".*Exception", ""),
+        ],
+    )
+    def test_literal_prefix(self, pattern: str, expected_literal: str) -> None:
+        assert literal_prefix(pattern) == expected_literal
+
+
+class TestUnrealLogMatcher:
+    LINES = [
+        "[2024.05.20-10.15.32:021][  0]LogInit: Display: Running engine for game: AWS_RND",
+        "[2024.05.20-10.15.33:021][ 12]LogPython: Render Executor: Progress: 12.5",
+        "[2024.05.20-10.15.34:021][ 13]LogPython: Error: Traceback (most recent call last):",
+        "[2024.05.20-10.15.35:021][ 14]LogPython: Render Executor: Error: Render failed",
+        "LogMovieRenderPipeline: MoviePipelinePIEExecutor: finished 1 jobs in 00:04:12.331",
+        "LogPython: Render Executor: Rendering is complete",
+        "LogPython: Custom Step Executor: Progress: 50.0",
+        "LogPython: Custom Step Executor: Complete: True",
+        "LogPython: ValueError Exception: bad value",
+        "Render Executor: Progress: not a number, Render Executor: Progress: 42.0",
+    ]
+
+    @staticmethod
+    def adaptor_callbacks(callback: Mock) -> list[RegexCallback]:
+        adaptor = UnrealAdaptor({"project_path": "C:/AWS_RND.uproject"})
+        return [
+            RegexCallback(regex_callback.regex_list, callback)
+            for regex_callback in adaptor._get_regex_callbacks()
+        ]
+
+    @pytest.mark.parametrize("line", LINES)
+    def test_same_callbacks_as_regex_handler(self, line: str) -> None:
+        """Tests that the matcher calls the callbacks RegexHandler calls, with the same groups"""
+        # GIVEN
+        expected_callback = Mock()
+        callback = Mock()
+        regex_handler = RegexHandler(self.adaptor_callbacks(expected_callback))
+        matcher = UnrealLogMatcher(self.adaptor_callbacks(callback))
+
+        # WHEN
+        regex_handler.emit(log_record(line))
+        matcher.emit(log_record(line))
+
+        # THEN
+        assert [call.args[0].groups() for call in callback.call_args_list] == [
+            call.args[0].groups() for call in expected_callback.call_args_list
+        ]
+        assert [call.args[0].string for call in callback.call_args_list] == [
+            call.args[0].string for call in expected_callback.call_args_list
+        ]
+
+    def test_prefilter_skips_unrelated_lines(self) -> None:
+        """Tests that the anchored patterns are not matched against the lines without literals"""
+        # GIVEN
+        matcher = UnrealLogMatcher(
+            [RegexCallback([re.compile("Render Executor: Progress: ([0-9.]+)")], Mock())]
+        )
+
+        # WHEN
+        with patch.object(matcher, "_match_rules") as mock_match_rules:
+            matches = matcher.match("LogShaderCompilers: Display: shaders left to compile 3120")
+
+        # THEN
+        assert matches == [None]
+        mock_match_rules.assert_not_called()
+
+    def test_exit_if_matched(self) -> None:
+        """Tests that the callbacks after a matched exit_if_matched callback are not called"""
+        # GIVEN
+        first, second = Mock(), Mock()
+        matcher = UnrealLogMatcher(
+            [
+                RegexCallback([re.compile("Error: (.*)")], first, exit_if_matched=True),
+                RegexCallback([re.compile("Error: .*")], second),
+            ]
+        )
+
+        # WHEN
+        matcher.emit(log_record("LogPython: Error: failed"))
+
+        # THEN
+        first.assert_called_once()
+        assert first.call_args.args[0].group(1) == "failed"
+        second.assert_not_called()
+
+    def test_only_run_if_first_matched(self) -> None:
+        """Tests that only_run_if_first_matched callbacks are skipped after an earlier match"""
+        # GIVEN
+        first, second = Mock(), Mock()
+        matcher = UnrealLogMatcher(
+            [
+                RegexCallback([re.compile("Progress: ([0-9.]+)")], first),
+                RegexCallback([re.compile("Progress: .*")], second, only_run_if_first_matched=True),
+            ]
+        )
+
+        # WHEN
+        matcher.emit(log_record("Progress: 10"))
+
+        # THEN
+        first.assert_called_once()
+        second.assert_not_called()
+
+    def test_pattern_without_literal(self) -> None:
+        """Tests that the patterns without literal prefix are searched in every line"""
+        # GIVEN
+        callback = Mock()
+        matcher = UnrealLogMatcher([RegexCallback([re.compile("[0-9]+ jobs")], callback)])
+
+        # WHEN
+        matcher.emit(log_record("finished 3 jobs"))
+
+        # THEN
+        callback.assert_called_once()
+        assert callback.call_args.args[0].group(0) == "3 jobs"
+
+
+class TestUnrealLogDispatcher:
+    @staticmethod
+    def blocking_callback(release: threading.Event, calls: list) -> Mock:
+        """Returns a callback that blocks the dispatcher thread until the release event is set"""
+
+        def callback(match: re.Match) -> None:
+            calls.append(match.string)
+            release.wait(5)
+
+        return Mock(side_effect=callback)
+
+    def test_callbacks_called_on_dispatcher_thread(self) -> None:
+        """Tests that the callbacks are called in the lines order, out of the emitting thread"""
+        # GIVEN
+        threads: list[str] = []
+        lines: list[str] = []
+
+        def callback(match: re.Match) -> None:
+            threads.append(threading.current_thread().name)
+            lines.append(match.string)
+
+        dispatcher = UnrealLogDispatcher(
+            [
+                RegexCallback([re.compile("Progress: ([0-9.]+)")], callback),
+                RegexCallback([re.compile("Error: .*")], callback),
+            ]
+        )
+
+        # WHEN
+        for line in ["Progress: 10", "LogInit: Display: noise", "Error: failed", "Progress: 20"]:
+            dispatcher.emit(log_record(line))
+        dispatcher.flush()
+
+        # THEN
+        assert lines == ["Progress: 10", "Error: failed", "Progress: 20"]
+        assert set(threads) == {"UnrealLogDispatcherThread"}
+        dispatcher.close()
+
+    def test_coalesces_progress(self) -> None:
+        """Tests that only the latest of the progress lines waiting for the dispatch is kept"""
+        # GIVEN
+        release = threading.Event()
+        calls: list[str] = []
+        progress = Mock(side_effect=lambda match: calls.append(match.string))
+        dispatcher = UnrealLogDispatcher(
+            [
+                RegexCallback([re.compile("Progress: ([0-9.]+)")], progress),
+                RegexCallback([re.compile("Error: .*")], self.blocking_callback(release, calls)),
+            ],
+            coalescible_callbacks=[progress],
+        )
+        dispatcher.emit(log_record("Error: blocks the dispatcher"))
+
+        # WHEN
+        for frame in range(1, 101):
+            dispatcher.emit(log_record(f"Progress: {frame}"))
+        release.set()
+        dispatcher.flush()
+
+        # THEN
+        assert calls == ["Error: blocks the dispatcher", "Progress: 100"]
+        assert dispatcher.coalesced_count == 99
+        dispatcher.close()
+
+    def test_drops_oldest_progress_when_full(self) -> None:
+        """Tests that a full buffer drops the oldest progress line instead of a critical line"""
+        # GIVEN
+        release = threading.Event()
+        calls: list[str] = []
+        progress = Mock(side_effect=lambda match: calls.append(match.string))
+        complete = Mock(side_effect=lambda match: calls.append(match.string))
+        dispatcher = UnrealLogDispatcher(
+            [
+                RegexCallback([re.compile("Progress: ([0-9.]+)")], progress),
+                RegexCallback([re.compile("Complete")], complete),
+                RegexCallback([re.compile("Error: .*")], self.blocking_callback(release, calls)),
+            ],
+            coalescible_callbacks=[progress],
+            capacity=2,
+        )
+        dispatcher.emit(log_record("Error: blocks the dispatcher"))
+        with dispatcher._pending_changed:
+            dispatcher._pending_changed.wait_for(lambda: not dispatcher._pending, timeout=5)
+
+        # WHEN
+        dispatcher.emit(log_record("Progress: 50"))
+        dispatcher.emit(log_record("Complete"))
+        dispatcher.emit(log_record("Progress: 100"))
+        release.set()
+        dispatcher.flush()
+
+        # THEN
+        assert calls == ["Error: blocks the dispatcher", "Complete", "Progress: 100"]
+        assert dispatcher.coalesced_count == 1
+        dispatcher.close()
+
+    def test_never_drops_critical_lines(self) -> None:
+        """Tests that the reader waits for room in the buffer instead of dropping critical lines"""
+        # GIVEN
+        release = threading.Event()
+        calls: list[str] = []
+        dispatcher = UnrealLogDispatcher(
+            [RegexCallback([re.compile("Error: .*")], self.blocking_callback(release, calls))],
+            capacity=2,
+        )
+
+        def read_errors() -> None:
+            for i in range(5):
+                dispatcher.emit(log_record(f"Error: {i}"))
+
+        reader = threading.Thread(target=read_errors)
+
+        # WHEN
+        reader.start()
+        reader.join(timeout=0.2)
+        reader_blocked = reader.is_alive()
+        release.set()
+        reader.join(timeout=5)
+        dispatcher.flush()
+
+        # THEN
+        assert reader_blocked
+        assert calls == [f"Error: {i}" for i in range(5)]
+        assert dispatcher.coalesced_count == 0
+        dispatcher.close()
+
+    def test_emit_after_close(self) -> None:
+        """Tests that the lines emitted after the closing are dispatched by the emitting thread"""
+        # GIVEN
+        callback = Mock()
+        dispatcher = UnrealLogDispatcher([RegexCallback([re.compile("Error: .*")], callback)])
+        dispatcher.close()
+
+        # WHEN
+        dispatcher.emit(log_record("Error: after close"))
+
+        # THEN
+        callback.assert_called_once()
+        assert callback.call_args.args[0].string == "Error: after close"
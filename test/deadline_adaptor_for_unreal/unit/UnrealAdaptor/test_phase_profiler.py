@@ -0,0 +1,76 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor.phase_profiler import PhaseProfiler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestPhaseProfiler:
+    def test_report(self) -> None:
+        """Tests that the report holds the ended phases ordered by their start"""
+        # GIVEN
+        clock = FakeClock()
+        profiler = PhaseProfiler(clock=clock)
+
+        # WHEN
+        clock.now += 1
+        profiler.start("editor_boot")
+        with profiler.phase("server_start"):
+            clock.now += 2
+        clock.now += 10
+        profiler.end("editor_boot")
+        clock.now += 5
+        profiler.record("map_load", 4)
+        profiler.start("render")
+        report = profiler.report("start")
+
+        # THEN
+        assert report == {
+            "scope": "start",
+            "total": 18,
+            "phases": [
+                {"name": "server_start", "start": 1, "duration": 2},
+                {"name": "editor_boot", "start": 1, "duration": 12},
+                {"name": "map_load", "start": 14, "duration": 4},
+            ],
+        }
+
+    def test_phase_reported_in_scope_it_ended(self) -> None:
+        # GIVEN
+        clock = FakeClock()
+        profiler = PhaseProfiler(clock=clock)
+        profiler.start("editor_boot")
+        clock.now += 3
+        profiler.report("start")
+
+        # WHEN
+        clock.now += 2
+        duration = profiler.end("editor_boot")
+        report = profiler.report("task")
+
+        # THEN
+        assert duration == 5
+        assert report["total"] == 2
+        assert report["phases"] == [{"name": "editor_boot", "start": -3, "duration": 5}]
+        assert profiler.report("cleanup")["phases"] == []
+
+    def test_phase_raises(self) -> None:
+        """Tests that the phase is measured when its block raises"""
+        profiler = PhaseProfiler(clock=FakeClock())
+
+        with pytest.raises(RuntimeError):
+            with profiler.phase("run"):
+                raise RuntimeError()
+
+        assert [phase["name"] for phase in profiler.report("task")["phases"]] == ["run"]
+        assert profiler.end("not_started") is None
@@ -0,0 +1,158 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import subprocess
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor import process_tree
+from deadline.unreal_adaptor.UnrealAdaptor.process_tree import (
+    ProcessGroup,
+    get_child_pids,
+    get_process_rss,
+    get_process_tree_rss,
+    set_process_affinity,
+    set_process_priority,
+)
+
+pytestmark = pytest.mark.skipif(not os.path.isdir("/proc"), reason="Reads /proc")
+
+# Process that starts a grandchild and waits
+PARENT_SCRIPT = (
+    "import subprocess, sys, time; "
+    "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+    "print('started', flush=True); time.sleep(30)"
+)
+
+# Fake Unreal: starts a helper that starts its own worker, prints their IDs and waits
+FAKE_UNREAL_SCRIPT = (
+    "import subprocess, sys, time; "
+    "helper = subprocess.Popen([sys.executable, '-c', "
+    "'import subprocess, sys, time; "
+    'worker = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"]); '
+    "print(worker.pid, flush=True); time.sleep(60)'], stdout=subprocess.PIPE, text=True); "
+    "print(helper.pid, helper.stdout.readline().strip(), flush=True); time.sleep(60)"
+)
+
+
+def start_fake_unreal(group: ProcessGroup) -> tuple[subprocess.Popen, list[int]]:
+    """Starts the fake Unreal in the group, returns its process and the IDs of its descendants"""
+    process = subprocess.Popen(
+        [sys.executable, "-c", FAKE_UNREAL_SCRIPT],
+        stdout=subprocess.PIPE,
+        text=True,
+        **group.get_popen_kwargs(),
+    )
+    group.attach(process.pid)
+    assert process.stdout is not None
+    return process, [int(pid) for pid in process.stdout.readline().split()]
+
+
+def is_alive(pid: int) -> bool:
+    """Tells if the process exists and is not a zombie"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except OSError:
+        return False
+
+
+def wait_for_exit(pids: list[int], timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while any(is_alive(pid) for pid in pids):
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+@pytest.fixture()
+def parent_process() -> Iterator[subprocess.Popen]:
+    with patch.object(process_tree, "psutil", None):
+        process = subprocess.Popen(
+            [sys.executable, "-c", PARENT_SCRIPT], stdout=subprocess.PIPE, text=True
+        )
+        assert process.stdout is not None
+        process.stdout.readline()
+        yield process
+        for child_pid in get_child_pids(process.pid):
+            os.kill(child_pid, 9)
+        process.kill()
+        process.wait()
+
+
+class TestProcessTree:
+    def test_get_child_pids(self, parent_process: subprocess.Popen) -> None:
+        with patch.object(process_tree, "psutil", None):
+            assert len(get_child_pids(parent_process.pid)) == 1
+            assert parent_process.pid in get_child_pids(os.getpid())
+
+    def test_get_process_tree_rss(self, parent_process: subprocess.Popen) -> None:
+        with patch.object(process_tree, "psutil", None):
+            parent_rss = get_process_rss(parent_process.pid)
+            tree_rss = get_process_tree_rss(parent_process.pid)
+
+        assert parent_rss is not None and parent_rss > 0
+        assert tree_rss is not None and tree_rss > parent_rss
+
+    def test_no_process(self) -> None:
+        with patch.object(process_tree, "psutil", None):
+            assert get_process_tree_rss(-1) is None
+            assert get_child_pids(-1) == []
+
+    def test_set_process_scheduling(self, parent_process: subprocess.Popen) -> None:
+        """Tests that the affinity and the priority apply to the threads of the process"""
+        cpu = sorted(os.sched_getaffinity(0))[0]
+
+        assert set_process_affinity(parent_process.pid, [cpu])
+        assert set_process_priority(parent_process.pid, "idle")
+
+        for tid in os.listdir(f"/proc/{parent_process.pid}/task"):
+            assert os.sched_getaffinity(int(tid)) == {cpu}
+            assert os.getpriority(os.PRIO_PROCESS, int(tid)) == 19
+
+    def test_set_process_scheduling_no_process(self) -> None:
+        assert not set_process_affinity(-1, [0])
+        assert not set_process_priority(-1, "idle")
+
+
+class TestProcessGroup:
+    def test_kill_left_processes(self) -> None:
+        """Tests that the processes left by the crashed root are killed, once reparented"""
+        # GIVEN
+        group = ProcessGroup()
+        process, descendant_pids = start_fake_unreal(group)
+
+        # WHEN
+        process.kill()
+        process.wait()
+        killed = group.kill()
+
+        # THEN
+        assert killed
+        assert wait_for_exit(descendant_pids)
+        assert not group.kill()
+
+    def test_kill_no_processes_left(self) -> None:
+        # GIVEN
+        group = ProcessGroup()
+        process = subprocess.Popen(
+            [sys.executable, "-c", "pass"], **group.get_popen_kwargs()  # type: ignore[call-overload]
+        )
+        group.attach(process.pid)
+        process.wait()
+
+        # WHEN
+        killed = group.kill()
+
+        # THEN
+        assert not killed
+
+    def test_kill_not_launched(self) -> None:
+        assert not ProcessGroup().kill()
@@ -0,0 +1,95 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor.progress_estimator import (
+    ProgressEstimator,
+    format_duration,
+)
+
+from .test_watchdog import FakeClock
+
+
+@pytest.mark.parametrize(
+    "seconds, expected",
+    [(0, "0s"), (59.6, "1m 00s"), (250, "4m 10s"), (3600, "1h 00m"), (3900, "1h 05m")],
+)
+def test_format_duration(seconds: float, expected: str) -> None:
+    assert format_duration(seconds) == expected
+
+
+class TestProgressEstimator:
+    def test_no_estimation_without_rate(self) -> None:
+        # GIVEN
+        estimator = ProgressEstimator(clock=FakeClock())
+
+        # WHEN
+        estimator.update(10, frames_done=10)
+
+        # THEN
+        assert estimator.frames_per_minute is None
+        assert estimator.eta_seconds is None
+        assert estimator.get_status_message() == "Rendering 10%"
+
+    def test_moving_average(self) -> None:
+        """Tests that the estimation follows the rate of the last window"""
+        # GIVEN
+        clock = FakeClock()
+        estimator = ProgressEstimator(window_seconds=60, clock=clock)
+
+        # WHEN
+        # 1 frame per second for 40 frames, then 1 frame every 2 seconds
+        for frame in range(1, 41):
+            clock.now += 1
+            estimator.update(frame / 2, frames_done=frame)
+        for frame in range(41, 81):
+            clock.now += 2
+            estimator.update(frame / 2, frames_done=frame)
+
+        # THEN
+        assert estimator.frames_per_minute == 30
+        assert estimator.eta_seconds == 240
+        assert estimator.get_status_message() == "Rendering 40%, 30.0 frames/min, ETA 4m 00s"
+
+    def test_frames_longer_than_window(self) -> None:
+        """Tests that the last two samples are kept when a frame takes longer than the window"""
+        # GIVEN
+        clock = FakeClock()
+        estimator = ProgressEstimator(window_seconds=60, clock=clock)
+
+        # WHEN
+        for frame in range(1, 4):
+            clock.now += 120
+            estimator.update(frame * 10)
+
+        # THEN
+        assert estimator.frames_per_minute is None
+        assert estimator.eta_seconds == 840
+
+    def test_reset(self) -> None:
+        # GIVEN
+        clock = FakeClock()
+        estimator = ProgressEstimator(clock=clock)
+        estimator.update(50, frames_done=50)
+        clock.now += 10
+        estimator.update(100, frames_done=100)
+
+        # WHEN
+        estimator.reset()
+
+        # THEN
+        assert estimator.eta_seconds is None
+        assert estimator.get_status_message() == "Rendering"
+
+    def test_activity(self) -> None:
+        # GIVEN
+        estimator = ProgressEstimator(clock=FakeClock())
+
+        # WHEN
+        estimator.reset("Running")
+        estimator.update(10)
+
+        # THEN
+        assert estimator.get_status_message() == "Running 10%"
@@ -0,0 +1,104 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor import watchdog
+from deadline.unreal_adaptor.UnrealAdaptor.watchdog import (
+    ProgressWatchdog,
+    get_process_cpu_seconds,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestGetProcessCpuSeconds:
+    @pytest.mark.skipif(not os.path.exists("/proc/self/stat"), reason="Reads /proc")
+    def test_proc_cpu_seconds(self) -> None:
+        with patch.object(watchdog, "psutil", None):
+            cpu_seconds = get_process_cpu_seconds(os.getpid())
+
+        assert cpu_seconds is not None
+        assert cpu_seconds >= 0
+
+    def test_no_process(self) -> None:
+        with patch.object(watchdog, "psutil", None):
+            assert get_process_cpu_seconds(-1) is None
+
+
+class TestProgressWatchdog:
+    def test_stall(self) -> None:
+        """Tests that the phase stalls once there is no progress for longer than the timeout"""
+        # GIVEN
+        clock = FakeClock()
+        progress_watchdog = ProgressWatchdog(get_pid=lambda: None, clock=clock)
+        progress_watchdog.start("render", stall_timeout=60)
+
+        # WHEN
+        clock.now += 50
+        progress_watchdog.progress()
+        clock.now += 50
+        not_stalled = progress_watchdog.check()
+        clock.now += 11
+        stalled = progress_watchdog.check()
+
+        # THEN
+        assert not not_stalled
+        assert stalled
+        assert progress_watchdog.stalled_seconds == 61
+
+    def test_progress_at(self) -> None:
+        """Tests that an older progress time doesn't move the last progress back"""
+        clock = FakeClock()
+        progress_watchdog = ProgressWatchdog(get_pid=lambda: None, clock=clock)
+        progress_watchdog.start("startup", stall_timeout=60)
+
+        clock.now += 30
+        progress_watchdog.progress(at=clock.now - 10)
+        progress_watchdog.progress(at=clock.now - 20)
+
+        assert progress_watchdog.stalled_seconds == 10
+
+    def test_disabled(self) -> None:
+        """Tests that the phase with the zero stall timeout never stalls"""
+        clock = FakeClock()
+        progress_watchdog = ProgressWatchdog(get_pid=lambda: None, clock=clock)
+        progress_watchdog.start("render", stall_timeout=0)
+
+        clock.now += 86400
+
+        assert not progress_watchdog.check()
+
+    def test_diagnostics(self) -> None:
+        """Tests that the diagnostics report the stall, the CPU usage and the last log lines"""
+        # GIVEN
+        clock = FakeClock()
+        cpu_seconds = iter([10.0, 10.5])
+        progress_watchdog = ProgressWatchdog(get_pid=lambda: 42, clock=clock)
+        progress_watchdog.start("startup", stall_timeout=60)
+
+        # WHEN
+        with patch.object(watchdog, "get_process_cpu_seconds", lambda pid: next(cpu_seconds)):
+            clock.now += 60
+            progress_watchdog.check()
+            clock.now += 1
+            progress_watchdog.check()
+        diagnostics = progress_watchdog.diagnostics(["LogShaderCompilers: Display: Waiting"])
+
+        # THEN
+        assert diagnostics.splitlines() == [
+            "Unreal made no startup progress for 61 seconds (stall timeout 60 seconds).",
+            "Unreal process CPU usage: 50.0% over the last check, 10.5 seconds in total.",
+            "Last 1 Unreal log lines:",
+            "LogShaderCompilers: Display: Waiting",
+        ]
@@ -0,0 +1,21 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from typing import Optional
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_game_render_executor import (
+    get_run_data_path,
+)
+
+
+@pytest.mark.parametrize(
+    "command_line, expected_path",
+    [
+        ("Project.uproject -game -DeadlineRunData=/tmp/run.json -log", "/tmp/run.json"),
+        ('Project.uproject -deadlinerundata="C:/Run Data/run.json" -log', "C:/Run Data/run.json"),
+        ("Project.uproject -game -log", None),
+    ],
+)
+def test_get_run_data_path(command_line: str, expected_path: Optional[str]) -> None:
+    assert get_run_data_path(command_line) == expected_path
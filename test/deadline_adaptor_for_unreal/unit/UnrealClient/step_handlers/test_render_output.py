@@ -0,0 +1,222 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import struct
+import time
+from pathlib import Path
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealClient.step_handlers.render_output import (
+    get_asset_name,
+    get_complete_frames,
+    get_missing_frame_range,
+    get_output_file_pattern,
+    is_complete_image,
+)
+
+DEFAULT_FORMAT = "{sequence_name}.{frame_number}"
+PASS_FORMAT = "{render_pass}/{sequence_name}.{render_pass}.{frame_number}"
+
+
+def exr_attribute(name: str, attribute_type: str, value: bytes) -> bytes:
+    return (
+        name.encode()
+        + b"\0"
+        + attribute_type.encode()
+        + b"\0"
+        + struct.pack("<i", len(value))
+        + value
+    )
+
+
+def make_exr(height: int = 4, tiled: bool = False) -> bytes:
+    """Returns an uncompressed EXR image of a single half channel, 2 pixels wide"""
+    header = (
+        exr_attribute("channels", "chlist", b"Y\0" + struct.pack("<iB3xii", 1, 0, 1, 1) + b"\0")
+        + exr_attribute("compression", "compression", b"\0")
+        + exr_attribute("dataWindow", "box2i", struct.pack("<4i", 0, 0, 1, height - 1))
+        + exr_attribute("displayWindow", "box2i", struct.pack("<4i", 0, 0, 1, height - 1))
+        + exr_attribute("lineOrder", "lineOrder", b"\0")
+    )
+    if tiled:
+        # One tile of 2x2 pixels per 2 lines
+        header += exr_attribute("tiles", "tiledesc", struct.pack("<IIB", 2, 2, 0))
+        chunk_count = -(-height // 2)
+    else:
+        chunk_count = height
+    header += b"\0"
+
+    version = struct.pack("<i", 2 | (0x200 if tiled else 0))
+    data = b"\x76\x2f\x31\x01" + version + header
+    chunks_offset = len(data) + 8 * chunk_count
+    chunks = b""
+    offsets = []
+    for index in range(chunk_count):
+        offsets.append(chunks_offset + len(chunks))
+        if tiled:
+            chunks += struct.pack("<5i", 0, index, 0, 0, 8) + b"\x00" * 8
+        else:
+            chunks += struct.pack("<ii", index, 4) + b"\x00" * 4
+    return data + struct.pack(f"<{chunk_count}Q", *offsets) + chunks
+
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100 + b"IEND\xae\x42\x60\x82"
+JPEG = b"\xff\xd8\xff" + b"\x00" * 100 + b"\xff\xd9"
+EXR = make_exr()
+TILED_EXR = make_exr(height=5, tiled=True)
+
+
+def write_frames(directory: Path, name: str, frames: range, data: bytes, extension: str) -> None:
+    for frame in frames:
+        (directory / f"{name}.{frame:04d}.{extension}").write_bytes(data)
+
+
+class TestIsCompleteImage:
+    @pytest.mark.parametrize(
+        "file_name, data, expected",
+        [
+            ("frame.png", PNG, True),
+            ("frame.jpg", JPEG, True),
+            ("frame.exr", EXR, True),
+            ("frame.exr", TILED_EXR, True),
+            ("frame.exr", EXR[:-3], False),  # last chunk truncated
+            ("frame.exr", TILED_EXR[:-20], False),  # last chunk missing
+            # Offset table of the 4 chunks of 12 bytes not written
+            ("frame.exr", EXR[:-80] + b"\x00" * 32 + EXR[-48:], False),
+            ("frame.exr", b"\x76\x2f\x31\x01" + b"\x00" * 100, False),  # header not written
+            ("frame.png", PNG[: len(PNG) // 2], False),  # truncated
+            ("frame.png", PNG[:20], False),  # too small
+            ("frame.png", JPEG, False),  # wrong header
+            ("frame.jpeg", JPEG[:-2], False),  # missing trailer
+            ("frame.txt", PNG, False),  # not an image
+        ],
+    )
+    def test_is_complete_image(
+        self, tmp_path: Path, file_name: str, data: bytes, expected: bool
+    ) -> None:
+        path = tmp_path / file_name
+        path.write_bytes(data)
+
+        assert is_complete_image(str(path)) is expected
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        assert not is_complete_image(str(tmp_path / "frame.png"))
+
+
+class TestGetCompleteFrames:
+    def test_complete_frames(self, tmp_path: Path) -> None:
+        """Tests that a frame is complete when all its render passes are complete"""
+        # GIVEN
+        write_frames(tmp_path, "Shot_010", range(0, 10), PNG, "png")
+        (tmp_path / "ObjectIds").mkdir()
+        write_frames(tmp_path / "ObjectIds", "Shot_010.ObjectIds", range(0, 10), EXR, "exr")
+        # Interrupted while writing frame 9
+        (tmp_path / "ObjectIds" / "Shot_010.ObjectIds.0009.exr").write_bytes(EXR[:-10])
+        (tmp_path / "Shot_010.log").write_text("log")
+
+        # WHEN
+        complete_frames = get_complete_frames(
+            str(tmp_path), get_output_file_pattern(PASS_FORMAT, {"sequence_name": "Shot_010"})
+        )
+
+        # THEN
+        assert complete_frames == set(range(0, 9))
+
+    def test_other_sequence_frames(self, tmp_path: Path) -> None:
+        """Tests that the frames of another sequence in the output directory are not counted"""
+        # GIVEN
+        write_frames(tmp_path, "Shot_010", range(0, 5), PNG, "png")
+        write_frames(tmp_path, "Shot_020", range(0, 10), PNG, "png")
+        write_frames(tmp_path, "Shot_0100", range(0, 10), PNG, "png")
+
+        # WHEN
+        complete_frames = get_complete_frames(
+            str(tmp_path), get_output_file_pattern(DEFAULT_FORMAT, {"sequence_name": "Shot_010"})
+        )
+
+        # THEN
+        assert complete_frames == set(range(0, 5))
+
+    def test_written_since(self, tmp_path: Path) -> None:
+        """Tests that the frames written before the given time are not counted"""
+        # GIVEN
+        write_frames(tmp_path, "Shot_010", range(0, 10), PNG, "png")
+        now = time.time()
+        for frame in range(0, 4):
+            os.utime(tmp_path / f"Shot_010.{frame:04d}.png", (now - 60, now - 60))
+
+        # WHEN
+        complete_frames = get_complete_frames(
+            str(tmp_path),
+            get_output_file_pattern(DEFAULT_FORMAT, {"sequence_name": "Shot_010"}),
+            written_since=now - 30,
+        )
+
+        # THEN
+        assert complete_frames == set(range(4, 10))
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        pattern = get_output_file_pattern(DEFAULT_FORMAT, {"sequence_name": "Shot_010"})
+        assert get_complete_frames(str(tmp_path / "missing"), pattern) == set()
+
+
+class TestGetOutputFilePattern:
+    @pytest.mark.parametrize(
+        "file_name_format, path, expected_frame",
+        [
+            (DEFAULT_FORMAT, "Shot_010.0042", 42),
+            (DEFAULT_FORMAT, "Shot_010.-0003", -3),
+            (DEFAULT_FORMAT, "Shot_010.FinalImage.0042", None),
+            (DEFAULT_FORMAT, "Shot_020.0042", None),
+            (DEFAULT_FORMAT, "Shot_0100.0042", None),
+            (DEFAULT_FORMAT, "sub/Shot_010.0042", None),
+            ("{sequence_name}", "Shot_010.0042", 42),
+            ("{level_name}/{sequence_name}_{frame_number}", "Main/Shot_010_0042", 42),
+            ("{level_name}\\{sequence_name}_{frame_number}", "Main/Shot_010_0042", 42),
+            ("{level_name}/{sequence_name}_{frame_number}", "Other/Shot_010_0042", None),
+            ("{sequence_name}.{frame_number}", "Shot_010.0042.Camera01", 42),
+            (PASS_FORMAT, "ObjectIds/Shot_010.ObjectIds.0042", 42),
+            ("{date}_{sequence_name}.{frame_number}", "2024.01.02_Shot_010.0042", 42),
+        ],
+    )
+    def test_output_file_pattern(
+        self, file_name_format: str, path: str, expected_frame: int | None
+    ) -> None:
+        pattern = get_output_file_pattern(
+            file_name_format, {"sequence_name": "Shot_010", "level_name": "Main"}
+        )
+
+        match = pattern.fullmatch(path)
+
+        assert (int(match.group("frame")) if match else None) == expected_frame
+
+    @pytest.mark.parametrize(
+        "asset_path, expected",
+        [
+            ("/Game/Sequences/Shot_010.Shot_010", "Shot_010"),
+            ("'/Game/Maps/Main.Main'", "Main"),
+            ("/Game/Maps/Main", "Main"),
+            ("", ""),
+        ],
+    )
+    def test_get_asset_name(self, asset_path: str, expected: str) -> None:
+        assert get_asset_name(asset_path) == expected
+
+
+class TestGetMissingFrameRange:
+    @pytest.mark.parametrize(
+        "complete_frames, expected",
+        [
+            (set(), (0, 100)),
+            (set(range(0, 40)), (40, 100)),
+            (set(range(0, 40)) | {50} | set(range(90, 100)), (40, 90)),
+            (set(range(-10, 200)), None),
+        ],
+    )
+    def test_missing_frame_range(
+        self, complete_frames: set[int], expected: tuple[int, int] | None
+    ) -> None:
+        assert get_missing_frame_range(0, 100, complete_frames) == expected
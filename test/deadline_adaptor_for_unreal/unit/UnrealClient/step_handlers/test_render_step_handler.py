@@ -0,0 +1,273 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+import os
+from pathlib import Path
+from typing import Optional
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealClient.step_handlers import unreal_render_step_handler
+from deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_render_step_handler import (
+    UnrealRenderStepHandler,
+)
+
+
+def make_queue_job(
+    engine_warm_up_count: int = 0, sequence_name: str = "Shot_010"
+) -> tuple[Mock, Mock, Mock]:
+    """Returns MRQ job mock and its output and anti-aliasing settings mocks"""
+    output_setting = Mock(
+        use_custom_playback_range=False, file_name_format="{sequence_name}.{frame_number}"
+    )
+    anti_aliasing_setting = Mock(engine_warm_up_count=engine_warm_up_count)
+    settings = {"output": output_setting, "anti_aliasing": anti_aliasing_setting}
+
+    job = Mock()
+    job.sequence.export_text.return_value = f"/Game/Sequences/{sequence_name}.{sequence_name}"
+    job.map.export_text.return_value = "/Game/Maps/Main.Main"
+    job.get_configuration.return_value.find_or_add_setting_by_class.side_effect = settings.get
+    return job, output_setting, anti_aliasing_setting
+
+
+@pytest.fixture()
+def unreal_mock():
+    unreal = MagicMock()
+    unreal.MoviePipelineOutputSetting = "output"
+    unreal.MoviePipelineAntiAliasingSetting = "anti_aliasing"
+    with patch.object(unreal_render_step_handler, "unreal", unreal):
+        yield unreal
+
+
+class TestUnrealRenderStepHandler:
+    @pytest.mark.parametrize(
+        "frames, expected_range",
+        [
+            ("", None),
+            (" ", None),
+            ("0-99", (0, 100)),
+            ("100-119", (100, 120)),
+            ("7", (7, 8)),
+            ("-10--1", (-10, 0)),
+            ("-5-4", (-5, 5)),
+        ],
+    )
+    def test_parse_frames(self, frames: str, expected_range: Optional[tuple[int, int]]) -> None:
+        assert UnrealRenderStepHandler.parse_frames(frames) == expected_range
+
+    @pytest.mark.parametrize("frames", ["a-b", "1-", "1:10", "10-1"])
+    def test_parse_frames_invalid(self, frames: str) -> None:
+        with pytest.raises(ValueError):
+            UnrealRenderStepHandler.parse_frames(frames)
+
+    def test_apply_frame_range(self, unreal_mock: MagicMock) -> None:
+        """Tests that every queue job renders the task chunk after the warm up frames"""
+        # GIVEN
+        first_job, first_output, first_anti_aliasing = make_queue_job()
+        second_job, second_output, second_anti_aliasing = make_queue_job(engine_warm_up_count=32)
+        queue = Mock()
+        queue.get_jobs.return_value = [first_job, second_job]
+
+        # WHEN
+        UnrealRenderStepHandler.apply_frame_range(queue, "100-149", warm_up_frames=8)
+
+        # THEN
+        for output_setting in [first_output, second_output]:
+            assert output_setting.use_custom_playback_range is True
+            assert output_setting.custom_start_frame == 100
+            assert output_setting.custom_end_frame == 150
+        assert first_anti_aliasing.engine_warm_up_count == 8
+        assert second_anti_aliasing.engine_warm_up_count == 32
+
+    def test_apply_frame_range_whole_sequence(self, unreal_mock: MagicMock) -> None:
+        """Tests that the jobs keep their frame range when the task has no chunk"""
+        # GIVEN
+        job, output_setting, _ = make_queue_job()
+        queue = Mock()
+        queue.get_jobs.return_value = [job]
+
+        # WHEN
+        UnrealRenderStepHandler.apply_frame_range(queue, "", warm_up_frames=8)
+
+        # THEN
+        assert output_setting.use_custom_playback_range is False
+        job.get_configuration.assert_not_called()
+
+    def test_apply_frame_range_without_warm_up(self, unreal_mock: MagicMock) -> None:
+        """Tests that the anti-aliasing setting is not added to the jobs without warm up frames"""
+        # GIVEN
+        job, output_setting, _ = make_queue_job()
+        queue = Mock()
+        queue.get_jobs.return_value = [job]
+
+        # WHEN
+        UnrealRenderStepHandler.apply_frame_range(queue, "0-9")
+
+        # THEN
+        assert output_setting.custom_end_frame == 10
+        job.get_configuration.return_value.find_or_add_setting_by_class.assert_called_once_with(
+            "output"
+        )
+
+    @patch.object(unreal_render_step_handler, "get_complete_frames")
+    def test_apply_resume(self, mock_get_complete_frames: Mock, unreal_mock: MagicMock) -> None:
+        """Tests that the jobs render only the missing frames and the complete jobs are deleted"""
+        # GIVEN
+        resumed_job, resumed_output, _ = make_queue_job()
+        resumed_output.use_custom_playback_range = True
+        resumed_output.custom_start_frame = 100
+        resumed_output.custom_end_frame = 200
+        complete_job, complete_output, _ = make_queue_job()
+        complete_output.use_custom_playback_range = True
+        complete_output.custom_start_frame = 0
+        complete_output.custom_end_frame = 10
+        queue = Mock()
+        queue.get_jobs.return_value = [complete_job, resumed_job]
+        mock_get_complete_frames.side_effect = [set(range(0, 10)), set(range(100, 130))]
+
+        # WHEN
+        done_frames = UnrealRenderStepHandler.apply_resume(queue)
+
+        # THEN
+        assert done_frames == 30
+        queue.delete_job.assert_called_once_with(complete_job)
+        assert resumed_output.custom_start_frame == 130
+        assert resumed_output.custom_end_frame == 200
+        # The output files of the job are counted only
+        _, file_pattern, written_since = mock_get_complete_frames.call_args.args
+        assert file_pattern.fullmatch("Shot_010.0042")
+        assert not file_pattern.fullmatch("Shot_020.0042")
+        assert written_since is None
+
+    @patch.object(unreal_render_step_handler, "get_complete_frames")
+    def test_apply_resume_all_jobs(
+        self, mock_get_complete_frames: Mock, unreal_mock: MagicMock
+    ) -> None:
+        """Tests that the done frames of all the queue jobs are counted for the progress"""
+        # GIVEN
+        jobs = []
+        for _ in range(3):
+            job, output_setting, _ = make_queue_job()
+            output_setting.use_custom_playback_range = True
+            output_setting.custom_start_frame = 0
+            output_setting.custom_end_frame = 10
+            jobs.append(job)
+        queue = Mock()
+        queue.get_jobs.return_value = jobs
+        mock_get_complete_frames.side_effect = [set(range(0, 4)), set(), set(range(0, 2))]
+
+        # WHEN
+        done_frames = UnrealRenderStepHandler.apply_resume(queue)
+
+        # THEN
+        assert done_frames == 6
+        queue.delete_job.assert_not_called()
+
+    def test_apply_resume_shared_output_directory(
+        self, unreal_mock: MagicMock, tmp_path: Path
+    ) -> None:
+        """Tests that the jobs rendering to the same directory resume from their own frames"""
+        # GIVEN
+        png = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100 + b"IEND\xae\x42\x60\x82"
+        jobs = []
+        outputs = []
+        for sequence_name, rendered_frames in [("Shot_010", 10), ("Shot_020", 3)]:
+            job, output_setting, _ = make_queue_job(sequence_name=sequence_name)
+            job.job_name = sequence_name
+            output_setting.use_custom_playback_range = True
+            output_setting.custom_start_frame = 0
+            output_setting.custom_end_frame = 10
+            for frame in range(rendered_frames):
+                (tmp_path / f"{sequence_name}.{frame:04d}.png").write_bytes(png)
+            jobs.append(job)
+            outputs.append(output_setting)
+        # A job named after its shot, rendering the same sequence
+        named_job, named_output, _ = make_queue_job(sequence_name="Shot_010")
+        named_job.job_name = "Shot_010_Lighting"
+        named_output.file_name_format = "{job_name}.{frame_number}"
+        named_output.use_custom_playback_range = True
+        named_output.custom_start_frame = 0
+        named_output.custom_end_frame = 10
+        queue = Mock()
+        queue.get_jobs.return_value = [*jobs, named_job]
+        unreal_mock.MoviePipelineEditorLibrary.resolve_output_directory_from_job.return_value = str(
+            tmp_path
+        )
+
+        # WHEN
+        done_frames = UnrealRenderStepHandler.apply_resume(queue)
+
+        # THEN
+        assert done_frames == 3
+        queue.delete_job.assert_called_once_with(jobs[0])
+        assert (outputs[1].custom_start_frame, outputs[1].custom_end_frame) == (3, 10)
+        assert (named_output.custom_start_frame, named_output.custom_end_frame) == (0, 10)
+
+    @patch.object(unreal_render_step_handler.preload, "load_asset")
+    def test_get_job_frame_range_of_sequence(
+        self, mock_load_asset: Mock, unreal_mock: MagicMock
+    ) -> None:
+        """Tests that the job without custom range renders the playback range of its sequence"""
+        # GIVEN
+        job, _, _ = make_queue_job()
+        mock_load_asset.return_value.get_playback_start.return_value = 10
+        mock_load_asset.return_value.get_playback_end.return_value = 60
+
+        # WHEN
+        frame_range = UnrealRenderStepHandler.get_job_frame_range(job)
+        mock_load_asset.return_value = None
+        missing_frame_range = UnrealRenderStepHandler.get_job_frame_range(job)
+
+        # THEN
+        assert frame_range == (10, 60)
+        assert missing_frame_range is None
+
+    @pytest.mark.parametrize(
+        "jobs_progress, expected_frames_done",
+        [
+            ([0.0, 0.0], 0),
+            # 15 / 22 * 22 is slightly below 15
+            ([15 / 22, 0.0], 15),
+            ([0.999, 0.0], 21),
+            ([1.0, 0.5], 27),
+            ([1.0, 1.0], 32),
+            ([1.5, -0.5], 22),
+        ],
+    )
+    def test_get_output_frames_done(
+        self, jobs_progress: list[float], expected_frames_done: int
+    ) -> None:
+        """Tests that the output frames are counted from the status progress of the jobs"""
+        # GIVEN
+        jobs_frames = [
+            (Mock(**{"get_status_progress.return_value": progress}), frames_count)
+            for progress, frames_count in zip(jobs_progress, [22, 10])
+        ]
+
+        # WHEN
+        frames_done = UnrealRenderStepHandler.get_output_frames_done(jobs_frames)
+
+        # THEN
+        assert frames_done == expected_frames_done
+
+    @patch.object(unreal_render_step_handler, "_manifest_queue_cache", {})
+    def test_manifest_queue_cached(self, unreal_mock: MagicMock, tmp_path: Path) -> None:
+        """Tests that the manifest is parsed again only when it is modified"""
+        # GIVEN
+        manifest_path = tmp_path / "QueueManifest.utxt"
+        manifest_path.write_text("manifest")
+        load_manifest = unreal_mock.MoviePipelineLibrary.load_manifest_file_from_string
+        load_manifest.side_effect = lambda path: Mock(name=path)
+        subsystem = Mock()
+
+        # WHEN
+        for _ in range(3):
+            UnrealRenderStepHandler.create_queue_from_manifest(subsystem, str(manifest_path))
+        os.utime(manifest_path, (0, 0))
+        UnrealRenderStepHandler.create_queue_from_manifest(subsystem, str(manifest_path))
+
+        # THEN
+        assert load_manifest.call_count == 2
+        pipeline_queue = subsystem.get_queue.return_value
+        assert pipeline_queue.copy_from.call_count == 4
+        assert pipeline_queue.delete_all_jobs.call_count == 4
@@ -0,0 +1,79 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+import time
+from http import HTTPStatus
+from unittest.mock import Mock, patch
+
+from openjd.adaptor_runtime_client import Action
+
+from deadline.unreal_adaptor.UnrealClient.action_poller import ActionPoller
+
+
+def wait_for_actions(poller: ActionPoller, count: int, timeout: float = 5) -> list:
+    actions: list = []
+    deadline = time.monotonic() + timeout
+    while len(actions) < count and time.monotonic() < deadline:
+        actions.extend(poller.get_actions())
+        time.sleep(0.001)
+    return actions
+
+
+class TestActionPoller:
+    def test_actions_received_in_order(self) -> None:
+        """Tests that the actions are received in order and the polling stops after close"""
+        # GIVEN
+        request_next_action = Mock(
+            side_effect=[
+                (HTTPStatus.OK, "OK", Action("set_handler", {"handler": "render"})),
+                (HTTPStatus.OK, "OK", Action("run_script", {})),
+                (HTTPStatus.OK, "OK", Action("close")),
+            ]
+        )
+        poller = ActionPoller(request_next_action)
+
+        # WHEN
+        poller.start()
+        actions = wait_for_actions(poller, 3)
+
+        # THEN
+        assert [action.name for action in actions] == ["set_handler", "run_script", "close"]
+        assert poller._thread is not None
+        poller._thread.join(timeout=5)
+        assert not poller.is_polling
+        assert request_next_action.call_count == 3
+
+    @patch.object(ActionPoller, "_ERROR_RETRY_SECONDS", 0)
+    def test_retries_on_error(self) -> None:
+        """Tests that the polling goes on after an error response or a failed request"""
+        # GIVEN
+        request_next_action = Mock(
+            side_effect=[
+                (HTTPStatus.INTERNAL_SERVER_ERROR, "Internal Server Error", None),
+                ConnectionRefusedError("Server not ready"),
+                (HTTPStatus.OK, "OK", Action("close")),
+            ]
+        )
+        poller = ActionPoller(request_next_action)
+
+        # WHEN
+        poller.start()
+        actions = wait_for_actions(poller, 1)
+
+        # THEN
+        assert [action.name for action in actions] == ["close"]
+        assert request_next_action.call_count == 3
+
+    def test_get_actions_does_not_block(self) -> None:
+        """Tests that getting the actions returns immediately while the server request waits"""
+        # GIVEN
+        poller = ActionPoller(Mock(side_effect=lambda: time.sleep(10)))
+        poller.start()
+
+        # WHEN
+        start = time.monotonic()
+        actions = poller.get_actions()
+
+        # THEN
+        assert actions == []
+        assert time.monotonic() - start < 0.1
+        assert poller.is_polling
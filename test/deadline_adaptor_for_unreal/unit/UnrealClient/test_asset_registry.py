@@ -0,0 +1,66 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealClient import asset_registry
+from deadline.unreal_adaptor.UnrealClient.asset_registry import (
+    get_scan_paths,
+    wait_for_asset_registry,
+    warm_asset_registry,
+)
+
+
+@pytest.fixture()
+def unreal_mock():
+    unreal = MagicMock()
+    with (
+        patch.object(asset_registry, "unreal", unreal),
+        patch.object(asset_registry, "_is_warmed", False),
+    ):
+        yield unreal
+
+
+class TestAssetRegistry:
+    def test_get_scan_paths(self) -> None:
+        assert get_scan_paths(
+            [
+                "/Game/Maps/Level.Level",
+                "/Game/Maps/Other",
+                "/Game/Cinematics/",
+                "",
+                "None",
+            ]
+        ) == ["/Game/Maps", "/Game/Cinematics"]
+
+    def test_warm_once(self, unreal_mock: MagicMock) -> None:
+        """
+        Tests that the job paths are scanned before the full scan is waited for,
+        and that the runs don't wait again once the registry is warmed
+        """
+        # GIVEN
+        registry = unreal_mock.AssetRegistryHelpers.get_asset_registry.return_value
+
+        # WHEN
+        warm_asset_registry(["/Game/Maps/Level.Level"])
+        wait_for_asset_registry()
+        wait_for_asset_registry()
+
+        # THEN
+        assert registry.method_calls == [
+            call.scan_paths_synchronous(["/Game/Maps"], force_rescan=False),
+            call.wait_for_completion(),
+        ]
+
+    def test_not_warmed(self, unreal_mock: MagicMock) -> None:
+        """Tests that the first run waits for the full scan if the registry is not warmed"""
+        # GIVEN
+        registry = unreal_mock.AssetRegistryHelpers.get_asset_registry.return_value
+
+        # WHEN
+        wait_for_asset_registry()
+        wait_for_asset_registry()
+
+        # THEN
+        registry.wait_for_completion.assert_called_once()
@@ -6,6 +6,8 @@ import pytest
 from unittest import SkipTest
 from unittest.mock import Mock, patch
 
+from openjd.adaptor_runtime_client import Action
+
 try:
     from deadline.unreal_adaptor.UnrealClient.unreal_client import UnrealClient, main
 except ModuleNotFoundError:
@@ -30,6 +32,40 @@ class TestUnrealClient:
         client.set_handler(handler_dict=dict(handler="render"))
         client.close()
 
+    @pytest.mark.parametrize("event_delivered", [True, False])
+    @patch("deadline.unreal_adaptor.UnrealClient.unreal_client.WinClientInterface")
+    def test_fast_exit(self, mock_winclient: Mock, event_delivered: bool) -> None:
+        """Tests that the editor quits normally only if the adaptor can't be told to kill it"""
+        # GIVEN
+        client = UnrealClient(socket_path=str(999))
+        unreal = sys.modules["unreal"]
+        unreal.SystemLibrary.quit_editor.reset_mock()
+
+        # WHEN
+        with patch.object(client, "send_event", return_value=event_delivered) as mock_send_event:
+            client.fast_exit()
+
+        # THEN
+        mock_send_event.assert_called_once_with("exit_ready", {})
+        assert unreal.SystemLibrary.quit_editor.called != event_delivered
+
+    @patch("deadline.unreal_adaptor.UnrealClient.unreal_client.WinClientInterface")
+    def test_poll_performs_received_actions(self, mock_winclient: Mock) -> None:
+        """Tests that poll performs the actions received by the polling thread without waiting"""
+        # GIVEN
+        client = UnrealClient(socket_path=str(999))
+        client.action_poller = Mock()
+        client.action_poller.get_actions.return_value = [
+            Action("set_handler", {"handler": "custom"})
+        ]
+
+        # WHEN
+        client.poll()
+
+        # THEN
+        client.action_poller.start.assert_called_once()
+        assert type(client.handler).__name__ == "UnrealCustomStepHandler"
+
     @pytest.mark.skip(reason="mocks not set up properly")
     @patch("deadline.unreal_adaptor.UnrealClient.unreal_client.os.path.exists")
     @patch.dict(os.environ, {"UNREAL_ADAPTOR_SOCKET_PATH": "socket_path"})
@@ -0,0 +1,64 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealClient import preload
+
+
+@pytest.fixture()
+def unreal_mock():
+    unreal = MagicMock()
+    with patch.object(preload, "unreal", unreal), patch.object(preload, "_loaded_assets", {}):
+        yield unreal
+
+
+def set_editor_world(unreal_mock: MagicMock, world_path: str) -> None:
+    world = unreal_mock.get_editor_subsystem.return_value.get_editor_world.return_value
+    world.get_path_name.return_value = world_path
+
+
+class TestPreload:
+    def test_load_asset_once(self, unreal_mock: MagicMock) -> None:
+        """Tests that the asset is loaded once per session"""
+        # WHEN
+        first = preload.load_asset("/Game/Cinematics/Sequence.Sequence")
+        second = preload.load_asset("/Game/Cinematics/Sequence")
+
+        # THEN
+        unreal_mock.load_asset.assert_called_once_with("/Game/Cinematics/Sequence.Sequence")
+        assert first is second
+
+    def test_load_asset_not_cached_if_failed(self, unreal_mock: MagicMock) -> None:
+        unreal_mock.load_asset.return_value = None
+
+        assert preload.load_asset("/Game/Missing") is None
+        assert preload.load_asset("/Game/Missing") is None
+        assert unreal_mock.load_asset.call_count == 2
+
+    def test_preload(self, unreal_mock: MagicMock) -> None:
+        """Tests that the map and the level sequence of the job are loaded"""
+        # GIVEN
+        set_editor_world(unreal_mock, "/Engine/Maps/Templates/OpenWorld.OpenWorld")
+
+        # WHEN
+        preload.preload("/Game/Maps/Level.Level", "/Game/Cinematics/Sequence.Sequence")
+
+        # THEN
+        unreal_mock.get_editor_subsystem.return_value.load_level.assert_called_once_with(
+            "/Game/Maps/Level"
+        )
+        assert "/Game/Cinematics/Sequence" in preload._loaded_assets
+
+    def test_level_already_loaded(self, unreal_mock: MagicMock) -> None:
+        """Tests that the current editor world is reused"""
+        # GIVEN
+        set_editor_world(unreal_mock, "/Game/Maps/Level.Level")
+
+        # WHEN
+        loaded = preload.load_level("/Game/Maps/Level.Level")
+
+        # THEN
+        assert loaded
+        unreal_mock.get_editor_subsystem.return_value.load_level.assert_not_called()
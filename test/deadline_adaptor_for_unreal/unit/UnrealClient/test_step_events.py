@@ -0,0 +1,88 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from typing import Iterator
+from unittest.mock import Mock
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealClient import step_events
+
+from ..UnrealAdaptor.test_watchdog import FakeClock
+
+
+@pytest.fixture()
+def event_sender() -> Iterator[Mock]:
+    sender = Mock(return_value=True)
+    step_events.set_event_sender(sender)
+    yield sender
+    step_events.set_event_sender(None)
+
+
+class TestStepEvents:
+    def test_send_event(self, event_sender: Mock) -> None:
+        assert step_events.send_event(step_events.FRAME_DONE, frame=1, total=10)
+
+        event_sender.assert_called_once_with("frame_done", {"frame": 1, "total": 10})
+
+    def test_send_event_without_sender(self) -> None:
+        assert not step_events.send_event(step_events.COMPLETE)
+
+    def test_phase(self, event_sender: Mock) -> None:
+        """Tests that the phase duration is sent once, when the phase ends"""
+        # WHEN
+        with step_events.phase("map_load"):
+            pass
+        ended_again = step_events.end_phase("map_load")
+
+        # THEN
+        event_sender.assert_called_once()
+        name, args = event_sender.call_args.args
+        assert name == "phase"
+        assert args["phase"] == "map_load"
+        assert args["duration"] >= 0
+        assert not ended_again
+
+
+class TestProgressCoalescer:
+    def test_min_step(self) -> None:
+        """Tests that the values are reported when they changed by the minimum step, and 100"""
+        # GIVEN
+        coalescer = step_events.ProgressCoalescer(min_step=1, min_interval=60, clock=FakeClock())
+
+        # WHEN
+        reported = [p / 4 for p in range(0, 399) if coalescer.should_report(p / 4)]
+        reported_completion = coalescer.should_report(100)
+
+        # THEN
+        assert reported == list(range(0, 100))
+        assert reported_completion
+
+    def test_min_interval(self) -> None:
+        """Tests that the changed values are reported once the minimum interval elapsed"""
+        # GIVEN
+        clock = FakeClock()
+        coalescer = step_events.ProgressCoalescer(min_step=10, min_interval=5, clock=clock)
+        coalescer.should_report(1)
+
+        # WHEN
+        clock.now += 4
+        reported_early = coalescer.should_report(2)
+        clock.now += 1
+        reported_unchanged = coalescer.should_report(1)
+        reported_changed = coalescer.should_report(2)
+
+        # THEN
+        assert not reported_early
+        assert not reported_unchanged
+        assert reported_changed
+
+    def test_reset(self) -> None:
+        # GIVEN
+        coalescer = step_events.ProgressCoalescer(clock=FakeClock())
+        coalescer.should_report(100)
+
+        # WHEN
+        coalescer.reset()
+
+        # THEN
+        assert coalescer.should_report(0)